@@ -0,0 +1,18 @@
+# Generated by Django 3.1.2 on 2026-10-19 22:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('affiliations', '0002_auto_20210411_1733'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='affiliate',
+            name='logo_derivatives',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Affiliate Logo Derivatives'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.1.2 on 2026-10-19 22:15
+
+import apps.affiliations.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('affiliations', '0003_affiliate_logo_derivatives'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='affiliate',
+            name='logo',
+            field=models.ImageField(
+                blank=True, null=True, upload_to=apps.affiliations.models.logo_path, verbose_name='Affiliate Logo'
+            ),
+        ),
+    ]
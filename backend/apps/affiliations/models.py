@@ -1,6 +1,9 @@
 """This module contains Django models that relate to AI at NC State's affiliations with outside organizations."""
 from django.dispatch import receiver
-from django.db import models
+from django.db import models, transaction
+
+from core import images, media
+from core.tasks import generate_image_derivatives
 
 
 # Define the base file path, which will be appended to the MEDIA_ROOT directory, where affiliate logos should be saved.
@@ -38,6 +41,10 @@ class Affiliate(models.Model):
 
         logo: An ImageField representing the affiliate's logo in the database.
 
+        logo_derivatives: A JSONField containing the metadata of the resized WebP and JPEG versions of the affiliate's
+        logo, as well as the logo's dimensions, dominant color, and blurred placeholder, which are generated
+        asynchronously when a new logo is saved (see the core.images module).
+
         website: A URLField representing the affiliate's website URL in the database.
     """
 
@@ -54,10 +61,18 @@ class Affiliate(models.Model):
         null=True,
         blank=True,
         editable=True,
-        unique=True,
+        unique=False,
         verbose_name='Affiliate Logo',
         upload_to=logo_path
     )
+    logo_derivatives = models.JSONField(
+        default=dict,
+        null=False,
+        blank=True,
+        editable=False,
+        unique=False,
+        verbose_name='Affiliate Logo Derivatives'
+    )
     website = models.URLField(
         null=False,
         blank=False,
@@ -82,8 +97,19 @@ class Affiliate(models.Model):
 # noinspection PyUnusedLocal
 @receiver(models.signals.post_delete, sender=Affiliate)
 def auto_delete_file_on_delete(sender, instance, **kwargs):
-    """Deletes the logo file of an Affiliate model object when the object is in the process of being deleted.
+    """Deletes the logo file of an Affiliate model object, and the files of its derivatives, when the object is in the
+    process of being deleted. Files which are shared with another object (i.e., identical uploads) are kept.
 
     Reference: https://stackoverflow.com/a/16041527
     """
-    instance.logo.delete(save=False)
+    images.delete(instance.logo_derivatives, instance.logo.storage)
+    media.delete_unreferenced(instance.logo.storage, [instance.logo.name])
+
+
+# noinspection PyUnusedLocal
+@receiver(models.signals.post_save, sender=Affiliate)
+def generate_logo_derivatives(sender, instance, **kwargs):
+    """Generates the derivatives of an Affiliate model object's logo once the object has been saved with a new logo.
+    """
+    if images.outdated(instance.logo, instance.logo_derivatives):
+        transaction.on_commit(lambda: generate_image_derivatives.delay('affiliations.Affiliate', instance.pk, 'logo'))
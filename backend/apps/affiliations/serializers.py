@@ -2,19 +2,29 @@
 from rest_framework import serializers
 
 from apps.affiliations.models import Affiliate
+from core.images import preview, srcset
 
 
 class AffiliateSerializer(serializers.ModelSerializer):
     """A simple Django Rest Framework serializer for the Affiliate model.
 
     The serialized representation of an affiliate model instance includes the instance's ``name`` and ``website``
-    attributes, as well as the relative URL from which the affiliate's logo can be requested.
+    attributes, as well as the relative URL from which the affiliate's logo can be requested and the resized versions
+    of the logo which should be displayed in its place.
 
     Attributes:  # noqa
         logo_url: A serializer method field that is included in the serialized representation of an Affiliate model
         instance rather than the instance's ``logo`` attribute itself.
+
+        logo_srcset: A serializer method field which contains the URLs and widths of the resized versions of the
+        affiliate's logo, in a structure which maps onto a ``<picture>`` element.
+
+        logo_preview: A serializer method field which contains the dimensions, dominant color, and blurred placeholder
+        of the affiliate's logo, which are shown while the logo loads.
     """
     logo_url = serializers.SerializerMethodField(read_only=True)
+    logo_srcset = serializers.SerializerMethodField(read_only=True)
+    logo_preview = serializers.SerializerMethodField(read_only=True)
 
     # noinspection PyMethodMayBeStatic
     def get_logo_url(self, obj):
@@ -32,6 +42,34 @@ class AffiliateSerializer(serializers.ModelSerializer):
         """
         return obj.logo.url
 
+    # noinspection PyMethodMayBeStatic
+    def get_logo_srcset(self, obj):
+        """A get method for the AffiliateSerializer class' ``logo_srcset`` attribute.
+
+        Args:
+            obj: The instance of the Affiliate model class that is being serialized.
+
+        Returns:
+            A dictionary containing the ``src``, ``width``, and ``height`` of the largest JPEG version of the logo, and
+            the ``sources`` from which browsers choose the smallest version which fills the logo's card, or None if the
+            resized versions have not been generated yet (see the core.images module).
+        """
+        return srcset(obj.logo_derivatives, obj.logo.storage)
+
+    # noinspection PyMethodMayBeStatic
+    def get_logo_preview(self, obj):
+        """A get method for the AffiliateSerializer class' ``logo_preview`` attribute.
+
+        Args:
+            obj: The instance of the Affiliate model class that is being serialized.
+
+        Returns:
+            A dictionary containing the ``width``, ``height``, dominant ``color``, and ``placeholder`` data URI of the
+            logo, which are stored when the logo is processed so that the logo file is not opened, or None if the logo
+            has not been processed yet (see the core.images module).
+        """
+        return preview(obj.logo_derivatives)
+
     class Meta:
         """A class which defines basic configuration options for the AffiliateSerializer class.
 
@@ -41,4 +79,4 @@ class AffiliateSerializer(serializers.ModelSerializer):
             fields: A list of the fields to include in the serialized representation of an Affiliate model instance.
         """
         model = Affiliate
-        fields = ['name', 'logo_url', 'website']
+        fields = ['name', 'logo_url', 'logo_srcset', 'logo_preview', 'website']
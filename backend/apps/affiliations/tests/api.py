@@ -66,3 +66,49 @@ class AffiliateEndpointTestCase(VerboseAPITestCase):
         response = self.client.get(f'{url}/{self.affiliate.pk}/')
 
         self.assertEqual(self.affiliate.logo.url, response.data['logo_url'])
+
+    @tag(Tags.API)
+    def test_logo_srcset_serializer_field(self):
+        """Ensure that the `logo_srcset` serializer method field lists the resized versions of the logo by format and
+        width, and is null until they have been generated.
+        """
+        url = reverse('affiliate-list')
+        response = self.client.get(f'{url}/{self.affiliate.pk}/')
+        self.assertIsNone(response.data['logo_srcset'])
+
+        Affiliate.objects.filter(pk=self.affiliate.pk).update(logo_derivatives={
+            'source': self.affiliate.logo.name,
+            'images': [
+                {'name': f'logo-{width}w.{ext}', 'format': ext, 'width': width, 'height': width // 2, 'size': 1}
+                for width in (320, 160) for ext in ('jpeg', 'webp')
+            ],
+        })
+        response = self.client.get(f'{url}/{self.affiliate.pk}/')
+        self.assertEqual(
+            {
+                'src': '/media/logo-320w.jpeg',
+                'width': 320,
+                'height': 160,
+                'sources': [
+                    {'type': 'image/webp', 'srcset': '/media/logo-160w.webp 160w, /media/logo-320w.webp 320w'},
+                    {'type': 'image/jpeg', 'srcset': '/media/logo-160w.jpeg 160w, /media/logo-320w.jpeg 320w'},
+                ],
+            },
+            response.data['logo_srcset']
+        )
+
+    @tag(Tags.API)
+    def test_logo_preview_serializer_field(self):
+        """Ensure that the `logo_preview` serializer method field contains the stored dimensions, dominant color, and
+        placeholder of the logo, and is null until they have been stored.
+        """
+        url = reverse('affiliate-list')
+        response = self.client.get(f'{url}/{self.affiliate.pk}/')
+        self.assertIsNone(response.data['logo_preview'])
+
+        preview = {'width': 800, 'height': 400, 'color': '#ff8080', 'placeholder': 'data:image/jpeg;base64,'}
+        Affiliate.objects.filter(pk=self.affiliate.pk).update(
+            logo_derivatives={'source': self.affiliate.logo.name, 'images': [], **preview}
+        )
+        response = self.client.get(f'{url}/{self.affiliate.pk}/')
+        self.assertEqual(preview, response.data['logo_preview'])
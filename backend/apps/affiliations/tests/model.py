@@ -1,6 +1,7 @@
 """This module contains unit tests for the affiliations application's Django models."""
 from django.conf import settings
 from django.test import tag
+import hashlib
 import os
 
 from apps.affiliations.models import Affiliate, BASE_LOGO_PATH
@@ -37,9 +38,30 @@ class TestAffiliateModel(VerboseTestCase):
         if os.path.isfile(path):
             self.fail('Logo image file was not deleted along with the model instance.')
 
+    @tag(Tags.MODEL)
+    def test_identical_logos_shared(self):
+        """Ensure that affiliates with identical logos share a single file, which is only deleted from the disk along
+        with the last of them.
+        """
+        affiliates = [
+            Affiliate(name='Python Software Foundation', logo=self.image, website='https://www.python.org/'),
+            Affiliate(name='PyCon', logo=self.image, website='https://pycon.org/'),
+        ]
+        for affiliate in affiliates:
+            affiliate.save()
+        self.assertEqual(affiliates[0].logo.name, affiliates[1].logo.name)
+
+        path = affiliates[0].logo.path
+        affiliates[0].delete()
+        self.assertTrue(os.path.isfile(path))
+
+        affiliates[1].delete()
+        self.assertFalse(os.path.isfile(path))
+
     @tag(Tags.MODEL)
     def test_logo_path_properly_assigned(self):
-        """Ensure that the URL and name of an affiliate's logo are properly assigned when creating an Affiliate object.
+        """Ensure that the URL and name of an affiliate's logo are properly assigned when creating an Affiliate object,
+        in the logos directory and named after the digest of the logo's contents.
         """
         affiliate = Affiliate(
             name='JetBrains',
@@ -52,7 +74,7 @@ class TestAffiliateModel(VerboseTestCase):
             affiliate,
             self.assertEqual,
             affiliate.logo.url,
-            f'{settings.MEDIA_URL}{BASE_LOGO_PATH}jetbrains.png'
+            f'{settings.MEDIA_URL}{BASE_LOGO_PATH}{hashlib.sha256(b"file_content").hexdigest()[:32]}.png'
         )
 
     @tag(Tags.MODEL)
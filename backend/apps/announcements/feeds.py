@@ -0,0 +1,33 @@
+"""This module contains the RSS and Atom feeds of club announcements."""
+from django.conf import settings
+
+from apps.announcements.models import Announcement
+from core.feeds import CachedFeed
+
+
+class AnnouncementFeed(CachedFeed):
+    """A cached feed containing the most recent club announcements.
+
+    Each entry's content is the announcement's pre-rendered ``body_html``, so building the feed does not load or render
+    the JSON representation of any announcement body.
+    """
+    name = 'announcements'
+    title = 'AI at NC State Announcements'
+    description = 'Announcements and updates from the AI at NC State club.'
+    path = '/api/announcements/feed'
+
+    def items(self):
+        """Returns the most recent visible announcements, up to the configured ``FEED_ITEM_COUNT``.
+        """
+        announcements = Announcement.objects.visible().only('id', 'title', 'body_html', 'created')
+        return announcements.recent(settings.FEED_ITEM_COUNT)
+
+    def item_kwargs(self, item):
+        """Returns the title, link, rendered body, and creation date of an announcement.
+        """
+        return {
+            'title': item.title,
+            'link': f'/api/announcements/{item.pk}/',
+            'description': item.body_html,
+            'pubdate': item.created,
+        }
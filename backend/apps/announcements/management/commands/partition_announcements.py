@@ -0,0 +1,32 @@
+"""This module contains a management command which partitions an existing announcements table."""
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from apps.announcements.models import Announcement
+from apps.announcements.partitioning import is_partitioned, partition_table, supports_partitioning
+
+
+class Command(BaseCommand):
+    """A management command which partitions the announcements table by year (see the apps.announcements.partitioning
+    module), if it is not already partitioned. The announcements application's 0016 migration leaves the table as-is on
+    databases which do not support partitioning, so this is run once such a database has been upgraded.
+    """
+    help = 'Partitions the announcements table by year, if it is not already partitioned.'
+
+    def handle(self, *args, **options):
+        """Partitions the announcements table and recreates its indexes in a single transaction.
+        """
+        if not supports_partitioning(connection):
+            self.stdout.write(self.style.WARNING('The database does not support partitioning the announcements table.'))
+            return
+
+        if is_partitioned(connection):
+            self.stdout.write('The announcements table is already partitioned.')
+            return
+
+        with connection.schema_editor() as schema_editor:
+            partition_table(schema_editor)
+            for index in Announcement._meta.indexes:
+                schema_editor.add_index(Announcement, index)
+
+        self.stdout.write(self.style.SUCCESS('The announcements table is partitioned by year.'))
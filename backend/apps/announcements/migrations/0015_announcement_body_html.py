@@ -0,0 +1,44 @@
+# Generated by Django 3.1.2 on 2026-10-19 16:24
+
+from django.db import migrations, models
+
+from apps.announcements.rendering import body_digest, render_body
+
+
+def render_existing_bodies(apps, schema_editor):
+    """Renders the body of every existing announcement into HTML, in batches.
+    """
+    Announcement = apps.get_model('announcements', 'Announcement')
+
+    batch = []
+    for announcement in Announcement.objects.only('id', 'body').iterator(chunk_size=500):
+        announcement.body_html = render_body(announcement.body)
+        announcement.body_hash = body_digest(announcement.body)
+        batch.append(announcement)
+
+        if len(batch) == 500:
+            Announcement.objects.bulk_update(batch, ['body_html', 'body_hash'])
+            batch = []
+
+    Announcement.objects.bulk_update(batch, ['body_html', 'body_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0014_auto_20220202_1831'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='announcement',
+            name='body_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64, verbose_name='Announcement Body Hash'),
+        ),
+        migrations.AddField(
+            model_name='announcement',
+            name='body_html',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='Rendered Announcement Body'),
+        ),
+        migrations.RunPython(render_existing_bodies, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 3.1.2 on 2026-10-19 17:02
+
+from django.db import migrations, models
+
+from apps.announcements.partitioning import TABLE, UNPARTITIONED_TABLE, partition_table, supports_partitioning
+
+
+def partition_announcements(apps, schema_editor):
+    """Converts the announcements table into a table partitioned by the year in which announcements were created (see
+    the announcements application's partitioning module). On databases which do not support partitioning, the table is
+    left as-is.
+    """
+    connection = schema_editor.connection
+    if not supports_partitioning(connection):
+        return
+
+    partition_table(schema_editor)
+
+
+def unpartition_announcements(apps, schema_editor):
+    """Converts the partitioned announcements table back into an ordinary table, discarding archived partitions.
+    """
+    connection = schema_editor.connection
+    if not supports_partitioning(connection):
+        return
+
+    quote = schema_editor.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass', [TABLE])
+        if cursor.fetchone() is None:
+            return
+
+    schema_editor.execute(f'ALTER TABLE {quote(TABLE)} RENAME TO {quote(UNPARTITIONED_TABLE)}')
+    schema_editor.execute(
+        f'ALTER TABLE {quote(UNPARTITIONED_TABLE)} RENAME CONSTRAINT {quote(f"{TABLE}_pkey")} '
+        f'TO {quote(f"{UNPARTITIONED_TABLE}_pkey")}'
+    )
+    schema_editor.execute(
+        f'CREATE TABLE {quote(TABLE)} (LIKE {quote(UNPARTITIONED_TABLE)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+    )
+    schema_editor.execute(f'ALTER TABLE {quote(TABLE)} ADD PRIMARY KEY (id)')
+    schema_editor.execute(f'INSERT INTO {quote(TABLE)} SELECT * FROM {quote(UNPARTITIONED_TABLE)}')
+    schema_editor.execute(f'ALTER SEQUENCE {quote(f"{TABLE}_id_seq")} OWNED BY {quote(TABLE)}.id')
+    # Dropping the partitioned table drops each of its partitions as well.
+    schema_editor.execute(f'DROP TABLE {quote(UNPARTITIONED_TABLE)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0015_announcement_body_html'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_announcements, unpartition_announcements),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(fields=['-created'], name='announcemen_created_fb081b_idx'),
+        ),
+    ]
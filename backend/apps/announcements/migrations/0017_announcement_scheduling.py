@@ -0,0 +1,44 @@
+# Generated by Django 3.1.2 on 2026-10-19 17:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0016_partition_announcements'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='announcement',
+            name='publish_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Publish Date/Time'),
+        ),
+        migrations.AddField(
+            model_name='announcement',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Expiration Date/Time'),
+        ),
+        migrations.AddField(
+            model_name='announcement',
+            name='visible',
+            field=models.BooleanField(blank=True, default=True, editable=False, verbose_name='Currently Visible'),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(visible=True), fields=['-created'], name='announcement_visible_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(visible=False), fields=['publish_at'], name='announcement_publish_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(
+                condition=models.Q(('expires_at__isnull', False), ('visible', True)),
+                fields=['expires_at'],
+                name='announcement_expiry_idx'
+            ),
+        ),
+    ]
@@ -1,6 +1,14 @@
 """This module contains Django models that relate to club announcements and updates."""
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import Q
+from django.dispatch import receiver
+from django.utils import timezone
 
+from apps.announcements.partitioning import year_bounds
+from apps.announcements.rendering import body_digest, render_body
+from apps.announcements.stream import publish
+from apps.announcements.tasks import rebuild_announcement_feed
 from core.validators import JSONSchemaValidator
 
 
@@ -135,6 +143,43 @@ ANNOUNCEMENT_BODY_FIELD_JSON_SCHEMA = {
 }
 
 
+class AnnouncementQuerySet(models.QuerySet):
+    """A custom QuerySet for the Announcement model which provides additional methods for retrieving Announcement
+    objects.
+    """
+
+    def visible(self):
+        """A custom queryset method which returns a queryset containing only the announcements which are currently
+        published and have not expired.
+
+        Visibility is stored in the ``visible`` field, which is kept up to date by the `update_announcement_visibility`
+        task, so that this filter can be satisfied by a partial index on the visible announcements alone.
+        """
+        return self.filter(visible=True)
+
+    def recent(self, count):
+        """A custom queryset method which returns the most recently created announcements.
+
+        The announcements table is partitioned by the year in which announcements were created, so the current year's
+        announcements are retrieved first with a query that PostgreSQL can restrict to the current year's partition. The
+        older partitions are only queried if the current year does not contain enough announcements.
+
+        Args:
+            count: The maximum number of announcements to return.
+
+        Returns:
+            A list of Announcement objects, ordered from newest to oldest.
+        """
+        start, _ = year_bounds(timezone.now().year)
+        ordered = self.order_by('-created')
+
+        announcements = list(ordered.filter(created__gte=start)[:count])
+        if len(announcements) < count:
+            announcements += ordered.filter(created__lt=start)[:count - len(announcements)]
+
+        return announcements
+
+
 class Announcement(models.Model):
     """A Django database model which represents a club announcement or update.
 
@@ -148,6 +193,26 @@ class Announcement(models.Model):
         body: A JSONField containing a JSON representation of the announcement's body or content.
 
         created: A DateTimeField that contains the date and time that the announcement was created.
+
+        body_html: A TextField containing the announcement's body rendered into sanitized HTML. It is rendered when the
+        announcement is saved, so that clients do not have to render the body themselves.
+
+        body_hash: A CharField containing a hash of the body that ``body_html`` was rendered from. The body is only
+        re-rendered when its hash changes.
+
+        publish_at: An optional DateTimeField containing the date and time at which the announcement is published. An
+        announcement without one is published as soon as it is created.
+
+        expires_at: An optional DateTimeField containing the date and time at which the announcement stops being
+        visible.
+
+        visible: A BooleanField representing whether or not the announcement is currently published and unexpired. It
+        is updated when the announcement is saved, and by the `update_announcement_visibility` task when the
+        announcement's publish or expiry time passes.
+
+        objects: A custom Manager which includes all base Manager functionality with the addition of the `recent`
+        method, which retrieves the newest announcements without scanning every yearly partition of the table, and the
+        `visible` method, which retrieves only the announcements which are currently visible.
     """
 
     title = models.CharField(
@@ -176,6 +241,88 @@ class Announcement(models.Model):
         unique=False,
         verbose_name='Announcement Creation Time/Date'
     )
+    body_html = models.TextField(
+        null=False,
+        blank=True,
+        default='',
+        editable=False,
+        unique=False,
+        verbose_name='Rendered Announcement Body'
+    )
+    body_hash = models.CharField(
+        max_length=64,
+        null=False,
+        blank=True,
+        default='',
+        editable=False,
+        unique=False,
+        verbose_name='Announcement Body Hash'
+    )
+
+    publish_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=True,
+        unique=False,
+        verbose_name='Publish Date/Time'
+    )
+    expires_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=True,
+        unique=False,
+        verbose_name='Expiration Date/Time'
+    )
+    visible = models.BooleanField(
+        default=True,
+        null=False,
+        blank=True,
+        editable=False,
+        unique=False,
+        verbose_name='Currently Visible'
+    )
+
+    objects = AnnouncementQuerySet.as_manager()
+
+    def clean(self):
+        """Provides additional validation for Announcement model fields.
+
+        Ensures that an Announcement object's expiration date and time falls after its publish date and time.
+        """
+        if self.publish_at is not None and self.expires_at is not None and self.expires_at <= self.publish_at:
+            raise ValidationError('Announcement must expire after its publish date and time.')
+
+    def is_visible_at(self, when):
+        """Checks whether the announcement is published and unexpired at the specified date and time.
+
+        Args:
+            when: The datetime to check the announcement's visibility at.
+        """
+        published = self.publish_at is None or self.publish_at <= when
+        return published and (self.expires_at is None or when < self.expires_at)
+
+    def save(self, *args, **kwargs):
+        """Overrides the default model save method to render the announcement's body into HTML if it has changed since
+        it was last rendered, and to update the announcement's visibility.
+
+        If the announcement is scheduled to be published or to expire in the future, its visibility is updated at that
+        time by the `update_announcement_visibility` task, which Celery beat runs every minute.
+        """
+        updated = set()
+
+        digest = body_digest(self.body)
+        if digest != self.body_hash:
+            self.body_html = render_body(self.body)
+            self.body_hash = digest
+            updated |= {'body_html', 'body_hash'}
+
+        self.visible = self.is_visible_at(timezone.now())
+        updated.add('visible')
+
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = set(kwargs['update_fields']) | updated
+
+        super(Announcement, self).save(*args, **kwargs)
 
     def __str__(self):
         """Defines the string representation of the Announcement class.
@@ -194,5 +341,39 @@ class Announcement(models.Model):
             ordering: A list of fields to order Announcement objects by. As-is, they are ordered by the date/time they
             were created and in descending order (i.e., the newest Announcement appears first and the oldest appears
             last).
+
+            indexes: A list of database indexes for the Announcement model. The index on ``created`` allows the newest
+            announcements in each yearly partition to be retrieved without sorting the partition. The partial indexes
+            cover the visible announcements, in the same order, and the queues of announcements waiting to be published
+            or to expire, so neither listing announcements nor updating their visibility scans scheduled announcements.
         """
         ordering = ['-created']
+        indexes = [
+            models.Index(fields=['-created']),
+            models.Index(fields=['-created'], condition=Q(visible=True), name='announcement_visible_idx'),
+            models.Index(fields=['publish_at'], condition=Q(visible=False), name='announcement_publish_idx'),
+            models.Index(
+                fields=['expires_at'],
+                condition=Q(visible=True, expires_at__isnull=False),
+                name='announcement_expiry_idx'
+            ),
+        ]
+
+
+# noinspection PyUnusedLocal
+@receiver(models.signals.post_save, sender=Announcement)
+@receiver(models.signals.post_delete, sender=Announcement)
+def rebuild_feed_on_change(sender, instance, **kwargs):
+    """Rebuilds the cached announcement feeds once an Announcement object has been saved or deleted.
+    """
+    transaction.on_commit(rebuild_announcement_feed.delay)
+
+
+# noinspection PyUnusedLocal
+@receiver(models.signals.post_save, sender=Announcement)
+def publish_on_create(sender, instance, created, **kwargs):
+    """Publishes a newly created Announcement object to the open announcement streams once it has been committed.
+    Announcements which are scheduled to be published later are published by the `update_announcement_visibility` task.
+    """
+    if created and instance.visible:
+        transaction.on_commit(lambda: publish(instance))
@@ -0,0 +1,202 @@
+"""This module contains functionality for maintaining the yearly partitions of the announcements table.
+
+On PostgreSQL 11 and newer, the announcements table is partitioned by the year in which announcements were created
+(see the announcements application's 0016 migration). Each year's announcements are stored in their own partition, and
+announcements whose creation date does not fall within any yearly partition are stored in a default partition. Old
+partitions can be archived by detaching them from the announcements table, which removes their announcements from the
+API without deleting them or rewriting the rest of the table.
+
+On older versions of PostgreSQL, or other databases, the announcements table is not partitioned and the functions in
+this module do nothing. Once such a database has been upgraded (see the README), the table can be partitioned with the
+`partition_announcements` management command.
+"""
+from datetime import datetime, timezone
+
+from django.db import connection, transaction
+
+# The name of the (parent) announcements table.
+TABLE = 'announcements_announcement'
+
+# The name of the partition containing announcements which do not fall within any yearly partition.
+DEFAULT_PARTITION = f'{TABLE}_default'
+
+# The name that the unpartitioned announcements table is given while its rows are copied into the partitioned table.
+UNPARTITIONED_TABLE = f'{TABLE}_unpartitioned'
+
+# The minimum PostgreSQL server version, as reported by psycopg2, which supports partitioning the announcements table.
+MIN_POSTGRES_VERSION = 110000
+
+
+def partition_name(year):
+    """Returns the name of the partition containing the announcements created in the specified year.
+    """
+    return f'{TABLE}_y{year}'
+
+
+def archive_name(year):
+    """Returns the name of the table which the archived announcements created in the specified year are stored in.
+    """
+    return f'{TABLE}_archive_y{year}'
+
+
+def year_bounds(year):
+    """Returns the range of creation dates and times, as timezone-aware datetimes, covered by a yearly partition.
+
+    Args:
+        year: The year covered by the partition.
+
+    Returns:
+        A tuple containing the (inclusive) start and (exclusive) end of the year, in UTC.
+    """
+    return datetime(year, 1, 1, tzinfo=timezone.utc), datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+
+
+def supports_partitioning(conn=connection):
+    """Checks whether the database supports partitioning the announcements table.
+
+    Args:
+        conn: The database connection to check. Defaults to the default database connection.
+    """
+    return conn.vendor == 'postgresql' and conn.pg_version >= MIN_POSTGRES_VERSION
+
+
+def is_partitioned(conn=connection):
+    """Checks whether the announcements table is partitioned.
+
+    Args:
+        conn: The database connection to check. Defaults to the default database connection.
+    """
+    if not supports_partitioning(conn):
+        return False
+
+    with conn.cursor() as cursor:
+        cursor.execute('SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass', [TABLE])
+        return cursor.fetchone() is not None
+
+
+def partition_years(conn=connection):
+    """Returns the years covered by the yearly partitions currently attached to the announcements table.
+
+    Args:
+        conn: The database connection to use. Defaults to the default database connection.
+
+    Returns:
+        A sorted list of years.
+    """
+    prefix = partition_name('')
+    with conn.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname FROM pg_inherits '
+            'JOIN pg_class parent ON pg_inherits.inhparent = parent.oid '
+            'JOIN pg_class child ON pg_inherits.inhrelid = child.oid '
+            'WHERE parent.relname = %s',
+            [TABLE]
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    return sorted(int(name[len(prefix):]) for name in names if name.startswith(prefix))
+
+
+def partition_table(schema_editor):
+    """Converts the unpartitioned announcements table into a table partitioned by the year in which announcements were
+    created, keeping its announcements.
+
+    A partition is created for every year from the year of the oldest announcement through next year, along with a
+    default partition for any announcement that falls outside of those years. The partitioned table has no indexes
+    other than its primary key, so the caller must create them.
+
+    Args:
+        schema_editor: The schema editor of a connection to a database which supports partitioning.
+    """
+    quote = schema_editor.quote_name
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'SELECT EXTRACT(YEAR FROM MIN(created) AT TIME ZONE \'UTC\') FROM {quote(TABLE)}')
+        oldest = cursor.fetchone()[0]
+
+    current = datetime.now(timezone.utc).year
+    years = range(min(int(oldest), current) if oldest is not None else current, current + 2)
+
+    schema_editor.execute(f'ALTER TABLE {quote(TABLE)} RENAME TO {quote(UNPARTITIONED_TABLE)}')
+    schema_editor.execute(
+        f'ALTER TABLE {quote(UNPARTITIONED_TABLE)} RENAME CONSTRAINT {quote(f"{TABLE}_pkey")} '
+        f'TO {quote(f"{UNPARTITIONED_TABLE}_pkey")}'
+    )
+    schema_editor.execute(
+        f'CREATE TABLE {quote(TABLE)} (LIKE {quote(UNPARTITIONED_TABLE)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        f'PARTITION BY RANGE (created)'
+    )
+    # The partition key must be part of the primary key of a partitioned table.
+    schema_editor.execute(f'ALTER TABLE {quote(TABLE)} ADD PRIMARY KEY (id, created)')
+
+    for year in years:
+        schema_editor.execute(
+            f'CREATE TABLE {quote(partition_name(year))} PARTITION OF {quote(TABLE)} FOR VALUES FROM (%s) TO (%s)',
+            params=year_bounds(year)
+        )
+    schema_editor.execute(f'CREATE TABLE {quote(DEFAULT_PARTITION)} PARTITION OF {quote(TABLE)} DEFAULT')
+
+    schema_editor.execute(f'INSERT INTO {quote(TABLE)} SELECT * FROM {quote(UNPARTITIONED_TABLE)}')
+    # The sequence which generates primary keys is owned by the unpartitioned table, and would be dropped with it.
+    schema_editor.execute(f'ALTER SEQUENCE {quote(f"{TABLE}_id_seq")} OWNED BY {quote(TABLE)}.id')
+    schema_editor.execute(f'DROP TABLE {quote(UNPARTITIONED_TABLE)}')
+
+
+def create_partition(year, conn=connection):
+    """Creates the partition for the announcements created in the specified year, if it does not already exist.
+
+    Any announcements from that year which were stored in the default partition are moved into the new partition, since
+    PostgreSQL does not allow a partition to be attached while the default partition contains rows that belong in it.
+
+    Args:
+        year: The year to create a partition for.
+        conn: The database connection to use. Defaults to the default database connection.
+
+    Returns:
+        True if a partition was created, or False if it already existed or the table is not partitioned.
+    """
+    if not is_partitioned(conn) or year in partition_years(conn):
+        return False
+
+    start, end = year_bounds(year)
+    name = conn.ops.quote_name(partition_name(year))
+    table = conn.ops.quote_name(TABLE)
+    default = conn.ops.quote_name(DEFAULT_PARTITION)
+
+    with transaction.atomic(using=conn.alias), conn.cursor() as cursor:
+        cursor.execute(f'CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+        cursor.execute(
+            f'WITH moved AS (DELETE FROM {default} WHERE created >= %s AND created < %s RETURNING *) '
+            f'INSERT INTO {name} SELECT * FROM moved',
+            [start, end]
+        )
+        cursor.execute(f'ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM (%s) TO (%s)', [start, end])
+
+    return True
+
+
+def archive_partitions(before_year, conn=connection):
+    """Archives the partitions for every year before the specified year.
+
+    Archived partitions are detached from the announcements table and renamed, so their announcements are kept in a
+    standalone table but no longer appear in (or slow down queries on) the announcements table.
+
+    Args:
+        before_year: The earliest year whose partition should not be archived.
+        conn: The database connection to use. Defaults to the default database connection.
+
+    Returns:
+        A list of the years whose partitions were archived.
+    """
+    if not is_partitioned(conn):
+        return []
+
+    archived = [year for year in partition_years(conn) if year < before_year]
+    table = conn.ops.quote_name(TABLE)
+
+    for year in archived:
+        name = conn.ops.quote_name(partition_name(year))
+        with transaction.atomic(using=conn.alias), conn.cursor() as cursor:
+            cursor.execute(f'ALTER TABLE {table} DETACH PARTITION {name}')
+            cursor.execute(f'ALTER TABLE {name} RENAME TO {conn.ops.quote_name(archive_name(year))}')
+
+    return archived
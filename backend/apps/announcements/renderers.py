@@ -0,0 +1,53 @@
+"""This module contains Django Rest Framework renderers for announcements application models."""
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+from rest_framework import renderers
+
+
+class AnnouncementHTMLRenderer(renderers.BaseRenderer):
+    """A Django Rest Framework renderer which renders announcements as a fragment of HTML.
+
+    Each announcement is rendered as an ``article`` element containing its title, the date and time it was created, and
+    its body. The body is not rendered on each request; the HTML which was rendered and stored when the announcement was
+    saved is written to the response as-is. This renderer is selected with the ``?format=html`` query parameter.
+
+    Attributes:  # noqa
+        media_type: The media type of the rendered response.
+
+        format: The value of the ``format`` query parameter which selects this renderer.
+
+        charset: The character set of the rendered response.
+    """
+    media_type = 'text/html'
+    format = 'html'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Renders serialized announcements, which include their stored ``body_html``, into an HTML fragment.
+
+        Args:
+            data: A serialized announcement, or a list of serialized announcements.
+            accepted_media_type: The media type accepted by the client.
+            renderer_context: A dictionary of additional context provided by the view.
+
+        Returns:
+            A bytestring containing the rendered HTML, which is empty if there is no data to render or the response is
+            an error response.
+        """
+        response = (renderer_context or {}).get('response')
+        if not data or (response is not None and response.status_code >= 400):
+            return b''
+        if isinstance(data, dict):
+            data = [data]
+
+        return ''.join(
+            format_html(
+                '<article><h2>{}</h2><time datetime="{}">{}</time>{}</article>',
+                announcement.get('title', ''),
+                announcement.get('created', ''),
+                announcement.get('created', ''),
+                mark_safe(announcement.get('body_html', '')),  # Sanitized when the announcement was saved.
+            )
+            for announcement in data
+            if isinstance(announcement, dict)
+        ).encode(self.charset)
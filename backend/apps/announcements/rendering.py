@@ -0,0 +1,96 @@
+"""This module contains the server-side renderer which turns the body of an announcement into sanitized HTML.
+
+An announcement's body is a JSON array of serialized HTML elements, as described by the
+ANNOUNCEMENT_BODY_FIELD_JSON_SCHEMA in the announcements application's models module. Rather than have every client
+render the body on every page view, it is rendered once, when an announcement is saved, and stored alongside the JSON.
+"""
+import hashlib
+import json
+from urllib.parse import urlsplit
+
+from django.utils.html import format_html
+
+# The URL schemes which may be used in the `href` of an anchor or the `src` of an image. Any other scheme (e.g.,
+# `javascript:` or `data:`) is dropped from the rendered HTML.
+SAFE_URL_SCHEMES = ('http', 'https', 'mailto')
+
+# The elements whose only property, other than `element`, is their text content.
+TEXT_ELEMENTS = ('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+
+def body_digest(body):
+    """Computes a hash of an announcement body, which changes if and only if the body's content changes.
+
+    Args:
+        body: The announcement body, as a list of dictionaries.
+
+    Returns:
+        A string containing the hexadecimal SHA-256 digest of the body's canonical JSON representation.
+    """
+    canonical = json.dumps(body, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def render_body(body):
+    """Renders an announcement body into sanitized HTML.
+
+    All text content is escaped, and URLs which do not use one of the SAFE_URL_SCHEMES are removed. Anchors with an
+    unsafe URL are rendered as plain text, and images with an unsafe URL are omitted. Elements which are not described
+    by the announcement body schema are omitted.
+
+    Args:
+        body: The announcement body, as a list of dictionaries.
+
+    Returns:
+        A string containing the rendered HTML.
+    """
+    return ''.join(_render_element(node) for node in body if isinstance(node, dict))
+
+
+def _render_element(node):
+    """Renders a single element of an announcement body into sanitized HTML.
+
+    Args:
+        node: A dictionary containing the serialized representation of the element.
+
+    Returns:
+        A string containing the rendered HTML, which is empty if the element cannot be rendered safely.
+    """
+    element = node.get('element')
+
+    if element == 'hr':
+        return '<hr>'
+    if element in TEXT_ELEMENTS:
+        return format_html('<{}>{}</{}>', element, node.get('content', ''), element)
+    if element == 'a':
+        href = _safe_url(node.get('href'))
+        if href is None:
+            return format_html('<span>{}</span>', node.get('content', ''))
+        return format_html('<a href="{}" rel="noopener noreferrer">{}</a>', href, node.get('content', ''))
+    if element == 'img':
+        src = _safe_url(node.get('url'))
+        if src is None:
+            return ''
+        return format_html('<img src="{}" alt="{}" loading="lazy">', src, node.get('alt', ''))
+
+    return ''
+
+
+def _safe_url(url):
+    """Checks that a URL uses one of the SAFE_URL_SCHEMES.
+
+    Args:
+        url: The URL to check.
+
+    Returns:
+        The URL, or None if it is not a string, contains whitespace or control characters, or uses an unsafe scheme.
+    """
+    if not isinstance(url, str) or any(c <= ' ' for c in url):
+        return None
+
+    try:
+        scheme = urlsplit(url).scheme.lower()
+    except ValueError:
+        return None
+
+    return url if scheme in SAFE_URL_SCHEMES else None
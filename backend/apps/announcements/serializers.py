@@ -42,3 +42,22 @@ class AnnouncementSerializer(serializers.ModelSerializer):
         """
         model = Announcement
         fields = ['title', 'body', 'created']
+
+
+class AnnouncementHTMLSerializer(serializers.ModelSerializer):
+    """A Django Rest Framework serializer for the Announcement model which is used when rendering announcements as HTML.
+
+    Rather than an announcement's JSON body, its serialized representation includes the HTML which was rendered from the
+    body when the announcement was saved, as well as its title and the date and time when it was created in ISO 8601
+    format.
+    """
+    class Meta:
+        """A class which defines basic configuration options for the AnnouncementHTMLSerializer class.
+
+        Attributes:  # noqa
+            model: The model class that the AnnouncementHTMLSerializer class serializes.
+
+            fields: A list of the fields to include in the serialized representation of an Announcement model instance.
+        """
+        model = Announcement
+        fields = ['title', 'body_html', 'created']
@@ -0,0 +1,160 @@
+"""This module contains the Redis pub/sub broadcaster behind the server-sent events stream of new announcements.
+
+When an announcement is created, its serialized representation is published to a Redis channel. Each web worker
+process holds a single subscription to that channel, and fans the messages it receives out to an in-memory queue for
+each open stream. An idle stream therefore only costs a queue and a blocked greenlet (on the gevent workers) rather than
+its own Redis connection.
+"""
+import json
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# The Redis channel that new announcements are published to.
+CHANNEL = 'announcements:created'
+
+# The number of seconds to wait before resubscribing to the channel after losing the connection to Redis.
+RECONNECT_DELAY = 1
+
+
+def publish(announcement):
+    """Publishes a newly created announcement to every open announcement stream.
+
+    Args:
+        announcement: The Announcement object that was created.
+    """
+    from rest_framework.renderers import JSONRenderer
+    from apps.announcements.serializers import AnnouncementSerializer
+
+    message = json.dumps({
+        'id': announcement.pk,
+        'data': JSONRenderer().render(AnnouncementSerializer(announcement).data).decode('utf-8'),
+    })
+
+    try:
+        get_redis_connection('default').publish(CHANNEL, message)
+    except RedisError:
+        logger.exception('Unable to publish announcement %s to the announcement stream.', announcement.pk)
+
+
+def format_event(event_id, data, event='announcement'):
+    """Formats a message as a server-sent event.
+
+    Args:
+        event_id: The ID of the event, which the client sends back in the Last-Event-ID header when it reconnects.
+        data: A string containing the event's data, which must not contain any newlines.
+        event: The type of the event.
+
+    Returns:
+        A bytestring containing the formatted event.
+    """
+    return f'id: {event_id}\nevent: {event}\ndata: {data}\n\n'.encode('utf-8')
+
+
+class AnnouncementBroadcaster:
+    """Fans the announcements published to the Redis channel out to the open announcement streams in this process.
+
+    The subscription to the Redis channel is made by a daemon thread, which is only started once the first stream is
+    opened. On the gevent workers, the thread and the queues are monkey-patched into a greenlet and cooperative queues.
+
+    Attributes:  # noqa
+        subscribers: A set containing a queue for each open stream.
+    """
+
+    def __init__(self):
+        """Initializes a broadcaster with no subscribers.
+        """
+        self.subscribers = set()
+        self._lock = threading.Lock()
+        self._listener = None
+
+    def subscribe(self):
+        """Opens a subscription to new announcements.
+
+        Returns:
+            A queue which receives a (event ID, data) tuple for every announcement published from now on.
+        """
+        subscriber = queue.Queue(maxsize=settings.ANNOUNCEMENT_STREAM_QUEUE_SIZE)
+        with self._lock:
+            self.subscribers.add(subscriber)
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(target=self._listen, name='announcement-broadcaster', daemon=True)
+                self._listener.start()
+
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """Closes a subscription to new announcements.
+
+        Args:
+            subscriber: The queue returned by the ``subscribe`` method.
+        """
+        with self._lock:
+            self.subscribers.discard(subscriber)
+
+    def dispatch(self, message):
+        """Delivers a message received from the Redis channel to every subscriber.
+
+        A subscriber whose queue is full (i.e., a client which is not reading its stream) misses the message, rather
+        than delaying its delivery to every other subscriber.
+
+        Args:
+            message: The message, as a string of JSON published by the ``publish`` function.
+        """
+        message = json.loads(message)
+        event = (message['id'], message['data'])
+
+        with self._lock:
+            subscribers = tuple(self.subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                pass
+
+    def _listen(self):
+        """Subscribes to the Redis channel and dispatches its messages for as long as the process runs.
+        """
+        while True:
+            try:
+                pubsub = get_redis_connection('default').pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(CHANNEL)
+                for message in pubsub.listen():
+                    self.dispatch(message['data'])
+            except RedisError:
+                logger.exception('Lost the subscription to the announcement stream. Resubscribing...')
+                time.sleep(RECONNECT_DELAY)
+
+
+# The broadcaster shared by every announcement stream in this process.
+broadcaster = AnnouncementBroadcaster()
+
+
+def stream():
+    """Yields the server-sent events which make up an announcement stream, until the client disconnects.
+
+    A comment is sent whenever no announcement has been published for ``ANNOUNCEMENT_STREAM_HEARTBEAT`` seconds, so that
+    proxies do not close idle streams and disconnected clients are noticed.
+
+    Yields:
+        Bytestrings containing the server-sent events.
+    """
+    subscriber = broadcaster.subscribe()
+    try:
+        yield f'retry: {settings.ANNOUNCEMENT_STREAM_RETRY * 1000}\n\n'.encode('utf-8')
+        while True:
+            try:
+                event_id, data = subscriber.get(timeout=settings.ANNOUNCEMENT_STREAM_HEARTBEAT)
+            except queue.Empty:
+                yield b': heartbeat\n\n'
+            else:
+                yield format_event(event_id, data)
+    finally:
+        broadcaster.unsubscribe(subscriber)
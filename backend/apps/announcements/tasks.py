@@ -0,0 +1,70 @@
+"""This module contains asynchronous Celery tasks for the Announcement application."""
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.announcements.partitioning import archive_partitions, create_partition
+
+
+@shared_task
+def maintain_announcement_partitions():
+    """Creates the partitions for this year's and next year's announcements, and archives expired partitions.
+
+    Partitions are created a year in advance so that announcements are never stored in the default partition during
+    normal operation. Partitions for years older than the configured ``ANNOUNCEMENT_RETENTION_YEARS`` are archived.
+
+    Returns:
+        A list of the years whose partitions were archived.
+    """
+    year = timezone.now().year
+    for partition_year in (year, year + 1):
+        create_partition(partition_year)
+
+    archived = archive_partitions(year - settings.ANNOUNCEMENT_RETENTION_YEARS + 1)
+    if archived:
+        rebuild_announcement_feed()
+
+    return archived
+
+
+@shared_task
+def rebuild_announcement_feed():
+    """Rebuilds the cached RSS and Atom feeds of announcements.
+    """
+    from apps.announcements.feeds import AnnouncementFeed
+    AnnouncementFeed().rebuild()
+
+
+@shared_task
+def update_announcement_visibility():
+    """Publishes the announcements whose publish date and time has passed, and hides those which have expired.
+
+    This task is run every minute by Celery beat, rather than being scheduled with an ETA at each announcement's publish
+    and expiry time, since the Redis broker redelivers messages whose ETA is further away than its visibility timeout.
+    Newly published announcements are sent to the open announcement streams, and the announcement feeds are rebuilt if
+    any announcement's visibility changed.
+
+    Returns:
+        A tuple containing the number of announcements which were published and the number which expired.
+    """
+    from apps.announcements.models import Announcement
+    from apps.announcements.stream import publish
+
+    now = timezone.now()
+    with transaction.atomic():
+        published = list(
+            Announcement.objects.select_for_update()
+                                .filter(visible=False, publish_at__lte=now)
+                                .filter(Q(expires_at__isnull=True) | Q(expires_at__gt=now))
+        )
+        Announcement.objects.filter(pk__in=[announcement.pk for announcement in published]).update(visible=True)
+        expired = Announcement.objects.filter(visible=True, expires_at__lte=now).update(visible=False)
+
+    for announcement in published:
+        publish(announcement)
+    if published or expired:
+        rebuild_announcement_feed()
+
+    return len(published), expired
@@ -1,10 +1,19 @@
 """This module contains unit tests for the announcements application's API serializers and viewsets."""
+import json
+import queue
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
 from django.urls import reverse
-from django.test import tag
+from django.test import tag, override_settings
+from django.utils import timezone
 from rest_framework import status
 
 from core.testcases import VerboseAPITestCase, Tags
+from apps.announcements.feeds import AnnouncementFeed
 from apps.announcements.models import Announcement
+from apps.announcements.stream import AnnouncementBroadcaster, format_event
 
 
 class AnnouncementEndpointTestCase(VerboseAPITestCase):
@@ -132,3 +141,161 @@ class AnnouncementEndpointTestCase(VerboseAPITestCase):
         response = self.client.get(f'{url}?count=2')
         self.assertEqual(status.HTTP_200_OK, response.status_code)
         self.assertEqual(1, len(response.data))
+
+    @tag(Tags.API)
+    def test_html_format(self):
+        """Ensure that specifying the `html` format causes the announcements' stored, rendered HTML to be returned.
+        """
+        url = reverse('announcement-list')
+
+        response = self.client.get(f'{url}?format=html')
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertStartsWith(response['Content-Type'], 'text/html')
+        self.assertIn(self.announcement.body_html, response.content.decode())
+
+        response = self.client.get(f'{url}/{self.announcement.pk}/?format=html')
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertIn('<h2>Announcement Title</h2>', response.content.decode())
+
+    @tag(Tags.API)
+    def test_list_excludes_scheduled(self):
+        """Ensure that announcements which have not been published yet, or which have expired, are not listed.
+        """
+        now = timezone.now()
+        Announcement(title='Scheduled', body=[{'element': 'hr'}], publish_at=now + timedelta(hours=1)).save()
+        Announcement(title='Expired', body=[{'element': 'hr'}], expires_at=now - timedelta(hours=1)).save()
+
+        url = reverse('announcement-list')
+        for query in ('', '?count=5'):
+            response = self.client.get(f'{url}{query}')
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+            self.assertEqual(['Announcement Title'], [announcement['title'] for announcement in response.data])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class AnnouncementFeedTestCase(VerboseAPITestCase):
+    """A test case class which contains unit tests for the RSS and Atom feeds of announcements.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing Announcement feeds...'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the test data for the test case once when the test case class is being prepared to run.
+        """
+        cls.announcement = Announcement(
+            title='Announcement Title',
+            body=[{'element': 'p', 'content': 'Paragraph <text> content'}]
+        )
+        cls.announcement.save()
+
+    def setUp(self):
+        """Clear the cached feeds before each test.
+        """
+        cache.clear()
+
+    @tag(Tags.API)
+    def test_feed_formats(self):
+        """Ensure that the RSS and Atom feeds contain the announcements' rendered bodies, and that other formats are
+        not found.
+        """
+        response = self.client.get(reverse('announcement-feed', kwargs={'feed_format': 'rss'}))
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertStartsWith(response['Content-Type'], 'application/rss+xml')
+        self.assertIn('<title>Announcement Title</title>', response.content.decode())
+        self.assertIn('&lt;p&gt;Paragraph &amp;lt;text&amp;gt; content&lt;/p&gt;', response.content.decode())
+
+        response = self.client.get(reverse('announcement-feed', kwargs={'feed_format': 'atom'}))
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertStartsWith(response['Content-Type'], 'application/atom+xml')
+
+        response = self.client.get(reverse('announcement-feed', kwargs={'feed_format': 'json'}))
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+    @tag(Tags.API)
+    def test_feed_conditional_requests(self):
+        """Ensure that conditional requests for an unchanged feed receive an HTTP 304 response without querying the
+        database.
+        """
+        url = reverse('announcement-feed', kwargs={'feed_format': 'rss'})
+        response = self.client.get(url)
+
+        with self.assertNumQueries(0):
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+            self.assertEqual(status.HTTP_304_NOT_MODIFIED, not_modified.status_code)
+            self.assertEqual(response['ETag'], not_modified['ETag'])
+
+            not_modified = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+            self.assertEqual(status.HTTP_304_NOT_MODIFIED, not_modified.status_code)
+
+            self.assertEqual(status.HTTP_200_OK, self.client.get(url, HTTP_IF_NONE_MATCH='"stale"').status_code)
+
+    @tag(Tags.API)
+    def test_feed_rebuild(self):
+        """Ensure that rebuilding the feed changes its ETag only if its content changed.
+        """
+        url = reverse('announcement-feed', kwargs={'feed_format': 'atom'})
+        etag = self.client.get(url)['ETag']
+
+        AnnouncementFeed().rebuild()
+        self.assertEqual(etag, self.client.get(url)['ETag'])
+
+        Announcement(title='New Announcement', body=[{'element': 'hr'}]).save()
+        AnnouncementFeed().rebuild()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertIn('New Announcement', response.content.decode())
+
+
+class AnnouncementStreamTestCase(VerboseAPITestCase):
+    """A test case class which contains unit tests for the server-sent events stream of announcements.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing Announcement stream...'
+
+    @tag(Tags.API)
+    @override_settings(ANNOUNCEMENT_STREAM_HEARTBEAT=0, ANNOUNCEMENT_STREAM_RETRY=5)
+    @patch('apps.announcements.stream.broadcaster')
+    def test_stream(self, broadcaster):
+        """Ensure that the stream is sent as server-sent events, and that it includes published announcements and
+        heartbeats.
+        """
+        subscriber = queue.Queue()
+        subscriber.put((1, '{"title":"Title"}'))
+        broadcaster.subscribe.return_value = subscriber
+
+        response = self.client.get(reverse('announcement-stream'))
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertStartsWith(response['Content-Type'], 'text/event-stream')
+        self.assertEqual('no-cache', response['Cache-Control'])
+
+        content = response.streaming_content
+        self.assertEqual(b'retry: 5000\n\n', next(content))
+        self.assertEqual(format_event(1, '{"title":"Title"}'), next(content))
+        self.assertEqual(b': heartbeat\n\n', next(content))
+
+        response.close()
+        broadcaster.unsubscribe.assert_called_once_with(subscriber)
+
+    @tag(Tags.API)
+    @override_settings(ANNOUNCEMENT_STREAM_QUEUE_SIZE=1)
+    @patch('apps.announcements.stream.threading.Thread')
+    def test_broadcaster_dispatch(self, thread):
+        """Ensure that the broadcaster delivers each published announcement to every subscriber, and that a subscriber
+        with a full queue does not prevent delivery to the others.
+        """
+        broadcaster = AnnouncementBroadcaster()
+        full, subscriber = broadcaster.subscribe(), broadcaster.subscribe()
+        full.put((0, '{}'))
+        self.assertEqual(1, thread.call_count)
+
+        broadcaster.dispatch(json.dumps({'id': 1, 'data': '{}'}))
+        self.assertEqual((1, '{}'), subscriber.get_nowait())
+
+        broadcaster.unsubscribe(subscriber)
+        broadcaster.dispatch(json.dumps({'id': 2, 'data': '{}'}))
+        self.assertTrue(subscriber.empty())
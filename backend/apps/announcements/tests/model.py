@@ -1,8 +1,20 @@
 """This module contains unit tests for the announcement application's Django models."""
+import io
+from datetime import timedelta
+from importlib import import_module
+from unittest.mock import patch
+
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
 from django.test import tag
+from django.utils import timezone
 
 from apps.announcements.models import Announcement
+from apps.announcements.partitioning import (
+    DEFAULT_PARTITION, TABLE, archive_name, archive_partitions, create_partition, is_partitioned, partition_name,
+    partition_years, year_bounds
+)
 from core.testcases import VerboseTestCase, Tags
 
 
@@ -888,3 +900,253 @@ class TestAnnouncementModel(VerboseTestCase):
             ]
         )
         self.assertRaises(ValidationError, announcement.full_clean)
+
+
+class TestAnnouncementBodyRendering(VerboseTestCase):
+    """A Django test case class which contains unit tests for rendering the body of an Announcement into HTML.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing Announcement body rendering...'
+
+    @tag(Tags.MODEL)
+    def test_body_rendered_on_save(self):
+        """Ensure that an announcement's body is rendered into HTML when the announcement is saved.
+        """
+        announcement = Announcement(
+            title='Title',
+            body=[
+                {'element': 'h3', 'content': 'Header Text'},
+                {'element': 'hr'},
+                {'element': 'a', 'href': 'https://www.google.com', 'content': 'Link'},
+            ]
+        )
+        announcement.save()
+
+        self.assertEqual(
+            '<h3>Header Text</h3><hr><a href="https://www.google.com" rel="noopener noreferrer">Link</a>',
+            announcement.body_html
+        )
+        self.assertEqual(64, len(announcement.body_hash))
+
+    @tag(Tags.MODEL)
+    def test_body_rendering_sanitized(self):
+        """Ensure that text content is escaped and that URLs with unsafe schemes are removed from the rendered HTML.
+        """
+        announcement = Announcement(
+            title='Title',
+            body=[
+                {'element': 'p', 'content': '<script>alert(1)</script>'},
+                {'element': 'a', 'href': 'javascript:alert(1)', 'content': 'Link'},
+                {'element': 'img', 'url': 'javascript:alert(1)', 'alt': 'Image'},
+                {'element': 'img', 'url': 'https://www.google.com/a.png', 'alt': '"><script>'},
+            ]
+        )
+        announcement.save()
+
+        self.assertEqual(
+            '<p>&lt;script&gt;alert(1)&lt;/script&gt;</p><span>Link</span>'
+            '<img src="https://www.google.com/a.png" alt="&quot;&gt;&lt;script&gt;" loading="lazy">',
+            announcement.body_html
+        )
+
+    @tag(Tags.MODEL)
+    @patch('apps.announcements.models.render_body', return_value='')
+    def test_body_only_rendered_when_changed(self, render_body):
+        """Ensure that an announcement's body is only re-rendered when the body changes.
+        """
+        announcement = Announcement(title='Title', body=[{'element': 'hr'}])
+        announcement.save()
+        self.assertEqual(1, render_body.call_count)
+
+        announcement.title = 'New Title'
+        announcement.save()
+        self.assertEqual(1, render_body.call_count)
+
+        announcement.body = [{'element': 'p', 'content': 'Text'}]
+        announcement.save()
+        self.assertEqual(2, render_body.call_count)
+
+
+class TestAnnouncementQuerySet(VerboseTestCase):
+    """A Django test case class which contains unit tests for the AnnouncementQuerySet class.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing AnnouncementQuerySet...'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the test data for the test case once when the test case class is being prepared to run.
+
+        Two announcements are created this year, and two are created in previous years. Their creation dates are offset
+        from the start of this year, so that they fall in the same years whatever the date the tests are run on.
+        """
+        start, _ = year_bounds(timezone.now().year)
+        for title, created in (('One', start + timedelta(minutes=2)), ('Two', start + timedelta(minutes=1)),
+                               ('Three', start - timedelta(days=200)), ('Four', start - timedelta(days=400))):
+            announcement = Announcement(title=title)
+            announcement.save()
+            Announcement.objects.filter(pk=announcement.pk).update(created=created)
+
+    @tag(Tags.MODEL)
+    def test_recent_current_year(self):
+        """Ensure that the `recent` method only returns the newest announcements when the current year contains enough
+        of them.
+        """
+        self.assertEqual(['One', 'Two'], [a.title for a in Announcement.objects.recent(2)])
+
+    @tag(Tags.MODEL)
+    def test_recent_previous_years(self):
+        """Ensure that the `recent` method includes announcements from previous years, in order, when the current year
+        does not contain enough of them.
+        """
+        self.assertEqual(['One', 'Two', 'Three'], [a.title for a in Announcement.objects.recent(3)])
+        self.assertEqual(['One', 'Two', 'Three', 'Four'], [a.title for a in Announcement.objects.recent(10)])
+
+
+class TestAnnouncementScheduling(VerboseTestCase):
+    """A Django test case class which contains unit tests for scheduled publishing of Announcement objects.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing Announcement scheduling...'
+
+    @tag(Tags.MODEL)
+    def test_visible_on_save(self):
+        """Ensure that an announcement's visibility is determined by its publish and expiration dates and times when it
+        is saved.
+        """
+        now = timezone.now()
+        cases = (
+            (None, None, True),
+            (now - timedelta(hours=1), None, True),
+            (now + timedelta(hours=1), None, False),
+            (None, now - timedelta(hours=1), False),
+            (now - timedelta(hours=2), now + timedelta(hours=1), True),
+        )
+        for publish_at, expires_at, visible in cases:
+            announcement = Announcement(title='Title', publish_at=publish_at, expires_at=expires_at)
+            announcement.save()
+            self.assertEqual(visible, announcement.visible)
+            self.assertEqual(visible, Announcement.objects.visible().filter(pk=announcement.pk).exists())
+
+    @tag(Tags.MODEL)
+    def test_visible_update_fields(self):
+        """Ensure that an announcement's visibility is saved when only some of its fields are saved.
+        """
+        announcement = Announcement(title='Title')
+        announcement.save()
+
+        announcement.expires_at = timezone.now() - timedelta(minutes=1)
+        announcement.save(update_fields=['expires_at'])
+        announcement.refresh_from_db()
+        self.assertFalse(announcement.visible)
+
+    @tag(Tags.MODEL, Tags.VALIDATION)
+    def test_expires_before_publish_invalid(self):
+        """Ensure that an announcement which expires before it is published fails validation.
+        """
+        now = timezone.now()
+        announcement = Announcement(
+            title='Title',
+            body=[{'element': 'hr'}],
+            publish_at=now,
+            expires_at=now - timedelta(hours=1)
+        )
+        self.assertRaises(ValidationError, announcement.full_clean)
+
+
+class TestAnnouncementPartitioning(VerboseTestCase):
+    """A Django test case class which contains unit tests for maintaining the yearly partitions of the announcements
+    table.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing announcement partitioning...'
+
+    def setUp(self):
+        """Skips the tests if the database does not support partitioning the announcements table.
+        """
+        if not is_partitioned():
+            self.skipTest('The announcements table is not partitioned on this database.')
+
+        self.year = timezone.now().year - 5
+
+    def create_announcement(self, created):
+        """Creates an announcement which was created at the specified date and time.
+        """
+        announcement = Announcement(title='Title')
+        announcement.save()
+        Announcement.objects.filter(pk=announcement.pk).update(created=created)
+        return announcement
+
+    def table_of(self, announcement):
+        """Returns the name of the table (i.e., partition) in which an announcement is stored.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT tableoid::regclass::text FROM {TABLE} WHERE id = %s', [announcement.pk])
+            return cursor.fetchone()[0]
+
+    @tag(Tags.MODEL)
+    def test_create_partition(self):
+        """Ensure that creating a year's partition moves that year's announcements out of the default partition, and
+        that announcements created in that year are stored in it.
+        """
+        start, end = year_bounds(self.year)
+        existing = self.create_announcement(start + timedelta(days=100))
+        self.assertEqual(DEFAULT_PARTITION, self.table_of(existing))
+
+        self.assertTrue(create_partition(self.year))
+        self.assertFalse(create_partition(self.year))
+        self.assertIn(self.year, partition_years())
+        self.assertEqual(partition_name(self.year), self.table_of(existing))
+
+        created = self.create_announcement(end - timedelta(seconds=1))
+        self.assertEqual(partition_name(self.year), self.table_of(created))
+        self.assertEqual(DEFAULT_PARTITION, self.table_of(self.create_announcement(end)))
+
+    @tag(Tags.MODEL)
+    def test_archive_partitions(self):
+        """Ensure that archiving partitions detaches the partitions of the years before the specified year into
+        standalone tables which keep their announcements, and leaves the other partitions attached.
+        """
+        create_partition(self.year)
+        start, _ = year_bounds(self.year)
+        archived = self.create_announcement(start + timedelta(days=100))
+        kept = self.create_announcement(timezone.now())
+
+        self.assertEqual([self.year], archive_partitions(self.year + 1))
+        self.assertNotIn(self.year, partition_years())
+        self.assertIn(timezone.now().year, partition_years())
+
+        self.assertFalse(Announcement.objects.filter(pk=archived.pk).exists())
+        self.assertTrue(Announcement.objects.filter(pk=kept.pk).exists())
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1 FROM pg_inherits WHERE inhrelid = %s::regclass', [archive_name(self.year)])
+            self.assertIsNone(cursor.fetchone())
+            cursor.execute(f'SELECT id FROM {archive_name(self.year)}')
+            self.assertEqual([(archived.pk,)], cursor.fetchall())
+
+    @tag(Tags.MODEL)
+    def test_partition_announcements_command(self):
+        """Ensure that the `partition_announcements` management command partitions an unpartitioned announcements table,
+        keeping its announcements and recreating its indexes.
+        """
+        migration = import_module('apps.announcements.migrations.0016_partition_announcements')
+        start, _ = year_bounds(self.year)
+        announcement = self.create_announcement(start + timedelta(days=100))
+        with connection.schema_editor() as schema_editor:
+            migration.unpartition_announcements(None, schema_editor)
+        self.assertFalse(is_partitioned())
+
+        call_command('partition_announcements', stdout=io.StringIO())
+        self.assertTrue(is_partitioned())
+        self.assertEqual(partition_name(self.year), self.table_of(announcement))
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, TABLE)
+        self.assertLessEqual({index.name for index in Announcement._meta.indexes}, set(constraints))
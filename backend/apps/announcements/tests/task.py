@@ -0,0 +1,67 @@
+"""This module contains unit tests for the announcements application's Celery tasks."""
+from datetime import timedelta
+from unittest.mock import call, patch
+
+from django.test import tag, override_settings
+from django.utils import timezone
+
+from apps.announcements.models import Announcement
+from apps.announcements.tasks import maintain_announcement_partitions, update_announcement_visibility
+from core.testcases import VerboseTestCase, Tags
+
+
+class TestAnnouncementsTasks(VerboseTestCase):
+    """A Django test case class which contains unit tests for announcement-related Celery tasks.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing announcements app tasks...'
+
+    @tag(Tags.TASK)
+    @override_settings(ANNOUNCEMENT_RETENTION_YEARS=3)
+    @patch('apps.announcements.tasks.archive_partitions', return_value=[])
+    @patch('apps.announcements.tasks.create_partition', return_value=True)
+    def test_maintain_announcement_partitions(self, create_partition, archive_partitions):
+        """Ensure that the `maintain_announcement_partitions` task creates this year's and next year's partitions, and
+        archives the partitions which are older than the retention period.
+        """
+        year = timezone.now().year
+        maintain_announcement_partitions()
+
+        create_partition.assert_has_calls([call(year), call(year + 1)])
+        archive_partitions.assert_called_once_with(year - 2)
+
+    @tag(Tags.TASK)
+    def test_maintain_announcement_partitions_idempotent(self):
+        """Ensure that the `maintain_announcement_partitions` task can be run repeatedly, whether or not the
+        announcements table is partitioned.
+        """
+        self.assertNotRaises(Exception, maintain_announcement_partitions)
+        self.assertNotRaises(Exception, maintain_announcement_partitions)
+
+    @tag(Tags.TASK)
+    @patch('apps.announcements.tasks.rebuild_announcement_feed')
+    @patch('apps.announcements.stream.publish')
+    def test_update_announcement_visibility(self, publish, rebuild_announcement_feed):
+        """Ensure that the `update_announcement_visibility` task publishes announcements whose publish date and time has
+        passed, hides expired announcements, and invalidates the announcement feeds.
+        """
+        now = timezone.now()
+        scheduled = Announcement(title='Scheduled', publish_at=now + timedelta(hours=1))
+        scheduled.save()
+        expiring = Announcement(title='Expiring', expires_at=now + timedelta(hours=1))
+        expiring.save()
+        future = Announcement(title='Future', publish_at=now + timedelta(days=1))
+        future.save()
+
+        self.assertEqual((0, 0), update_announcement_visibility())
+        self.assertFalse(rebuild_announcement_feed.called)
+
+        with patch('apps.announcements.tasks.timezone.now', return_value=now + timedelta(hours=2)):
+            self.assertEqual((1, 1), update_announcement_visibility())
+
+        self.assertEqual(['Scheduled'], [a.title for a in Announcement.objects.visible()])
+        publish.assert_called_once()
+        self.assertEqual(scheduled.pk, publish.call_args[0][0].pk)
+        rebuild_announcement_feed.assert_called_once_with()
@@ -1,9 +1,14 @@
 """This module contains Django Rest Framework viewsets for announcements application models."""
+from django.http import StreamingHttpResponse
+from django.views.decorators.http import require_safe
 from rest_framework import viewsets, status
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
-from apps.announcements.serializers import AnnouncementSerializer
+from apps.announcements.renderers import AnnouncementHTMLRenderer
+from apps.announcements.serializers import AnnouncementSerializer, AnnouncementHTMLSerializer
 from apps.announcements.models import Announcement
+from apps.announcements.stream import stream
 
 
 class AnnouncementViewSet(viewsets.ReadOnlyModelViewSet):
@@ -12,10 +17,34 @@ class AnnouncementViewSet(viewsets.ReadOnlyModelViewSet):
     Attributes:  # noqa
         serializer_class: The ModelSerializer subclass that is used when processing requests.
 
-        queryset: A queryset of all the Announcement objects in the database.
+        queryset: A queryset of the Announcement objects in the database which are currently visible.
+
+        renderer_classes: The renderers that responses may be rendered with. In addition to the default renderers,
+        announcements can be rendered as HTML with the ``?format=html`` query parameter.
     """
     serializer_class = AnnouncementSerializer
-    queryset = Announcement.objects.all()
+    queryset = Announcement.objects.visible()
+    renderer_classes = api_settings.DEFAULT_RENDERER_CLASSES + [AnnouncementHTMLRenderer]
+
+    def is_html_request(self):
+        """Checks whether the response to the request being processed is being rendered as HTML.
+        """
+        return isinstance(getattr(self.request, 'accepted_renderer', None), AnnouncementHTMLRenderer)
+
+    def get_queryset(self):
+        """Returns the queryset used to populate responses. When rendering HTML, only the fields which are needed to do
+        so are loaded, so that announcement bodies are not loaded or decoded from JSON.
+        """
+        if self.is_html_request():
+            return self.queryset.only('title', 'body_html', 'created')
+        return self.queryset.all()
+
+    def get_serializer_class(self):
+        """Returns the AnnouncementHTMLSerializer class when rendering HTML, and the AnnouncementSerializer otherwise.
+        """
+        if self.is_html_request():
+            return AnnouncementHTMLSerializer
+        return self.serializer_class
 
     def list(self, request, **kwargs):
         """Overrides the default ModelViewSet list action to check for query parameters.
@@ -23,7 +52,8 @@ class AnnouncementViewSet(viewsets.ReadOnlyModelViewSet):
         The only supported query parameter is `count` which may be used to specify the exact number of announcements to
         include in the response. Note: If the specified number of announcements to include in the response exceeds the
         number of announcements in the database, all of the announcements are included in the response rather than
-        raising an error or returning an HTTP 400 response.
+        raising an error or returning an HTTP 400 response. Where possible, the announcements are retrieved from only
+        the current year's partition of the announcements table.
         """
         if 'count' in request.query_params:
             try:
@@ -33,9 +63,23 @@ class AnnouncementViewSet(viewsets.ReadOnlyModelViewSet):
             else:
                 if count < 1:
                     return Response(status=status.HTTP_400_BAD_REQUEST)
-                serializer = self.get_serializer(self.get_queryset()[:count], many=True)
+                serializer = self.get_serializer(self.get_queryset().recent(count), many=True)
         else:
             serializer = self.get_serializer(self.get_queryset(), many=True)
 
         return Response(serializer.data)
 
+
+@require_safe
+def announcement_stream(request):
+    """A Django view which streams newly created announcements to the client as server-sent events.
+
+    Each event has the type `announcement`, and its data is the announcement serialized in the same format as the
+    announcements API endpoint. Since announcements created while a client is disconnected are not replayed, clients
+    should request the latest announcements from the API endpoint whenever they (re)connect.
+    """
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Prevent nginx from buffering the stream.
+    response['X-Accel-Buffering'] = 'no'
+    return response
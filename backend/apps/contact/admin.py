@@ -1,15 +1,32 @@
 """This module contains contact application configuration for the Django admin site."""
-from django.contrib import admin
+from django.conf import settings
+from django.contrib import admin, messages
 from django.contrib.contenttypes.admin import GenericStackedInline
-from django.db import models
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import PermissionDenied
+from django.db import models, transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.http import HttpResponseRedirect, StreamingHttpResponse
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
-from polymorphic.admin import PolymorphicChildModelAdmin, PolymorphicParentModelAdmin, PolymorphicChildModelFilter
+from polymorphic.admin import PolymorphicChildModelAdmin, PolymorphicParentModelAdmin
 
-from core.admin import ReadOnlyContactInfoTabularInline, JSONFieldEditorWidget
+from core.admin import GenericRelationInlineFormSet, ReadOnlyContactInfoTabularInline, JSONFieldEditorWidget
+from core.contenttypes import content_type_ids
+from core.models import ContactInfo
 from apps.contact.models import (
-    ContactFormBase, GuestSpeakerContactForm, MentorContactForm, EventOrganizerContactForm, PartnerContactForm,
-    AdminComment
+    CONTACT_FORM_LABELS, ContactFormBase, GuestSpeakerContactForm, MentorContactForm, EventOrganizerContactForm,
+    PartnerContactForm, MentorshipRequest, AdminComment
 )
+from apps.contact.export import FORMATS, stream
+from apps.contact.matching import assign_matches, confirm_matches, describe, match_key, propose_matches
+from apps.contact.scheduling import schedule_speakers
+from apps.contact.storage import detail_fields
 
 
 class AdminCommentGenericStackedInline(GenericStackedInline):
@@ -18,6 +35,7 @@ class AdminCommentGenericStackedInline(GenericStackedInline):
     generic relationship to a contact form.
     """
     model = AdminComment
+    formset = GenericRelationInlineFormSet
     extra = 1
     verbose_name = 'Administrator Comment'
     ct_field = 'form_type'
@@ -254,21 +272,264 @@ class PartnerContactFormAdmin(PolymorphicChildModelAdmin):
         return False
 
 
-class ContactFormTypeFilter(PolymorphicChildModelFilter):
+class ContactFormTypeFilter(admin.SimpleListFilter):
     """A custom filter which allows filtering of submitted contact forms by polymorphic child type (i.e., contact form
-    type).
+    type). Forms are filtered by their ``form_type`` rather than their polymorphic content type, so that forms in both
+    storage modes (see the apps.contact.storage module) are included.
     """
     title = _('Contact Form Type')
+    parameter_name = 'form_type'
+
+    def lookups(self, request, model_admin):
+        """Returns the options of the filter, which are the types of contact forms.
+        """
+        return [(model._meta.model_name, model._meta.verbose_name) for model in model_admin.child_models]
+
+    def queryset(self, request, queryset):
+        """Filters the contact forms by type.
+        """
+        if self.value():
+            return queryset.filter(form_type=self.value())
+        return queryset
+
+
+class PossibleDuplicateFilter(admin.SimpleListFilter):
+    """A custom filter which allows filtering of submitted contact forms by whether they are likely to have been
+    submitted by the same person as another contact form (see the apps.contact.dedupe module).
+    """
+    title = _('Possible Duplicate')
+    parameter_name = 'duplicate'
+
+    def lookups(self, request, model_admin):
+        """Returns the options of the filter.
+        """
+        return (
+            ('yes', _('Yes')),
+            ('no', _('No')),
+        )
+
+    def queryset(self, request, queryset):
+        """Filters the contact forms by whether they belong to a group of possible duplicates.
+        """
+        if self.value() == 'yes':
+            return queryset.filter(submitter_cluster__isnull=False)
+        if self.value() == 'no':
+            return queryset.filter(submitter_cluster__isnull=True)
+        return queryset
+
+
+class SpamScoreFilter(admin.SimpleListFilter):
+    """A custom filter which allows filtering of submitted contact forms by how likely they are to be spam (see the
+    apps.contact.spam module).
+    """
+    title = _('Spam')
+    parameter_name = 'spam'
+
+    def lookups(self, request, model_admin):
+        """Returns the options of the filter.
+        """
+        return (
+            ('likely', _('Likely')),
+            ('unlikely', _('Unlikely')),
+            ('unscored', _('Not yet scored')),
+        )
+
+    def queryset(self, request, queryset):
+        """Filters the contact forms by whether their spam score is at least the ``CONTACT_SPAM_THRESHOLD`` setting.
+        """
+        if self.value() == 'likely':
+            return queryset.filter(spam_score__gte=settings.CONTACT_SPAM_THRESHOLD)
+        if self.value() == 'unlikely':
+            return queryset.filter(spam_score__lt=settings.CONTACT_SPAM_THRESHOLD)
+        if self.value() == 'unscored':
+            return queryset.filter(spam_score__isnull=True)
+        return queryset
 
 
 @admin.register(ContactFormBase)
 class ContactFormBaseParentAdmin(PolymorphicParentModelAdmin):
     """Defines a polymorphic Django model admin page with which contains all types of contact form models, which
-    includes filtering capabilities by contact form type and whether forms have been reviewed or ignored.
+    includes filtering capabilities by contact form type, whether forms have been reviewed or ignored, how likely
+    forms are to be spam, and whether forms are possible duplicates of other forms. Many forms can be marked as
+    reviewed or ignored at once with the admin actions.
     """
     base_model = ContactFormBase
     child_models = (GuestSpeakerContactForm, MentorContactForm, EventOrganizerContactForm, PartnerContactForm)
-    list_filter = (ContactFormTypeFilter, 'reviewed', 'ignored')
+    list_display = (
+        '__str__', 'form_type_name', 'reviewed', 'ignored', 'contact_count', 'comment_count', 'spam',
+        'possible_duplicates'
+    )
+    list_per_page = 100
+    actions = (
+        'mark_reviewed', 'mark_not_reviewed', 'mark_ignored', 'mark_not_ignored', 'export_csv', 'export_jsonl',
+        'schedule_guest_speakers'
+    )
+    fieldsets = (
+        ('Form Submitter', {
+            'fields': (
+                ('first_name', 'last_name'),
+                'affiliation'
+            )
+        }),
+        ('Form Status', {
+            'fields': (
+                'submitted',
+                ('reviewed', 'ignored')
+            )
+        }),
+        ('Form Details', {
+            'fields': ('form_details',)
+        }),
+        ('Miscellaneous', {
+            'fields': ('thoughts',)
+        })
+    )
+    readonly_fields = ('first_name', 'last_name', 'affiliation', 'submitted', 'thoughts', 'form_details')
+    list_filter = (ContactFormTypeFilter, 'reviewed', 'ignored', SpamScoreFilter, PossibleDuplicateFilter)
+
+    def get_queryset(self, request):
+        """Returns the contact forms without upcasting them to their concrete models, annotated with the number of
+        contact information and administrator comments related to each form, so that the list of contact forms is
+        retrieved with a single query.
+        """
+        form_types = content_type_ids(CONTACT_FORM_LABELS)
+        contacts = ContactInfo.objects.filter(
+            content_type_id__in=form_types, object_id=OuterRef('pk')
+        ).order_by().values('object_id').annotate(count=Count('pk')).values('count')
+        comments = AdminComment.objects.filter(
+            form_type_id__in=form_types, form_id=OuterRef('pk')
+        ).order_by().values('form_id').annotate(count=Count('pk')).values('count')
+
+        return super(ContactFormBaseParentAdmin, self).get_queryset(request).non_polymorphic().annotate(
+            contact_count=Coalesce(Subquery(contacts, output_field=IntegerField()), 0),
+            comment_count=Coalesce(Subquery(comments, output_field=IntegerField()), 0),
+        )
+
+    def form_type_name(self, obj):
+        """Displays the type of a contact form.
+        """
+        names = {model._meta.model_name: model._meta.verbose_name for model in self.child_models}
+        return names.get(obj.form_type, obj.form_type)
+    form_type_name.short_description = 'Form Type'
+    form_type_name.admin_order_field = 'form_type'
+
+    def contact_count(self, obj):
+        """Displays the number of contact information related to a contact form.
+        """
+        return obj.contact_count
+    contact_count.short_description = 'Contacts'
+    contact_count.admin_order_field = 'contact_count'
+
+    def comment_count(self, obj):
+        """Displays the number of administrator comments related to a contact form.
+        """
+        return obj.comment_count
+    comment_count.short_description = 'Comments'
+    comment_count.admin_order_field = 'comment_count'
+
+    def mark_reviewed(self, request, queryset):
+        """Marks the selected contact forms as reviewed with a single UPDATE statement.
+        """
+        updated = queryset.update(reviewed=True)
+        self.message_user(request, f'{updated} contact form(s) marked as reviewed.')
+    mark_reviewed.short_description = 'Mark selected contact forms as reviewed'
+
+    def mark_not_reviewed(self, request, queryset):
+        """Marks the selected contact forms as not reviewed with a single UPDATE statement.
+        """
+        updated = queryset.update(reviewed=False)
+        self.message_user(request, f'{updated} contact form(s) marked as not reviewed.')
+    mark_not_reviewed.short_description = 'Mark selected contact forms as not reviewed'
+
+    def mark_ignored(self, request, queryset):
+        """Marks the selected contact forms as ignored with a single UPDATE statement.
+        """
+        updated = queryset.update(ignored=True)
+        self.message_user(request, f'{updated} contact form(s) marked as ignored.')
+    mark_ignored.short_description = 'Mark selected contact forms as ignored'
+
+    def mark_not_ignored(self, request, queryset):
+        """Marks the selected contact forms as not ignored with a single UPDATE statement.
+        """
+        updated = queryset.update(ignored=False)
+        self.message_user(request, f'{updated} contact form(s) marked as not ignored.')
+    mark_not_ignored.short_description = 'Mark selected contact forms as not ignored'
+
+    @staticmethod
+    def export(queryset, export_format):
+        """Streams an export of the selected contact forms (see the apps.contact.export module) as a file download.
+        """
+        response = StreamingHttpResponse(
+            stream(ContactFormBase.objects.filter(pk__in=queryset.values('pk')), export_format),
+            content_type=FORMATS[export_format]
+        )
+        filename = f'contact-forms-{timezone.now():%Y-%m-%d}.{export_format}'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    def export_csv(self, request, queryset):
+        """Exports the selected contact forms, with their contact information and comments, to CSV.
+        """
+        return self.export(queryset, 'csv')
+    export_csv.short_description = 'Export selected contact forms to CSV'
+
+    def export_jsonl(self, request, queryset):
+        """Exports the selected contact forms, with their contact information and comments, to JSON Lines.
+        """
+        return self.export(queryset, 'jsonl')
+    export_jsonl.short_description = 'Export selected contact forms to JSON Lines'
+
+    def schedule_guest_speakers(self, request, queryset):
+        """Creates a draft event for each of the selected guest speakers who has not been scheduled, at the first of
+        their available times which does not conflict with another event (see the apps.contact.scheduling module).
+        """
+        events, unscheduled = schedule_speakers(queryset)
+        self.message_user(
+            request,
+            f'{len(events)} draft event(s) created. {len(unscheduled)} guest speaker(s) could not be scheduled.'
+        )
+    schedule_guest_speakers.short_description = 'Schedule selected guest speakers as draft events'
+
+    def spam(self, obj):
+        """Displays the likelihood that a contact form is spam as a percentage, if it has been scored.
+        """
+        if obj.spam_score is None:
+            return '-'
+        return f'{obj.spam_score:.0%}'
+    spam.short_description = 'Spam Likelihood'
+    spam.admin_order_field = 'spam_score'
+
+    def possible_duplicates(self, obj):
+        """Links to the list of contact forms which are likely to have been submitted by the same person as a contact
+        form, if there are any.
+        """
+        if obj.submitter_cluster is None:
+            return '-'
+        return format_html('<a href="?submitter_cluster={}">View group</a>', obj.submitter_cluster)
+    possible_duplicates.short_description = 'Possible Duplicates'
+
+    def form_details(self, obj):
+        """Displays the fields which are specific to the type of a contact form stored in the single-table storage
+        mode, followed by its contact information.
+        """
+        form = obj.typed()
+        rows = [(field.verbose_name, getattr(form, field.name)) for field in detail_fields(type(form))]
+        rows += [(contact.get_type_display(), contact.value) for contact in form.contacts.all()]
+        return format_html_join(mark_safe('<br>'), '<b>{}:</b> {}', rows)
+    form_details.short_description = 'Details'
+
+    def change_view(self, request, object_id, *args, **kwargs):
+        """Displays contact forms stored in the single-table storage mode (see the apps.contact.storage module) with
+        this admin, since they have no row in the table of their concrete model. Other contact forms are displayed with
+        the admin of their concrete model.
+        """
+        single_table = str(object_id).isdigit() and ContactFormBase.objects.non_polymorphic().filter(
+            pk=object_id, polymorphic_ctype=ContentType.objects.get_for_model(ContactFormBase)
+        ).exists()
+
+        if single_table:
+            return super(PolymorphicParentModelAdmin, self).change_view(request, object_id, *args, **kwargs)
+        return super(ContactFormBaseParentAdmin, self).change_view(request, object_id, *args, **kwargs)
 
     def has_add_permission(self, request):
         """Disallows creation of submitted contact forms.
@@ -279,3 +540,105 @@ class ContactFormBaseParentAdmin(PolymorphicParentModelAdmin):
         """Disallows deletion of submitted contact forms.
         """
         return False
+
+
+class MentorAssignedFilter(admin.SimpleListFilter):
+    """A custom filter which allows filtering of mentorship requests by whether they have been assigned a mentor.
+    """
+    title = _('Mentor Assigned')
+    parameter_name = 'assigned'
+
+    def lookups(self, request, model_admin):
+        """Returns the options of the filter.
+        """
+        return (
+            ('yes', _('Yes')),
+            ('no', _('No')),
+        )
+
+    def queryset(self, request, queryset):
+        """Filters the mentorship requests by whether they have a mentor.
+        """
+        if self.value() == 'yes':
+            return queryset.filter(mentor__isnull=False)
+        if self.value() == 'no':
+            return queryset.filter(mentor__isnull=True)
+        return queryset
+
+
+@admin.register(MentorshipRequest)
+class MentorshipRequestAdmin(admin.ModelAdmin):
+    """Defines a Django model admin page for MentorshipRequest model instances, which includes a page that proposes
+    mentors for every request without one (see the apps.contact.matching module) and assigns them.
+    """
+    list_display = ('name', 'students', 'start', 'mentor', 'meeting_time', 'created')
+    list_filter = (MentorAssignedFilter, 'start')
+    list_select_related = ('mentor',)
+    search_fields = ('name',)
+    raw_id_fields = ('mentor',)
+    fieldsets = (
+        ('Student Group', {
+            'fields': (
+                ('name', 'students'),
+                'start',
+                'meeting_information'
+            )
+        }),
+        ('Mentor', {
+            'fields': (
+                'mentor',
+                'meeting'
+            )
+        })
+    )
+    formfield_overrides = {
+        models.JSONField: {'widget': JSONFieldEditorWidget}
+    }
+
+    def get_urls(self):
+        """Adds the URL of the page which proposes and assigns mentors to the admin's URLs.
+        """
+        urls = [
+            path('match/', self.admin_site.admin_view(self.match_view), name='contact_mentorshiprequest_match'),
+        ]
+        return urls + super(MentorshipRequestAdmin, self).get_urls()
+
+    def match_view(self, request):
+        """Displays the proposed mentor of every mentorship request without one. When the page is submitted, exactly
+        the displayed proposals are assigned, except for those which can no longer be assigned (e.g., because the
+        request was assigned a mentor in the meantime).
+        """
+        if not self.has_change_permission(request):
+            raise PermissionDenied
+
+        if request.method == 'POST':
+            keys = request.POST.getlist('match')
+            with transaction.atomic():
+                assigned = assign_matches(confirm_matches(keys))
+            self.message_user(request, f'{assigned} mentorship request(s) assigned a mentor.')
+            if assigned < len(keys):
+                self.message_user(
+                    request, f'{len(keys) - assigned} proposed mentor(s) could no longer be assigned.', messages.WARNING
+                )
+            return HttpResponseRedirect(reverse('admin:contact_mentorshiprequest_changelist'))
+
+        matches, unmatched = propose_matches()
+
+        context = {
+            **self.admin_site.each_context(request),
+            'title': 'Proposed Mentors',
+            'opts': self.model._meta,
+            'matches': [
+                (match.request, match.mentor, reverse('admin:contact_contactformbase_change', args=[match.mentor.pk]),
+                 describe(match.meeting), match_key(match))
+                for match in matches
+            ],
+            'unmatched': unmatched,
+        }
+        return TemplateResponse(request, 'admin/contact/mentorshiprequest/match.html', context)
+
+    def meeting_time(self, obj):
+        """Displays the weekly meeting time of a mentorship request in UTC, if it has been assigned a mentor.
+        """
+        return describe(obj.meeting) if obj.meeting else '-'
+    meeting_time.short_description = 'Weekly Meeting Time'
@@ -0,0 +1,274 @@
+"""This module contains the engine which detects contact forms that were submitted by the same person.
+
+Comparing every pair of submissions does not scale, so the engine uses blocking: each submission is assigned a few
+blocking keys (its normalized contact information, the phonetic code of its submitter's name, and the tokens of its
+affiliation), and only submissions which share a blocking key are compared. Blocks which are larger than
+``CONTACT_DEDUPE_MAX_BLOCK_SIZE`` (e.g., every submission from a large university) are too unspecific to be useful, and
+are skipped. The candidate pairs are scored, and pairs which score at least ``CONTACT_DEDUPE_THRESHOLD`` are merged into
+clusters of submissions which are likely to be from the same person.
+"""
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from itertools import combinations
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.contact.models import CONTACT_FORM_LABELS, ContactFormBase
+from core.contenttypes import content_type_ids
+from core.models import ContactInfo
+
+# The number of rows retrieved from the database at a time while loading submissions.
+CHUNK_SIZE = 2000
+
+# Words which are too common in affiliations to indicate that two submissions are from the same person.
+AFFILIATION_STOPWORDS = frozenset((
+    'a', 'an', 'and', 'at', 'co', 'college', 'company', 'corp', 'corporation', 'dept', 'department', 'for', 'group',
+    'inc', 'lab', 'llc', 'ltd', 'of', 'school', 'the', 'univ', 'university',
+))
+
+# Matches the words in a name or affiliation.
+WORDS = re.compile(r'[^\W\d_]+|\d+')
+
+# The Soundex digit of each letter. Letters which are not keys (i.e., vowels, 'h', 'w', and 'y') have no digit.
+SOUNDEX_CODES = {
+    **dict.fromkeys('bfpv', '1'), **dict.fromkeys('cgjkqsxz', '2'), **dict.fromkeys('dt', '3'), 'l': '4',
+    **dict.fromkeys('mn', '5'), 'r': '6',
+}
+
+# The weights of the similarity of submitters' names and affiliations in the score of a candidate pair.
+NAME_WEIGHT = 0.7
+AFFILIATION_WEIGHT = 0.3
+
+
+def soundex(name):
+    """Computes the American Soundex code of a name, which is the same for names that sound alike.
+
+    Args:
+        name: The name to encode.
+
+    Returns:
+        A string containing the four character Soundex code, or an empty string if the name contains no letters.
+    """
+    letters = [c for c in name.lower() if 'a' <= c <= 'z']
+    if not letters:
+        return ''
+
+    code = [letters[0].upper()]
+    previous = SOUNDEX_CODES.get(letters[0])
+    for letter in letters[1:]:
+        digit = SOUNDEX_CODES.get(letter)
+        if digit is not None and digit != previous:
+            code.append(digit)
+        # 'h' and 'w' do not separate letters with the same code, but vowels do.
+        if letter not in 'hw':
+            previous = digit
+
+    return ''.join(code)[:4].ljust(4, '0')
+
+
+def affiliation_tokens(affiliation):
+    """Splits an affiliation into the distinctive words it contains.
+
+    Args:
+        affiliation: The affiliation, which may be None.
+
+    Returns:
+        A frozenset of lowercase words.
+    """
+    return frozenset(WORDS.findall((affiliation or '').lower())) - AFFILIATION_STOPWORDS
+
+
+class Submission:
+    """The information about a contact form which is used to detect duplicate submissions.
+
+    Attributes:  # noqa
+        pk: The primary key of the contact form.
+
+        name: A string containing the lowercase, whitespace-normalized full name of the submitter.
+
+        phonetic: A string containing the Soundex code of the submitter's last name followed by their first initial.
+
+        affiliation: A frozenset containing the distinctive words in the submitter's affiliation.
+
+        contacts: A set containing the normalized values of the submitter's contact information.
+    """
+    __slots__ = ('pk', 'name', 'phonetic', 'affiliation', 'contacts')
+
+    def __init__(self, pk, first_name, last_name, affiliation):
+        """Initializes the information about a contact form from its fields.
+        """
+        first_name = ' '.join(WORDS.findall(first_name.lower()))
+        last_name = ' '.join(WORDS.findall(last_name.lower()))
+
+        self.pk = pk
+        self.name = f'{first_name} {last_name}'.strip()
+        self.phonetic = f'{soundex(last_name)}{first_name[:1]}'
+        self.affiliation = affiliation_tokens(affiliation)
+        self.contacts = set()
+
+    def blocking_keys(self):
+        """Yields the blocking keys of the submission. Submissions which share a blocking key are compared.
+        """
+        for contact in self.contacts:
+            yield f'contact:{contact}'
+        if self.phonetic:
+            yield f'name:{self.phonetic}'
+        for token in self.affiliation:
+            yield f'affiliation:{token}'
+
+
+def score(a, b):
+    """Scores how likely it is that two submissions were made by the same person.
+
+    Args:
+        a: A Submission.
+        b: Another Submission.
+
+    Returns:
+        A float between 0 and 1. Submissions which share contact information always score 1.
+    """
+    if a.contacts & b.contacts:
+        return 1.0
+
+    name = SequenceMatcher(None, a.name, b.name).ratio()
+    if a.affiliation and b.affiliation:
+        affiliation = len(a.affiliation & b.affiliation) / len(a.affiliation | b.affiliation)
+    else:
+        # An unknown affiliation neither supports nor contradicts a match.
+        affiliation = name
+
+    return NAME_WEIGHT * name + AFFILIATION_WEIGHT * affiliation
+
+
+def candidate_pairs(submissions, max_block_size):
+    """Finds the pairs of submissions which share a blocking key.
+
+    Args:
+        submissions: An iterable of Submission objects.
+        max_block_size: The maximum number of submissions which may share a blocking key for it to be used.
+
+    Returns:
+        A set of (Submission, Submission) tuples, ordered by primary key.
+    """
+    blocks = defaultdict(list)
+    for submission in submissions:
+        for key in submission.blocking_keys():
+            blocks[key].append(submission)
+
+    pairs = set()
+    for block in blocks.values():
+        if 1 < len(block) <= max_block_size:
+            pairs.update(combinations(sorted(block, key=lambda s: s.pk), 2))
+
+    return pairs
+
+
+def find(parents, pk):
+    """Finds the root of a submission's tree in a union-find forest, and points every submission on the path from it to
+    the root directly at the root, so that later lookups do not walk the path again.
+
+    Args:
+        parents: A dictionary mapping primary keys to the primary keys of their parents. Roots are either mapped to
+            themselves or not included.
+        pk: The primary key of the submission.
+
+    Returns:
+        The primary key of the root.
+    """
+    root = pk
+    while parents.get(root, root) != root:
+        root = parents[root]
+    while pk != root:
+        parent = parents[pk]
+        parents[pk] = root
+        pk = parent
+    return root
+
+
+def cluster(submissions, threshold=None, max_block_size=None):
+    """Groups submissions which are likely to be from the same person into clusters.
+
+    Args:
+        submissions: An iterable of Submission objects.
+        threshold: The minimum score of a pair of submissions from the same person. Defaults to the
+        ``CONTACT_DEDUPE_THRESHOLD`` setting.
+        max_block_size: The maximum size of a block of submissions which are compared. Defaults to the
+        ``CONTACT_DEDUPE_MAX_BLOCK_SIZE`` setting.
+
+    Returns:
+        A dictionary mapping the primary key of each submission which belongs to a cluster to the cluster's id, which
+        is the smallest primary key in the cluster. Submissions without any likely duplicates are not included.
+    """
+    if threshold is None:
+        threshold = settings.CONTACT_DEDUPE_THRESHOLD
+    if max_block_size is None:
+        max_block_size = settings.CONTACT_DEDUPE_MAX_BLOCK_SIZE
+
+    # A union-find forest, in which the root of each tree is the smallest primary key in its cluster.
+    parents = {}
+    for a, b in candidate_pairs(submissions, max_block_size):
+        root_a, root_b = find(parents, a.pk), find(parents, b.pk)
+        if root_a != root_b and score(a, b) >= threshold:
+            parents[max(root_a, root_b)] = min(root_a, root_b)
+
+    members = set(parents) | set(parents.values())
+    return {pk: find(parents, pk) for pk in members}
+
+
+def load_submissions():
+    """Loads the information used to detect duplicate submissions for every submitted contact form.
+
+    Only the needed columns are retrieved, in chunks, and the contact information of all forms is retrieved with a
+    single additional query rather than one query per form.
+
+    Returns:
+        A dictionary mapping the primary key of each contact form to its Submission.
+    """
+    forms = ContactFormBase.objects.non_polymorphic().order_by().values_list(
+        'pk', 'first_name', 'last_name', 'affiliation'
+    )
+    submissions = {pk: Submission(pk, *fields) for pk, *fields in forms.iterator(chunk_size=CHUNK_SIZE)}
+
+    contacts = ContactInfo.objects.order_by().filter(
+        content_type_id__in=content_type_ids(CONTACT_FORM_LABELS)
+    ).exclude(normalized='').values_list('object_id', 'normalized')
+    for object_id, normalized in contacts.iterator(chunk_size=CHUNK_SIZE):
+        # The primary key of each concrete contact form is the primary key of its ContactFormBase row.
+        if object_id in submissions:
+            submissions[object_id].contacts.add(normalized)
+
+    return submissions
+
+
+def detect_duplicates(threshold=None, max_block_size=None):
+    """Detects the contact forms which are likely to have been submitted by the same person, and stores the cluster
+    that each of them belongs to in its ``submitter_cluster`` field.
+
+    Only the contact forms whose cluster has changed are updated, with one UPDATE statement per cluster.
+
+    Args:
+        threshold: See `cluster`.
+        max_block_size: See `cluster`.
+
+    Returns:
+        The number of contact forms whose cluster changed.
+    """
+    clusters = cluster(load_submissions().values(), threshold, max_block_size)
+    current = dict(
+        ContactFormBase.objects.non_polymorphic().order_by().filter(submitter_cluster__isnull=False).values_list(
+            'pk', 'submitter_cluster'
+        )
+    )
+
+    changes = defaultdict(list)
+    for pk in current.keys() | clusters.keys():
+        if current.get(pk) != clusters.get(pk):
+            changes[clusters.get(pk)].append(pk)
+
+    with transaction.atomic():
+        for cluster_id, pks in changes.items():
+            ContactFormBase.objects.non_polymorphic().filter(pk__in=pks).update(submitter_cluster=cluster_id)
+
+    return sum(len(pks) for pks in changes.values())
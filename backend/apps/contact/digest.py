@@ -0,0 +1,182 @@
+"""This module contains the pipeline which notifies administrators of new contact form submissions in digests.
+
+When a contact form is submitted, its primary key and type are appended to a Redis stream once the submission is
+committed. Periodically (see the ``CELERY_BEAT_SCHEDULE`` setting), the `send_contact_digest` Celery task reads the new
+entries of the stream with a consumer group and queues one summary email per type of contact form (see the core.mail
+module), rather than one email per submission.
+
+Each summary lists at most ``CONTACT_DIGEST_MAX_ITEMS`` submissions, and counts the rest. The stream is read
+``READ_COUNT`` entries at a time, and only the counts and listed submissions of each type are kept between pages. The
+listed submissions of every type are retrieved with a single query, in which their contact information is aggregated
+by a correlated subquery, so the cost of a digest does not grow with the number of submissions. Entries are only
+acknowledged once the summaries have been queued, so entries read by a run which failed are included in the next digest.
+"""
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.db.models import OuterRef, Subquery, TextField
+from django.template.loader import render_to_string
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError, ResponseError
+
+from apps.contact.models import CONTACT_FORM_LABELS, ContactFormBase
+from apps.contact.storage import form_models
+from core.contenttypes import content_type_ids
+from core.mail import enqueue
+from core.models import ContactInfo
+
+logger = logging.getLogger(__name__)
+
+# The Redis stream which new submissions are appended to, and the consumer group and consumer which read it.
+STREAM = 'contact:submissions'
+GROUP = 'digest'
+CONSUMER = 'digest'
+
+# The approximate maximum number of entries kept in the stream, so that it is bounded if digests are not being sent.
+MAX_STREAM_LENGTH = 100000
+
+# The number of stream entries read at a time.
+READ_COUNT = 1000
+
+
+def record(form):
+    """Appends a newly submitted contact form to the stream. Errors are logged rather than raised, so that a submission
+    never fails because Redis is unavailable.
+
+    Args:
+        form: A contact form of any type, which has been saved.
+    """
+    try:
+        get_redis_connection('default').xadd(
+            STREAM, {'pk': form.pk, 'form_type': form.form_type}, maxlen=MAX_STREAM_LENGTH, approximate=True
+        )
+    except RedisError:
+        logger.exception('Unable to add contact form %s to the digest stream.', form.pk)
+
+
+def read_entries(redis):
+    """Reads every entry of the stream which has not been acknowledged by the consumer group, starting with the entries
+    which were read by an earlier run but not acknowledged.
+
+    Pending entries which were deleted from the stream (e.g., because it was trimmed) since they were read have no
+    fields, and are acknowledged without being returned.
+
+    Args:
+        redis: A Redis connection.
+
+    Yields:
+        Lists of up to ``READ_COUNT`` (entry ID, fields dictionary) tuples, in the order of the stream.
+    """
+    try:
+        redis.xgroup_create(STREAM, GROUP, id='0', mkstream=True)
+    except ResponseError as error:
+        if 'BUSYGROUP' not in str(error):
+            raise
+
+    for start in ('0', '>'):
+        while True:
+            response = redis.xreadgroup(GROUP, CONSUMER, {STREAM: start}, count=READ_COUNT)
+            batch = response[0][1] if response else []
+            if not batch:
+                break
+            # Pending entries are read from the last pending entry which was read, while new entries are always read
+            # from the end of the stream.
+            if start != '>':
+                start = batch[-1][0]
+
+            deleted = [entry_id for entry_id, fields in batch if not fields]
+            if deleted:
+                redis.xack(STREAM, GROUP, *deleted)
+            entries = [(entry_id, fields) for entry_id, fields in batch if fields]
+            if entries:
+                yield entries
+
+
+def acknowledge(redis, last_id):
+    """Acknowledges and deletes the entries of the stream which were read by the consumer group, up to and including
+    the specified entry, ``READ_COUNT`` entries at a time.
+
+    Args:
+        redis: A Redis connection.
+        last_id: The ID of the last entry which was read.
+    """
+    while True:
+        pending = redis.xpending_range(STREAM, GROUP, '-', last_id, READ_COUNT, consumername=CONSUMER)
+        ids = [entry['message_id'] for entry in pending]
+        if ids:
+            redis.xack(STREAM, GROUP, *ids)
+            redis.xdel(STREAM, *ids)
+        if len(ids) < READ_COUNT:
+            return
+
+
+def summarized_forms(pks):
+    """Retrieves the contact forms which are listed in a digest with a single query.
+
+    Args:
+        pks: A list of the primary keys of contact forms.
+
+    Returns:
+        A dictionary mapping each primary key to a ContactFormBase object, which is annotated with a ``contact_values``
+        string containing its contact information, preferred contact information first.
+    """
+    contacts = ContactInfo.objects.filter(
+        content_type_id__in=content_type_ids(CONTACT_FORM_LABELS), object_id=OuterRef('pk')
+    ).order_by().values('object_id').annotate(
+        values=StringAgg('value', delimiter=', ', ordering=('-preferred', 'pk'))
+    ).values('values')
+
+    forms = ContactFormBase.objects.non_polymorphic().filter(pk__in=pks).annotate(
+        contact_values=Subquery(contacts, output_field=TextField())
+    ).only('first_name', 'last_name', 'affiliation', 'submitted', 'form_type', 'spam_score')
+
+    return {form.pk: form for form in forms}
+
+
+def send_digest():
+    """Queues one summary email per type of contact form which was submitted since the last digest, and acknowledges
+    the summarized entries of the stream.
+
+    Returns:
+        The number of submissions which were summarized.
+    """
+    redis = get_redis_connection('default')
+    counts, listed, last_id = defaultdict(int), defaultdict(list), None
+    for entries in read_entries(redis):
+        for _, fields in entries:
+            form_type = fields[b'form_type'].decode()
+            counts[form_type] += 1
+            if len(listed[form_type]) < settings.CONTACT_DIGEST_MAX_ITEMS:
+                listed[form_type].append(int(fields[b'pk']))
+        last_id = entries[-1][0]
+
+    if last_id is None:
+        return 0
+
+    total = sum(counts.values())
+    recipients = settings.CONTACT_DIGEST_RECIPIENTS
+    if not recipients:
+        logger.warning('No contact form digest recipients are configured, skipping %s submissions.', total)
+    else:
+        forms = summarized_forms([pk for pks in listed.values() for pk in pks])
+        names = {model._meta.model_name: model._meta.verbose_name for model in form_models()}
+        for form_type, count in counts.items():
+            name = names.get(form_type, form_type)
+            context = {
+                'DOMAIN': settings.DOMAIN,
+                'count': count,
+                'name': name,
+                'form_type': form_type,
+                'forms': [forms[pk] for pk in listed[form_type] if pk in forms],
+                'unlisted': count - len(listed[form_type]),
+            }
+            enqueue(
+                subject=f'{count} new {name}{"" if count == 1 else "s"}',
+                body=render_to_string('mail/contact_digest.txt', context),
+                recipients=recipients,
+            )
+
+    acknowledge(redis, last_id)
+    return total
@@ -0,0 +1,171 @@
+"""This module contains functionality for exporting contact forms, with their contact information and administrator
+comments, to CSV and JSON Lines.
+
+Exports are streamed: contact forms are read from the database in chunks of ``CHUNK_SIZE`` with a server-side cursor,
+the type-specific fields, contact information, and comments of each chunk are retrieved with one query per type of
+contact form plus one query each for contacts and comments, and each line of output is produced as soon as it is ready.
+The memory used by an export therefore does not depend on the number of contact forms which are exported.
+"""
+import csv
+import json
+from collections import defaultdict
+from itertools import islice
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from apps.contact.models import CONTACT_FORM_LABELS, AdminComment
+from apps.contact.storage import detail_fields, form_models, typed_forms
+from core.contenttypes import content_type_ids
+from core.models import ContactInfo
+
+# The names of the supported export formats, and the content type of each.
+FORMATS = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+}
+
+# The number of contact forms which are read from the database at a time.
+CHUNK_SIZE = 500
+
+# The characters which make spreadsheet applications interpret a CSV cell as a formula.
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+# The fields of the ContactFormBase model which are exported for every contact form.
+BASE_COLUMNS = (
+    'id', 'form_type', 'first_name', 'last_name', 'affiliation', 'thoughts', 'submitted', 'reviewed', 'ignored',
+    'spam_score', 'submitter_cluster',
+)
+
+
+def chunks(queryset, size):
+    """Yields lists of up to `size` objects from a queryset, which is read with a server-side cursor.
+    """
+    iterator = queryset.iterator(chunk_size=size)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def related_objects(rows):
+    """Retrieves the contact information and administrator comments of a chunk of contact forms, with one query each.
+
+    Args:
+        rows: A list of ContactFormBase objects.
+
+    Returns:
+        A tuple containing two dictionaries, which map the primary key of each contact form to a list of its
+        ContactInfo objects and a list of its AdminComment objects, respectively.
+    """
+    pks = [row.pk for row in rows]
+    form_types = content_type_ids(CONTACT_FORM_LABELS)
+
+    contacts, comments = defaultdict(list), defaultdict(list)
+    for contact in ContactInfo.objects.filter(content_type_id__in=form_types, object_id__in=pks):
+        contacts[contact.object_id].append(contact)
+    for comment in AdminComment.objects.filter(form_type_id__in=form_types, form_id__in=pks).order_by('created'):
+        comments[comment.form_id].append(comment)
+
+    return contacts, comments
+
+
+def records(queryset):
+    """Yields a dictionary for each contact form in a queryset, containing its fields, type-specific fields, contact
+    information, and administrator comments.
+
+    Args:
+        queryset: A queryset of ContactFormBase objects.
+    """
+    queryset = queryset.non_polymorphic().order_by('pk')
+    for rows in chunks(queryset, CHUNK_SIZE):
+        forms = typed_forms(rows)
+        contacts, comments = related_objects(rows)
+
+        for row in rows:
+            form = forms.get(row.pk, row)
+            record = {column: getattr(row, column) for column in BASE_COLUMNS}
+            record.update((field.name, getattr(form, field.name)) for field in detail_fields(type(form)))
+            record['contacts'] = [
+                {'type': contact.type, 'value': contact.value, 'preferred': contact.preferred}
+                for contact in contacts[row.pk]
+            ]
+            record['comments'] = [
+                {'author': f'{comment.first_name} {comment.last_name}', 'created': comment.created,
+                 'comment': comment.comment}
+                for comment in comments[row.pk]
+            ]
+            yield record
+
+
+def csv_columns():
+    """Returns a list of the columns of a CSV export, which include the type-specific fields of every type of contact
+    form. Type-specific fields are empty for contact forms of other types.
+    """
+    columns = list(BASE_COLUMNS)
+    for model in form_models():
+        columns += [field.name for field in detail_fields(model) if field.name not in columns]
+    return columns + ['contacts', 'comments']
+
+
+class Echo:
+    """A file-like object which returns what is written to it, so that a CSV writer produces lines without buffering
+    them.
+    """
+
+    def write(self, value):
+        """Returns the value which was written.
+        """
+        return value
+
+
+def csv_cell(value):
+    """Converts a value into the contents of a CSV cell. Lists and dictionaries (e.g., JSON fields) are encoded as JSON.
+
+    Strings which would be interpreted as formulas by spreadsheet applications (e.g., a submitted name such as
+    ``=HYPERLINK(...)``) are prefixed with an apostrophe, so that they are displayed as text rather than evaluated.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def stream_csv(queryset):
+    """Yields the lines of a CSV export of the contact forms in a queryset, starting with a header.
+
+    Contacts are written as `type: value` pairs and comments as `author (date): comment`, one per line within the cell.
+    """
+    writer = csv.writer(Echo())
+    columns = csv_columns()
+    yield writer.writerow(columns)
+
+    for record in records(queryset):
+        record['contacts'] = '\n'.join(f'{contact["type"]}: {contact["value"]}' for contact in record['contacts'])
+        record['comments'] = '\n'.join(
+            f'{comment["author"]} ({comment["created"]:%Y-%m-%d}): {comment["comment"]}'
+            for comment in record['comments']
+        )
+        yield writer.writerow([csv_cell(record.get(column)) for column in columns])
+
+
+def stream_jsonl(queryset):
+    """Yields the lines of a JSON Lines export of the contact forms in a queryset, with one JSON object per form.
+    """
+    for record in records(queryset):
+        yield json.dumps(record, cls=DjangoJSONEncoder) + '\n'
+
+
+def stream(queryset, export_format):
+    """Yields the lines of an export of the contact forms in a queryset.
+
+    Args:
+        queryset: A queryset of ContactFormBase objects.
+        export_format: One of the keys of ``FORMATS``.
+    """
+    if export_format == 'csv':
+        return stream_csv(queryset)
+    return stream_jsonl(queryset)
@@ -0,0 +1,104 @@
+"""This module contains functionality for making contact form submissions idempotent.
+
+A client may send an `Idempotency-Key` header with a submission. If it does not, the key is derived from a hash of the
+normalized submission, so that identical submissions made in quick succession (e.g., retries over a flaky connection)
+are treated as one. The response to the first submission with a given key is stored in the cache along with a hash of
+the submission, and every retry extends its expiry, so a key is remembered until no submission has been made with it
+for ``CONTACT_IDEMPOTENCY_TTL`` seconds. The key and the hash are also stored on the submitted contact form, where the
+key is protected by a unique constraint, so that a retry is still recognized if its response has been evicted from the
+cache. A submission which reuses a key with a different payload is rejected rather than replayed.
+"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+# The name of the request header which contains a client-supplied idempotency key.
+HEADER = 'Idempotency-Key'
+
+# The maximum length of a client-supplied idempotency key.
+MAX_KEY_LENGTH = 255
+
+
+def normalize_payload(value):
+    """Converts a submission into canonical form, so that submissions which only differ in formatting are identical.
+
+    Strings are stripped of surrounding whitespace and casefolded, and the keys of objects are sorted when the result is
+    serialized.
+
+    Args:
+        value: The submission (or a value within it), as parsed from the request body.
+
+    Returns:
+        The normalized submission.
+    """
+    if isinstance(value, str):
+        return value.strip().casefold()
+    if isinstance(value, dict):
+        return {key: normalize_payload(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize_payload(item) for item in value]
+    return value
+
+
+def payload_hash(request):
+    """Computes a hash of the normalized submission contained in a request.
+
+    Returns:
+        A string containing the hexadecimal SHA-256 digest of the submission.
+    """
+    payload = json.dumps(normalize_payload(request.data), sort_keys=True, separators=(',', ':'), cls=DjangoJSONEncoder)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def idempotency_key(request, scope, payload):
+    """Computes the idempotency key of a contact form submission.
+
+    Args:
+        request: The request containing the submission.
+        scope: A string identifying the type of contact form being submitted, so that keys for different types of forms
+        never collide.
+        payload: The hash of the submission (see `payload_hash`).
+
+    Returns:
+        A string containing the hexadecimal SHA-256 digest which identifies the submission, or None if the request's
+        `Idempotency-Key` header is too long.
+    """
+    header = request.headers.get(HEADER)
+    if header is not None:
+        if len(header) > MAX_KEY_LENGTH:
+            return None
+        identity = f'{scope}:key:{header}'
+    else:
+        identity = f'{scope}:content:{payload}'
+
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+
+def cache_key(key):
+    """Returns the cache key under which the response to the submission with the specified idempotency key is stored.
+    """
+    return f'contact:idempotency:{key}'
+
+
+def get_response(key):
+    """Retrieves the stored response to the submission with the specified idempotency key, and extends its expiry by
+    ``CONTACT_IDEMPOTENCY_TTL`` seconds.
+
+    Returns:
+        A tuple containing the response's data and status code, and the hash of the submission, or None if no response
+        is stored.
+    """
+    stored = cache.get(cache_key(key))
+    if stored is not None:
+        cache.touch(cache_key(key), settings.CONTACT_IDEMPOTENCY_TTL)
+    return stored
+
+
+def store_response(key, data, status, payload):
+    """Stores the response to the submission with the specified idempotency key, and the hash of the submission, for
+    ``CONTACT_IDEMPOTENCY_TTL`` seconds.
+    """
+    cache.set(cache_key(key), (data, status, payload), settings.CONTACT_IDEMPOTENCY_TTL)
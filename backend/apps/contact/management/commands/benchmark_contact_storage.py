@@ -0,0 +1,102 @@
+"""This module contains a management command which compares the performance of the contact form storage modes."""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+
+from apps.contact.models import (
+    ContactFormBase, GuestSpeakerContactForm, MentorContactForm, EventOrganizerContactForm, PartnerContactForm
+)
+from apps.contact.storage import STORAGE_MODES
+
+
+class Rollback(Exception):
+    """An exception which is raised to roll back the contact forms created by a benchmark.
+    """
+
+
+class Command(BaseCommand):
+    """A management command which measures the insert and list throughput of each contact form storage mode (see the
+    apps.contact.storage module).
+
+    For each storage mode, contact forms of every type are created in a transaction, a page of contact forms is listed
+    repeatedly in the same way as the API and Celery tasks list them (i.e., as instances of their concrete models), and
+    the transaction is rolled back, so the database is left unchanged.
+    """
+    help = 'Compares the insert and list throughput of the contact form storage modes.'
+
+    def add_arguments(self, parser):
+        """Adds the command's arguments to its argument parser.
+        """
+        parser.add_argument('--count', type=int, default=1000, help='The number of contact forms to create.')
+        parser.add_argument('--page-size', type=int, default=100, help='The number of contact forms in a page.')
+        parser.add_argument('--pages', type=int, default=50, help='The number of times that a page is listed.')
+
+    def handle(self, *args, **options):
+        """Runs the benchmark for each storage mode, and reports the results.
+        """
+        for storage in STORAGE_MODES:
+            try:
+                with transaction.atomic(), override_settings(CONTACT_FORM_STORAGE=storage):
+                    inserts = self.benchmark_inserts(options['count'])
+                    pages, queries = self.benchmark_list(options['page_size'], options['pages'])
+                    raise Rollback
+            except Rollback:
+                pass
+
+            self.stdout.write(
+                f'{storage}: {inserts:.0f} inserts/s, {pages:.0f} pages/s, {queries} queries per page of '
+                f'{options["page_size"]}'
+            )
+
+    @staticmethod
+    def forms(count):
+        """Yields unsaved contact forms, cycling through every type of contact form.
+        """
+        now = timezone.now()
+        factories = (
+            lambda i: GuestSpeakerContactForm(
+                first_name='Speaker', last_name=str(i), topic='AI/ML', length=60,
+                availability=[{'date': '2021-01-01', 'time': '12:00:00+00:00'}],
+            ),
+            lambda i: MentorContactForm(
+                first_name='Mentor', last_name=str(i), students=2, field_type='Industry', field_name='AI/ML',
+                availability_start=now.date(), weekly_minutes=60,
+                meeting_information=[{'weekday': 'Monday', 'time': '18:00:00+00:00'}],
+            ),
+            lambda i: EventOrganizerContactForm(
+                first_name='Organizer', last_name=str(i), event_type='Hackathon', min_attendees=10, max_attendees=50,
+            ),
+            lambda i: PartnerContactForm(first_name='Partner', last_name=str(i), min_org_size=10, max_org_size=100),
+        )
+        for i in range(count):
+            yield factories[i % len(factories)](i)
+
+    def benchmark_inserts(self, count):
+        """Creates contact forms in the current storage mode.
+
+        Returns:
+            The number of contact forms created per second.
+        """
+        forms = list(self.forms(count))
+        start = time.perf_counter()
+        for form in forms:
+            form.save()
+
+        return count / (time.perf_counter() - start)
+
+    @staticmethod
+    def benchmark_list(page_size, pages):
+        """Lists the most recently submitted page of contact forms as instances of their concrete models.
+
+        Returns:
+            A tuple containing the number of pages listed per second, and the number of queries made to list a page.
+        """
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(pages):
+                [form.typed() for form in ContactFormBase.objects.all()[:page_size]]
+
+        return pages / (time.perf_counter() - start), len(queries) // pages
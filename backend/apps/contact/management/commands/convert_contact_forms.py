@@ -0,0 +1,35 @@
+"""This module contains a management command which converts contact forms between storage modes."""
+from django.core.management.base import BaseCommand
+
+from apps.contact.storage import (
+    STORAGE_MODES, SINGLE_TABLE, convert_to_multi_table, convert_to_single_table, form_models
+)
+
+
+class Command(BaseCommand):
+    """A management command which converts every existing contact form into the specified storage mode (see the
+    apps.contact.storage module). The conversion is done in batches, each in its own transaction, so it can be
+    interrupted and resumed.
+    """
+    help = 'Converts every contact form into the specified storage mode.'
+
+    def add_arguments(self, parser):
+        """Adds the command's arguments to its argument parser.
+        """
+        parser.add_argument('storage', choices=STORAGE_MODES, help='The storage mode to convert contact forms into.')
+        parser.add_argument(
+            '--batch-size', type=int, default=500, help='The number of contact forms converted in each transaction.'
+        )
+
+    def handle(self, *args, **options):
+        """Converts the contact forms of each type, and reports how many were converted.
+        """
+        convert = convert_to_single_table if options['storage'] == SINGLE_TABLE else convert_to_multi_table
+        for model in form_models():
+            converted = convert(model, options['batch_size'])
+            self.stdout.write(f'Converted {converted} {model._meta.verbose_name_plural}.')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Contact forms are stored in the {options["storage"]} storage mode. Set CONTACT_FORM_STORAGE to '
+            f'"{options["storage"]}" so that new contact forms are stored in the same mode.'
+        ))
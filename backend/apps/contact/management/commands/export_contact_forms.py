@@ -0,0 +1,34 @@
+"""This module contains a management command which exports contact forms to CSV or JSON Lines."""
+from django.core.management.base import BaseCommand
+
+from apps.contact.export import FORMATS, stream
+from apps.contact.models import ContactFormBase
+
+
+class Command(BaseCommand):
+    """A management command which exports contact forms of every type, with their contact information and administrator
+    comments, to CSV or JSON Lines (see the apps.contact.export module). The export is written as it is produced, so it
+    uses a constant amount of memory.
+    """
+    help = 'Exports contact forms, with their contact information and comments, to CSV or JSON Lines.'
+
+    def add_arguments(self, parser):
+        """Adds the command's arguments to its argument parser.
+        """
+        parser.add_argument('--format', choices=FORMATS, default='csv', help='The format of the export.')
+        parser.add_argument('--output', help='The file to write the export to. Defaults to standard output.')
+        parser.add_argument('--since', help='Only export contact forms submitted on or after this date (YYYY-MM-DD).')
+
+    def handle(self, *args, **options):
+        """Writes the export to the output file or standard output.
+        """
+        queryset = ContactFormBase.objects.all()
+        if options['since']:
+            queryset = queryset.filter(submitted__date__gte=options['since'])
+
+        if options['output']:
+            with open(options['output'], 'w', newline='', encoding='utf-8') as output:
+                output.writelines(stream(queryset, options['format']))
+        else:
+            for line in stream(queryset, options['format']):
+                self.stdout.write(line, ending='')
@@ -0,0 +1,381 @@
+"""This module contains the engine which matches student groups' mentorship requests with prospective mentors.
+
+The weekly availability of each mentor and the possible meeting times of each request are converted into bitmaps, in
+which each bit represents a ``SLOT_MINUTES`` long slot of the week in UTC, so checking whether a mentor is available for
+a meeting is a single bitwise operation. Mentors are indexed by the slots in which they are available, so each request
+is only compared with the mentors who are available at the start of one of its possible meeting times.
+
+Requests are assigned in order of how few mentors could accept them, and each request is assigned to the mentor who
+would have the least remaining capacity after accepting it, so that mentors with more capacity remain available for the
+requests which are harder to place. A mentor accepts a request if their mentorship availability includes the start of
+the mentorship, they are available for one of its possible meeting times which does not overlap their other meetings,
+and they have enough remaining capacity for its students and enough remaining weekly minutes for the meeting.
+"""
+from collections import defaultdict
+from datetime import time
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.contact.export import chunks
+from apps.contact.models import ContactFormBase, MentorshipRequest
+from apps.contact.storage import typed_forms
+
+# The number of minutes represented by each bit of a weekly bitmap.
+SLOT_MINUTES = 15
+
+# The number of minutes in a day, and the number of minutes and slots in a week.
+DAY_MINUTES = 24 * 60
+WEEK_MINUTES = 7 * DAY_MINUTES
+WEEK_SLOTS = WEEK_MINUTES // SLOT_MINUTES
+
+# The names of the days of the week, in the order of `date.weekday`.
+WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# The number of mentor contact forms which are read from the database at a time.
+CHUNK_SIZE = 500
+
+
+def week_minute(weekday, value):
+    """Converts a day of the week and a time into the number of minutes since the start of the week in UTC.
+
+    Args:
+        weekday: The name of a day of the week, e.g., `Monday`.
+        value: A string containing an ISO 8601 time, with an optional UTC offset (e.g., `18:00:00+00:00`). Times
+        without a UTC offset are in the ``TIME_ZONE`` setting's time zone.
+
+    Returns:
+        An integer, or None if the day of the week or the time is invalid.
+    """
+    if weekday not in WEEKDAYS:
+        return None
+    try:
+        parsed = time.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+
+    # The offset of times in the default time zone is that of the current date, which is correct outside of the
+    # weeks in which daylight saving time begins or ends.
+    offset = parsed.utcoffset() if parsed.tzinfo else timezone.localtime().utcoffset()
+    minutes = WEEKDAYS.index(weekday) * DAY_MINUTES + parsed.hour * 60 + parsed.minute
+    return int(minutes - offset.total_seconds() // 60) % WEEK_MINUTES
+
+
+def interval_bitmap(start, minutes):
+    """Converts an interval of the week into a bitmap of the slots it overlaps, wrapping around the end of the week.
+
+    Args:
+        start: The number of minutes since the start of the week in UTC at which the interval starts.
+        minutes: The length of the interval in minutes.
+
+    Returns:
+        An integer whose set bits are the slots which the interval overlaps.
+    """
+    first = start // SLOT_MINUTES
+    count = min(-(-(start + minutes) // SLOT_MINUTES) - first, WEEK_SLOTS)
+    bitmap = ((1 << count) - 1) << first
+    # Bits past the end of the week are moved to the start of the week.
+    return (bitmap | bitmap >> WEEK_SLOTS) & ((1 << WEEK_SLOTS) - 1)
+
+
+def meeting_options(meeting_information, minutes):
+    """Converts the weekday/time objects of a ``meeting_information`` field into a bitmap for each possible meeting.
+
+    Args:
+        meeting_information: A list of dictionaries containing `weekday` and `time` keys.
+        minutes: The length of a meeting in minutes.
+
+    Returns:
+        A list of (bitmap, weekday/time dictionary) tuples. Invalid weekday/time objects are skipped.
+    """
+    options = []
+    for slot in meeting_information or ():
+        start = week_minute(slot.get('weekday'), slot.get('time'))
+        if start is not None:
+            options.append((interval_bitmap(start, minutes), slot))
+    return options
+
+
+def slots(bitmap):
+    """Yields the index of each set bit of a bitmap.
+    """
+    while bitmap:
+        lowest = bitmap & -bitmap
+        yield lowest.bit_length() - 1
+        bitmap ^= lowest
+
+
+class Mentor:
+    """The availability and remaining capacity of an open mentor contact form.
+
+    Attributes:  # noqa
+        pk: The primary key of the mentor contact form.
+
+        name: A string containing the full name of the mentor.
+
+        start: A date containing the start of the mentor's mentorship availability.
+
+        end: A date containing the end of the mentor's mentorship availability, or None if it is open-ended.
+
+        free: A bitmap of the slots of the week in which the mentor is available and has no meetings.
+
+        students: An integer containing the number of additional students the mentor can mentor.
+
+        minutes: An integer containing the number of additional minutes per week the mentor can meet.
+    """
+    __slots__ = ('pk', 'name', 'start', 'end', 'free', 'students', 'minutes')
+
+    def __init__(self, form, meeting_minutes):
+        """Initializes the availability of a mentor from their MentorContactForm object.
+        """
+        self.pk = form.pk
+        self.name = f'{form.first_name} {form.last_name}'
+        self.start = form.availability_start
+        self.end = form.availability_end
+        self.free = 0
+        for bitmap, _ in meeting_options(form.meeting_information, meeting_minutes):
+            self.free |= bitmap
+        self.students = form.students
+        self.minutes = form.weekly_minutes
+
+    def available(self, request, bitmap, meeting_minutes):
+        """Returns True if the mentor can accept a request with a meeting at the slots of a bitmap.
+        """
+        return (
+            self.start <= request.start and (self.end is None or request.start <= self.end)
+            and request.students <= self.students and meeting_minutes <= self.minutes
+            and bitmap & self.free == bitmap
+        )
+
+    def assign(self, request, bitmap, meeting_minutes):
+        """Reduces the mentor's availability and capacity by a request with a meeting at the slots of a bitmap.
+        """
+        self.free &= ~bitmap
+        self.students -= request.students
+        self.minutes -= meeting_minutes
+
+
+class Match:
+    """A proposed assignment of a mentorship request to a mentor.
+
+    Attributes:  # noqa
+        request: The MentorshipRequest object.
+
+        mentor: The Mentor which would accept the request.
+
+        meeting: The weekday/time dictionary from the request's ``meeting_information`` at which they would meet.
+    """
+    __slots__ = ('request', 'mentor', 'meeting')
+
+    def __init__(self, request, mentor, meeting):
+        """Initializes the proposed assignment.
+        """
+        self.request = request
+        self.mentor = mentor
+        self.meeting = meeting
+
+
+def load_mentors(on=None, meeting_minutes=None):
+    """Loads the availability of every open mentor contact form, i.e., every form which was not ignored and whose
+    mentorship availability has not ended.
+
+    Args:
+        on: The date on which the mentorship availability must not have ended. Defaults to the current date.
+        meeting_minutes: The length of a meeting in minutes. Defaults to the ``CONTACT_MENTOR_MEETING_MINUTES`` setting.
+
+    Returns:
+        A dictionary mapping the primary key of each open mentor contact form to its Mentor.
+    """
+    on = on or timezone.localdate()
+    meeting_minutes = meeting_minutes or settings.CONTACT_MENTOR_MEETING_MINUTES
+
+    # The availability of contact forms in the single-table storage mode is stored in their details, so it is checked
+    # after the forms are loaded.
+    rows = ContactFormBase.objects.non_polymorphic().filter(form_type='mentorcontactform', ignored=False).order_by('pk')
+    mentors = {}
+    for chunk in chunks(rows, CHUNK_SIZE):
+        for form in typed_forms(chunk).values():
+            if form.availability_start is not None and (form.availability_end is None or form.availability_end >= on):
+                mentors[form.pk] = Mentor(form, meeting_minutes)
+
+    return mentors
+
+
+def match(mentors, requests, meeting_minutes=None):
+    """Assigns mentorship requests to mentors, subject to the mentors' availability and capacity.
+
+    Args:
+        mentors: A dictionary mapping primary keys to Mentor objects, whose availability and capacity are reduced by
+        the assigned requests.
+        requests: An iterable of MentorshipRequest objects which do not have a mentor.
+        meeting_minutes: The length of a meeting in minutes. Defaults to the ``CONTACT_MENTOR_MEETING_MINUTES`` setting.
+
+    Returns:
+        A tuple containing a list of Match objects and a list of the MentorshipRequest objects which could not be
+        assigned to any mentor.
+    """
+    meeting_minutes = meeting_minutes or settings.CONTACT_MENTOR_MEETING_MINUTES
+
+    # The mentors who are available in each slot of the week.
+    index = defaultdict(list)
+    for mentor in mentors.values():
+        for slot in slots(mentor.free):
+            index[slot].append(mentor)
+
+    # The possible meetings of each request, i.e., its options paired with the mentors who could accept them.
+    candidates = []
+    for request in requests:
+        meetings = [
+            (bitmap, meeting, mentor)
+            for bitmap, meeting in meeting_options(request.meeting_information, meeting_minutes)
+            for mentor in index[next(slots(bitmap))]
+            if mentor.available(request, bitmap, meeting_minutes)
+        ]
+        candidates.append((request, meetings))
+    candidates.sort(key=lambda candidate: (len({mentor.pk for _, _, mentor in candidate[1]}), candidate[0].pk))
+
+    matches, unmatched = [], []
+    for request, meetings in candidates:
+        # The mentor's availability may have been reduced by an earlier assignment.
+        meetings = [meeting for meeting in meetings if meeting[2].available(request, meeting[0], meeting_minutes)]
+        if not meetings:
+            unmatched.append(request)
+            continue
+
+        bitmap, meeting, mentor = min(
+            meetings, key=lambda meeting: (meeting[2].students - request.students, meeting[2].minutes, meeting[2].pk)
+        )
+        mentor.assign(request, bitmap, meeting_minutes)
+        matches.append(Match(request, mentor, meeting))
+
+    return matches, unmatched
+
+
+def available_mentors(meeting_minutes=None):
+    """Loads the availability of every open mentor contact form, reduced by the mentorship requests which are already
+    assigned to each mentor.
+
+    Args:
+        meeting_minutes: The length of a meeting in minutes. Defaults to the ``CONTACT_MENTOR_MEETING_MINUTES`` setting.
+
+    Returns:
+        See `load_mentors`.
+    """
+    meeting_minutes = meeting_minutes or settings.CONTACT_MENTOR_MEETING_MINUTES
+    mentors = load_mentors(meeting_minutes=meeting_minutes)
+
+    assigned = MentorshipRequest.objects.filter(mentor_id__in=list(mentors)).only(
+        'students', 'meeting', 'mentor_id'
+    )
+    for request in assigned.iterator(chunk_size=CHUNK_SIZE):
+        options = meeting_options([request.meeting] if request.meeting else [], meeting_minutes)
+        mentors[request.mentor_id].assign(request, options[0][0] if options else 0, meeting_minutes)
+
+    return mentors
+
+
+def propose_matches(meeting_minutes=None):
+    """Proposes mentors for every mentorship request which does not have one.
+
+    Args:
+        meeting_minutes: The length of a meeting in minutes. Defaults to the ``CONTACT_MENTOR_MEETING_MINUTES`` setting.
+
+    Returns:
+        See `match`.
+    """
+    meeting_minutes = meeting_minutes or settings.CONTACT_MENTOR_MEETING_MINUTES
+    mentors = available_mentors(meeting_minutes)
+
+    return match(mentors, MentorshipRequest.objects.filter(mentor__isnull=True).order_by('pk'), meeting_minutes)
+
+
+def match_key(proposed):
+    """Encodes a proposed match as a string containing the primary keys of its request and mentor, and the index of its
+    meeting time in the request's ``meeting_information`` (e.g., `12:34:0`), so that it can be submitted in a form.
+    """
+    index = proposed.request.meeting_information.index(proposed.meeting)
+    return f'{proposed.request.pk}:{proposed.mentor.pk}:{index}'
+
+
+def confirm_matches(keys, meeting_minutes=None):
+    """Checks that proposed matches which were displayed to an administrator can still be assigned, since requests may
+    have been assigned and mentors' availability may have changed since they were proposed.
+
+    This must be called in a transaction, in which the proposed requests and mentors are locked until the requests are
+    assigned (see `assign_matches`), so that concurrent submissions can not assign a request twice or exceed a mentor's
+    capacity.
+
+    Args:
+        keys: A list of the strings encoding the proposed matches (see `match_key`). Invalid strings are ignored.
+        meeting_minutes: The length of a meeting in minutes. Defaults to the ``CONTACT_MENTOR_MEETING_MINUTES`` setting.
+
+    Returns:
+        A list of Match objects for the proposed matches which can still be assigned.
+    """
+    meeting_minutes = meeting_minutes or settings.CONTACT_MENTOR_MEETING_MINUTES
+
+    proposed = {}
+    for key in keys:
+        try:
+            request_pk, mentor_pk, index = (int(part) for part in key.split(':'))
+        except ValueError:
+            continue
+        proposed[request_pk] = (mentor_pk, index)
+
+    # The mentors are locked first, in a consistent order, so that concurrent submissions wait for each other.
+    mentor_pks = {mentor_pk for mentor_pk, _ in proposed.values()}
+    list(ContactFormBase.objects.select_for_update().filter(pk__in=mentor_pks).order_by('pk').values_list('pk'))
+    requests = list(MentorshipRequest.objects.select_for_update().filter(
+        pk__in=list(proposed), mentor__isnull=True
+    ).order_by('pk'))
+    mentors = available_mentors(meeting_minutes)
+
+    matches = []
+    for request in requests:
+        mentor_pk, index = proposed[request.pk]
+        mentor = mentors.get(mentor_pk)
+        meetings = request.meeting_information or []
+        if mentor is None or not 0 <= index < len(meetings):
+            continue
+
+        options = meeting_options([meetings[index]], meeting_minutes)
+        if options and mentor.available(request, options[0][0], meeting_minutes):
+            mentor.assign(request, options[0][0], meeting_minutes)
+            matches.append(Match(request, mentor, meetings[index]))
+
+    return matches
+
+
+def assign_matches(matches):
+    """Assigns the mentors and meeting times of proposed matches to their mentorship requests, with a single UPDATE
+    statement per batch of requests.
+
+    Args:
+        matches: A list of Match objects.
+
+    Returns:
+        The number of mentorship requests which were assigned a mentor.
+    """
+    requests = []
+    for proposed in matches:
+        proposed.request.mentor_id = proposed.mentor.pk
+        proposed.request.meeting = proposed.meeting
+        requests.append(proposed.request)
+
+    with transaction.atomic():
+        MentorshipRequest.objects.bulk_update(requests, ['mentor', 'meeting'], batch_size=CHUNK_SIZE)
+
+    return len(requests)
+
+
+def describe(meeting):
+    """Returns a human-readable description of a weekday/time dictionary, e.g., `Monday 18:00 UTC`.
+    """
+    if not isinstance(meeting, dict):
+        return ''
+    start = week_minute(meeting.get('weekday'), meeting.get('time'))
+    if start is None:
+        return ''
+    hours, minutes = divmod(start % DAY_MINUTES, 60)
+    return f'{WEEKDAYS[start // DAY_MINUTES]} {hours:02}:{minutes:02} UTC'
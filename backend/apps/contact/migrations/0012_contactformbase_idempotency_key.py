@@ -0,0 +1,29 @@
+# Generated by Django 3.1.2 on 2026-10-19 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0011_admincomment_comment'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contactformbase',
+            name='idempotency_key',
+            field=models.CharField(
+                blank=True, default=None, editable=False, max_length=64, null=True, unique=True,
+                verbose_name='Idempotency Key'
+            ),
+        ),
+        migrations.AddField(
+            model_name='contactformbase',
+            name='idempotency_payload',
+            field=models.CharField(
+                blank=True, default=None, editable=False, max_length=64, null=True,
+                verbose_name='Idempotency Payload Hash'
+            ),
+        ),
+    ]
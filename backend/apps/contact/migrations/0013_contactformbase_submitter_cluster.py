@@ -0,0 +1,21 @@
+# Generated by Django 3.1.2 on 2026-10-19 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0012_contactformbase_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contactformbase',
+            name='submitter_cluster',
+            field=models.PositiveIntegerField(
+                blank=True, db_index=True, default=None, editable=False, null=True,
+                verbose_name='Possible Duplicate Group'
+            ),
+        ),
+    ]
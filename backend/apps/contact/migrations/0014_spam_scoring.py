@@ -0,0 +1,39 @@
+# Generated by Django 3.1.2 on 2026-10-19 19:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0013_contactformbase_submitter_cluster'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpamToken',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(editable=False, max_length=100, unique=True, verbose_name='Token')),
+                ('spam', models.PositiveIntegerField(default=0, editable=False, verbose_name='Spam Forms')),
+                ('ham', models.PositiveIntegerField(default=0, editable=False, verbose_name='Non-Spam Forms')),
+            ],
+            options={
+                'verbose_name': 'Spam Classifier Token',
+            },
+        ),
+        migrations.AddField(
+            model_name='contactformbase',
+            name='spam_score',
+            field=models.FloatField(
+                blank=True, db_index=True, default=None, editable=False, null=True, verbose_name='Spam Score'
+            ),
+        ),
+        migrations.AddField(
+            model_name='contactformbase',
+            name='spam_label',
+            field=models.BooleanField(
+                blank=True, default=None, editable=False, null=True, verbose_name='Trained As Spam?'
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 3.1.2 on 2026-10-19 20:15
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+def backfill_form_types(apps, schema_editor):
+    """Sets the ``form_type`` of every existing contact form to the name of its concrete model.
+    """
+    ContactFormBase = apps.get_model('contact', 'ContactFormBase')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+
+    for content_type_id, model in ContentType.objects.filter(app_label='contact').values_list('id', 'model'):
+        ContactFormBase.objects.filter(polymorphic_ctype_id=content_type_id).update(form_type=model)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('contact', '0014_spam_scoring'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contactformbase',
+            name='form_type',
+            field=models.CharField(
+                blank=True, db_index=True, default='', editable=False, max_length=40, verbose_name='Form Type'
+            ),
+        ),
+        migrations.AddField(
+            model_name='contactformbase',
+            name='details',
+            field=models.JSONField(
+                blank=True, default=dict, editable=False, encoder=django.core.serializers.json.DjangoJSONEncoder,
+                verbose_name='Form Details'
+            ),
+        ),
+        migrations.RunPython(backfill_form_types, migrations.RunPython.noop),
+    ]
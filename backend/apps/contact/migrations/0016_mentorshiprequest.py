@@ -0,0 +1,63 @@
+# Generated by Django 3.1.2 on 2026-10-19 21:05
+
+import core.validators
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0015_single_table_storage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MentorshipRequest',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(default='', max_length=150, verbose_name='Student Group Name')),
+                ('students', models.PositiveSmallIntegerField(default=1, validators=[
+                    django.core.validators.MinValueValidator(1, 'Number of students too small.'),
+                    django.core.validators.MaxValueValidator(6, 'Number of students too large.')
+                ], verbose_name='Number of Students')),
+                ('start', models.DateField(verbose_name='Start of Mentorship')),
+                ('meeting_information', models.JSONField(default=list, validators=[
+                    core.validators.JSONSchemaValidator(limit_value={
+                        'items': {
+                            'additionalProperties': False,
+                            'properties': {
+                                'time': {'format': 'time', 'title': 'Time Available', 'type': 'string'},
+                                'weekday': {
+                                    'enum': [
+                                        'Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'
+                                    ],
+                                    'title': 'Day of Week',
+                                    'type': 'string'
+                                }
+                            },
+                            'required': ['weekday', 'time'],
+                            'title': 'Weekday/Time of Availability',
+                            'type': 'object'
+                        },
+                        'minItems': 1,
+                        'schema': 'http://json-schema.org/draft-07/schema#',
+                        'title': 'Weekly Meeting Availability',
+                        'type': 'array'
+                    })
+                ], verbose_name='Weekly Meeting Availability')),
+                ('meeting', models.JSONField(blank=True, default=None, null=True, verbose_name='Weekly Meeting Time')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Date/Time Created')),
+                ('mentor', models.ForeignKey(
+                    blank=True, default=None, limit_choices_to={'form_type': 'mentorcontactform'}, null=True,
+                    on_delete=django.db.models.deletion.SET_NULL, related_name='mentorship_requests',
+                    to='contact.contactformbase', verbose_name='Mentor'
+                )),
+            ],
+            options={
+                'verbose_name': 'Mentorship Request',
+                'ordering': ['-created'],
+            },
+        ),
+    ]
@@ -2,10 +2,12 @@
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
 from django.core.validators import MinValueValidator, MaxValueValidator
 from polymorphic.models import PolymorphicModel
 
+from core.contenttypes import content_type_name, validate_content_type
 from core.validators import JSONSchemaValidator
 
 
@@ -65,11 +67,20 @@ MENTOR_MEETING_INFORMATION_FIELD_SCHEMA = {
     }
 }
 
+# The labels of the concrete contact form models. Generic relations to contact forms (i.e., contact information and
+# administrator comments) refer to the content types of these models.
+CONTACT_FORM_LABELS = (
+    'contact.GuestSpeakerContactForm', 'contact.MentorContactForm', 'contact.EventOrganizerContactForm',
+    'contact.PartnerContactForm',
+)
+
 
 class ContactFormBase(PolymorphicModel):
     """A base model from which concrete contact form model classes inherit the basic fields required in all contact
     form submissions.
     """
+    _SPAM_TEXT_FIELDS = ('affiliation', 'thoughts')
+
     first_name = models.CharField(
         max_length=80,
         null=False,
@@ -124,7 +135,69 @@ class ContactFormBase(PolymorphicModel):
         editable=True,
         verbose_name='Ignored?',
     )
-    comments = GenericRelation('contact.AdminComment')
+    comments = GenericRelation('contact.AdminComment', content_type_field='form_type', object_id_field='form_id')
+    idempotency_key = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        default=None,
+        editable=False,
+        unique=True,
+        verbose_name='Idempotency Key',
+    )
+    idempotency_payload = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        default=None,
+        editable=False,
+        unique=False,
+        verbose_name='Idempotency Payload Hash',
+    )
+    submitter_cluster = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        default=None,
+        editable=False,
+        unique=False,
+        db_index=True,
+        verbose_name='Possible Duplicate Group',
+    )
+    spam_score = models.FloatField(
+        null=True,
+        blank=True,
+        default=None,
+        editable=False,
+        unique=False,
+        db_index=True,
+        verbose_name='Spam Score',
+    )
+    spam_label = models.BooleanField(
+        null=True,
+        blank=True,
+        default=None,
+        editable=False,
+        verbose_name='Trained As Spam?',
+    )
+    form_type = models.CharField(
+        max_length=40,
+        null=False,
+        blank=True,
+        default='',
+        editable=False,
+        unique=False,
+        db_index=True,
+        verbose_name='Form Type',
+    )
+    details = models.JSONField(
+        encoder=DjangoJSONEncoder,
+        null=False,
+        blank=True,
+        default=dict,
+        editable=False,
+        unique=False,
+        verbose_name='Form Details',
+    )
 
     def __str__(self):
         """Defines the string representation of a contact form model to be the first and last name of the form's
@@ -132,6 +205,51 @@ class ContactFormBase(PolymorphicModel):
         """
         return f'{self.first_name} {self.last_name} - {self.submitted.strftime("%m-%d-%Y")}'
 
+    def save(self, *args, **kwargs):
+        """Saves the contact form in its storage mode (see the apps.contact.storage module).
+
+        The ``form_type`` of a concrete contact form is set to the name of its model. New contact forms are stored in
+        the single-table storage mode if it is enabled, and contact forms which were loaded from the single-table
+        storage mode are saved back to it. New contact forms are included in the next digest which is sent to the
+        administrators (see the apps.contact.digest module).
+        """
+        from apps.contact import digest, storage
+
+        adding = self._state.adding
+        if type(self) is not ContactFormBase:
+            self.form_type = self._meta.model_name
+            if getattr(self, '_single_table', False) or (adding and storage.single_table_enabled()):
+                storage.save_single_table(self, *args, **kwargs)
+            else:
+                super(ContactFormBase, self).save(*args, **kwargs)
+            if adding:
+                transaction.on_commit(lambda: digest.record(self))
+            return
+
+        super(ContactFormBase, self).save(*args, **kwargs)
+
+    def typed(self):
+        """Returns the contact form as an instance of its concrete model (e.g., MentorContactForm), whose type-specific
+        fields can be accessed and validated as usual.
+
+        Contact forms stored in the single-table storage mode are converted without querying the database. Contact
+        forms which are already instances of their concrete model are returned as-is.
+        """
+        from apps.contact.storage import is_single_table, materialize
+
+        if type(self) is not ContactFormBase:
+            return self
+        if is_single_table(self):
+            return materialize(self)
+        return self.get_real_instance()
+
+    def spam_text(self):
+        """Returns a dictionary mapping the names of the contact form's free-text fields to their values, which are
+        used to score how likely the form is to be spam (see the apps.contact.spam module). Empty fields are omitted.
+        """
+        form = self.typed()
+        return {field: getattr(form, field) for field in form._SPAM_TEXT_FIELDS if getattr(form, field)}
+
     class Meta:
         """Defines the long-form name to label contact forms as well as the order in which they should appear when
         queried from the database.
@@ -145,6 +263,8 @@ class GuestSpeakerContactForm(ContactFormBase):
     such as the presentation topic and length, speaker availability, accommodations needed, and consent fields for
     audio/video recordings of the meeting.
     """
+    _SPAM_TEXT_FIELDS = ContactFormBase._SPAM_TEXT_FIELDS + ('topic', 'visual_aids', 'addl_visual_aids', 'addl_tech')
+
     topic = models.CharField(
         max_length=250,
         null=False,
@@ -230,6 +350,8 @@ class MentorContactForm(ContactFormBase):
     such as the number of students to mentor, information about the mentor's background and field of expertise, and
     the availability of the prospective mentor to meet with club members.
     """
+    _SPAM_TEXT_FIELDS = ContactFormBase._SPAM_TEXT_FIELDS + ('field_name', 'field_description')
+
     students = models.PositiveSmallIntegerField(
         null=False,
         blank=False,
@@ -313,6 +435,8 @@ class EventOrganizerContactForm(ContactFormBase):
     """A concrete contact form model, intended for event organizers, which includes additional information
     such as the type of event, expected attendance, and financial/advertising information.
     """
+    _SPAM_TEXT_FIELDS = ContactFormBase._SPAM_TEXT_FIELDS + ('event_type', 'advertising')
+
     event_type = models.CharField(
         max_length=120,
         null=False,
@@ -378,6 +502,8 @@ class PartnerContactForm(ContactFormBase):
     such as the type, industry, and size of the organization, whether the organization is interested in funding the
     club, and the types of club's initiatives that the organization is interested in supporting.
     """
+    _SPAM_TEXT_FIELDS = ContactFormBase._SPAM_TEXT_FIELDS + ('industry', 'initiatives')
+
     commercial = models.BooleanField(
         default=False,
         editable=True,
@@ -444,13 +570,159 @@ class PartnerContactForm(ContactFormBase):
         verbose_name = 'Partner Contact Form'
 
 
+class MentorshipRequest(models.Model):
+    """A Django database model which represents a request from a group of club members to be mentored, which is matched
+    with a submitted mentor contact form (see the apps.contact.matching module).
+
+    Attributes:  # noqa
+        name: A CharField containing the name of the group of students.
+
+        students: A PositiveSmallIntegerField containing the number of students in the group.
+
+        start: A DateField containing the date when the group would like the mentorship to start.
+
+        meeting_information: A JSONField containing the weekdays and times when the group is able to meet, in the same
+        format as the ``meeting_information`` field of the MentorContactForm model.
+
+        mentor: A ForeignKey to the mentor contact form of the group's mentor, if one has been assigned.
+
+        meeting: A JSONField containing the weekday and time when the group meets with its mentor, if one has been
+        assigned.
+
+        created: A DateTimeField containing the date and time when the request was created.
+    """
+    name = models.CharField(
+        max_length=150,
+        null=False,
+        blank=False,
+        default='',
+        editable=True,
+        unique=False,
+        verbose_name='Student Group Name',
+    )
+    students = models.PositiveSmallIntegerField(
+        null=False,
+        blank=False,
+        default=1,
+        editable=True,
+        unique=False,
+        verbose_name='Number of Students',
+        validators=[
+            MinValueValidator(1, 'Number of students too small.'),
+            MaxValueValidator(6, 'Number of students too large.'),
+        ],
+    )
+    start = models.DateField(
+        null=False,
+        blank=False,
+        editable=True,
+        unique=False,
+        verbose_name='Start of Mentorship',
+    )
+    meeting_information = models.JSONField(
+        default=list,
+        validators=[JSONSchemaValidator(limit_value=MENTOR_MEETING_INFORMATION_FIELD_SCHEMA)],
+        null=False,
+        blank=False,
+        editable=True,
+        unique=False,
+        verbose_name='Weekly Meeting Availability',
+    )
+    mentor = models.ForeignKey(
+        ContactFormBase,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        default=None,
+        editable=True,
+        limit_choices_to={'form_type': 'mentorcontactform'},
+        related_name='mentorship_requests',
+        verbose_name='Mentor',
+    )
+    meeting = models.JSONField(
+        null=True,
+        blank=True,
+        default=None,
+        editable=True,
+        unique=False,
+        verbose_name='Weekly Meeting Time',
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        null=False,
+        blank=True,
+        editable=True,
+        unique=False,
+        verbose_name='Date/Time Created'
+    )
+
+    def __str__(self):
+        """Defines the string representation of a MentorshipRequest object to be the name of the group of students,
+        followed by the number of students in the group.
+        """
+        return f'{self.name} ({self.students})'
+
+    class Meta:
+        """Defines the long-form name to label mentorship requests as well as the order in which they should appear
+        when queried from the database.
+        """
+        verbose_name = 'Mentorship Request'
+        ordering = ['-created']
+
+
+class SpamToken(models.Model):
+    """A Django database model which represents a token (e.g., a word) that the contact form spam classifier has seen,
+    along with the number of spam and non-spam contact forms which contained it (see the apps.contact.spam module).
+
+    Attributes:  # noqa
+        token: A CharField containing the token.
+
+        spam: A PositiveIntegerField containing the number of contact forms trained as spam which contained the token.
+
+        ham: A PositiveIntegerField containing the number of contact forms trained as not spam which contained the
+        token.
+    """
+    token = models.CharField(
+        max_length=100,
+        null=False,
+        blank=False,
+        editable=False,
+        unique=True,
+        verbose_name='Token',
+    )
+    spam = models.PositiveIntegerField(
+        null=False,
+        blank=False,
+        default=0,
+        editable=False,
+        unique=False,
+        verbose_name='Spam Forms',
+    )
+    ham = models.PositiveIntegerField(
+        null=False,
+        blank=False,
+        default=0,
+        editable=False,
+        unique=False,
+        verbose_name='Non-Spam Forms',
+    )
+
+    def __str__(self):
+        """Defines the string representation of a SpamToken object to be the token itself.
+        """
+        return self.token
+
+    class Meta:
+        """Defines the long-form name to label spam classifier tokens.
+        """
+        verbose_name = 'Spam Classifier Token'
+
+
 class AdminComment(models.Model):
     """A Django database model which represents a comment left by an administrator which pertains to a submitted contact
     form.
     """
-    _SUPPORTED_RELATION_TYPES = (
-        'GuestSpeakerContactForm', 'MentorContactForm', 'EventOrganizerContactForm', 'PartnerContactForm',
-    )
+    _SUPPORTED_RELATION_TYPES = CONTACT_FORM_LABELS
 
     first_name = models.CharField(
         max_length=80,
@@ -496,11 +768,14 @@ class AdminComment(models.Model):
     form = GenericForeignKey('form_type', 'form_id')
 
     def clean(self):
-        """This method defines custom ContactInfo model validation logic.
+        """This method defines custom AdminComment model validation logic.
+
+        The type of the related ``form`` is checked against the supported relation types using only its
+        ``form_type_id``, so that the related form is not loaded from the database.
         """
-        if self.form.__class__.__name__ not in self._SUPPORTED_RELATION_TYPES:
+        if not validate_content_type(self.form_type_id, self._SUPPORTED_RELATION_TYPES):
             raise ValidationError(
-                f'Unsupported form type "{type(self.form_type.__class__.__name__)}" supplied for '
+                f'Unsupported form type "{content_type_name(self.form_type_id)}" supplied for '
                 + 'GenericForeignKey relation.'
             )
 
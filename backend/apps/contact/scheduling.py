@@ -0,0 +1,204 @@
+"""This module contains the solver which schedules pending guest speakers into free time slots as draft events.
+
+Each guest speaker contact form lists up to three dates and times when the speaker is available to present, and the
+length of their presentation. The existing events (including the occurrences of recurring events and draft events)
+which overlap the speakers' options are loaded into an interval index of busy time with a single query, so checking
+whether an option is free takes logarithmic time. Speakers with the fewest options are scheduled first, each into their
+first free option, and each proposal is added to the index so that proposals never conflict with each other.
+
+Proposals are stored as draft events, which are linked to the speaker's contact form and created in bulk. The solver is
+incremental: only guest speakers without a scheduled event are considered, so publishing a draft event does not change
+any other proposal, and deleting one only causes its speaker to be scheduled again on the next run. Each run locks the
+guest speakers it schedules until its draft events are created, and skips those locked by a concurrent run, so a guest
+speaker is never scheduled twice.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.contact.export import chunks
+from apps.contact.models import ContactFormBase
+from apps.contact.storage import typed_forms
+from apps.events.models import Event
+
+# The number of guest speaker contact forms which are read from the database at a time.
+CHUNK_SIZE = 500
+
+
+class IntervalIndex:
+    """An index of busy time, which is stored as a sorted list of disjoint intervals.
+
+    Attributes:  # noqa
+        starts: A sorted list containing the start of each interval.
+
+        ends: A list containing the end of each interval, in the same order as ``starts``.
+    """
+    __slots__ = ('starts', 'ends')
+
+    def __init__(self, intervals=()):
+        """Initializes the index with an iterable of (start, end) tuples.
+        """
+        self.starts, self.ends = [], []
+        for start, end in intervals:
+            self.add(start, end)
+
+    def overlaps(self, start, end):
+        """Returns True if an interval overlaps the busy time. Intervals which only touch the busy time do not overlap
+        it.
+        """
+        i = bisect_right(self.starts, start)
+        if i and self.ends[i - 1] > start:
+            return True
+        return i < len(self.starts) and self.starts[i] < end
+
+    def add(self, start, end):
+        """Adds an interval to the busy time, merging it with the intervals which it overlaps or touches.
+        """
+        i = bisect_left(self.starts, start)
+        if i and self.ends[i - 1] >= start:
+            i -= 1
+            start = self.starts[i]
+
+        j = i
+        while j < len(self.starts) and self.starts[j] <= end:
+            end = max(end, self.ends[j])
+            j += 1
+
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+
+
+def speaker_options(form, after=None):
+    """Converts the ``availability`` of a guest speaker contact form into the intervals of its possible presentations.
+
+    Args:
+        form: A GuestSpeakerContactForm object.
+        after: The date and time after which presentations may start. Defaults to the current date and time.
+
+    Returns:
+        A list of (start, end) tuples of aware datetimes, in the speaker's order of preference. Options which are
+        invalid or which start before `after` are skipped. Times without a UTC offset are in the ``TIME_ZONE``
+        setting's time zone.
+    """
+    after = after or timezone.now()
+    length = timedelta(minutes=form.length)
+
+    options = []
+    for option in form.availability or ():
+        try:
+            start = datetime.fromisoformat(f'{option["date"]}T{option["time"]}'.replace('Z', '+00:00'))
+        except (KeyError, TypeError, ValueError):
+            continue
+
+        if timezone.is_naive(start):
+            start = timezone.make_aware(start)
+        if start > after:
+            options.append((start, start + length))
+
+    return options
+
+
+def busy_index(after, before):
+    """Loads the existing events, including draft events and the occurrences of recurring events, which start within
+    a window into an interval index with a single query per kind of event.
+
+    Args:
+        after: The start of the window. Events which started up to a day earlier are included, since they may still be
+        in progress.
+        before: The end of the window.
+
+    Returns:
+        An IntervalIndex.
+    """
+    events = Event.objects.only('start', 'end', 'recurrence', 'recurrence_end')
+    return IntervalIndex(
+        (event.start, event.end) for event in events.occurrences(after=after - timedelta(days=1), before=before)
+    )
+
+
+def pending_speakers(queryset=None):
+    """Loads and locks the guest speaker contact forms which were not ignored and do not have a scheduled event. Contact
+    forms which are locked by another transaction (i.e., which are being scheduled concurrently) are skipped.
+
+    This must be called in a transaction, which holds the locks.
+
+    Args:
+        queryset: An optional queryset of ContactFormBase objects to which the guest speakers are limited.
+
+    Returns:
+        A list of GuestSpeakerContactForm objects.
+    """
+    rows = ContactFormBase.objects.non_polymorphic().filter(
+        form_type='guestspeakercontactform', ignored=False, scheduled_events__isnull=True
+    )
+    if queryset is not None:
+        rows = rows.filter(pk__in=queryset.values('pk'))
+    rows = rows.select_for_update(skip_locked=True, of=('self',)).order_by('pk')
+
+    forms = []
+    for chunk in chunks(rows, CHUNK_SIZE):
+        forms += typed_forms(chunk).values()
+    return forms
+
+
+def propose(forms, index):
+    """Proposes a conflict-free presentation time for each of a list of guest speakers.
+
+    Args:
+        forms: A list of GuestSpeakerContactForm objects.
+        index: An IntervalIndex of busy time, to which the proposed presentations are added.
+
+    Returns:
+        A tuple containing a list of (form, start, end) tuples and a list of the forms which could not be scheduled.
+    """
+    options = {form.pk: speaker_options(form) for form in forms}
+
+    proposals, unscheduled = [], []
+    for form in sorted(forms, key=lambda form: (len(options[form.pk]), form.submitted, form.pk)):
+        for start, end in options[form.pk]:
+            if not index.overlaps(start, end):
+                index.add(start, end)
+                proposals.append((form, start, end))
+                break
+        else:
+            unscheduled.append(form)
+
+    return proposals, unscheduled
+
+
+def schedule_speakers(queryset=None):
+    """Schedules every pending guest speaker into a free time slot, and creates a draft event for each proposal in
+    bulk, in a single transaction. Draft events are not announced until they are published.
+
+    Args:
+        queryset: An optional queryset of ContactFormBase objects to which the guest speakers are limited.
+
+    Returns:
+        A tuple containing a list of the created Event objects and a list of the GuestSpeakerContactForm objects which
+        could not be scheduled.
+    """
+    with transaction.atomic():
+        forms = pending_speakers(queryset)
+        intervals = [option for form in forms for option in speaker_options(form)]
+        if not intervals:
+            return [], forms
+
+        index = busy_index(min(start for start, _ in intervals), max(end for _, end in intervals))
+        proposals, unscheduled = propose(forms, index)
+
+        events = [
+            Event(
+                type=Event.EventType.GUEST_SPEAKER,
+                topics=[form.topic] if form.topic.strip() else [],
+                start=start,
+                end=end,
+                draft=True,
+                guest_speaker_id=form.pk,
+            )
+            for form, start, end in proposals
+        ]
+        Event.objects.bulk_create(events, batch_size=CHUNK_SIZE)
+
+    return events, unscheduled
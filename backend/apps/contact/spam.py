@@ -0,0 +1,242 @@
+"""This module contains the naive Bayes classifier which scores how likely contact form submissions are to be spam.
+
+The classifier is trained from the decisions of administrators: contact forms which were ignored are spam, and contact
+forms which were reviewed without being ignored are not. For every token (i.e., word, URL domain, or other feature) it
+has seen, the classifier stores the number of spam and non-spam forms which contained the token. Training is
+incremental: each form remembers the label it was trained with in its ``spam_label`` field, so when an administrator
+changes their decision, only that form's counts are moved from one label to the other.
+
+Forms are scored in batches of ``CONTACT_SPAM_BATCH_SIZE``. The counts of every token in a batch are retrieved with a
+single query, and each form's score is computed in pure Python, so scoring needs neither a GPU nor any additional
+dependencies.
+"""
+import math
+import re
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+
+from apps.contact.models import ContactFormBase, SpamToken
+
+# Matches the URLs in a submission, capturing their domains.
+URLS = re.compile(r'(?:https?://|www\.)([\w.-]+)', re.IGNORECASE)
+
+# Matches the words in a submission.
+WORDS = re.compile(r"[^\W_][\w']*")
+
+# The minimum and maximum length of a word which is used as a token.
+MIN_WORD_LENGTH = 2
+MAX_WORD_LENGTH = 40
+
+# The maximum length of a token, which is the maximum length of the SpamToken model's ``token`` field.
+MAX_TOKEN_LENGTH = 100
+
+# The maximum absolute log-likelihood ratio of a single token, so that no token can decide a score on its own.
+MAX_TOKEN_WEIGHT = 4.0
+
+
+def tokenize(form):
+    """Extracts the set of tokens from a contact form's free-text fields.
+
+    Words in the submitter's affiliation are distinguished from words in other fields, since the affiliations of
+    spammers (e.g., "SEO Services") are unlike those of other submitters. URLs are reduced to their domains, and the
+    presence of one or more URLs is a token of its own.
+
+    Args:
+        form: A contact form of any type.
+
+    Returns:
+        A set of strings.
+    """
+    tokens = set()
+    for field, text in form.spam_text().items():
+        prefix = 'affiliation:' if field == 'affiliation' else ''
+        text = text.lower()
+
+        domains = URLS.findall(text)
+        if domains:
+            tokens.add('url' if len(domains) == 1 else 'urls')
+            tokens.update(f'domain:{domain.strip(".")}' for domain in domains)
+            text = URLS.sub(' ', text)
+
+        tokens.update(
+            f'{prefix}{word}' for word in WORDS.findall(text) if MIN_WORD_LENGTH <= len(word) <= MAX_WORD_LENGTH
+        )
+
+    return {token[:MAX_TOKEN_LENGTH] for token in tokens}
+
+
+def label(form):
+    """Returns the label that a contact form should be trained with: True if it is spam, False if it is not, or None if
+    an administrator has not yet decided.
+    """
+    if form.ignored:
+        return True
+    if form.reviewed:
+        return False
+    return None
+
+
+def token_weights(tokens, spam_forms, ham_forms):
+    """Computes the log-likelihood ratio of each of a set of tokens, i.e., how strongly it indicates spam.
+
+    Args:
+        tokens: An iterable of tokens.
+        spam_forms: The number of contact forms which were trained as spam.
+        ham_forms: The number of contact forms which were trained as not spam.
+
+    Returns:
+        A dictionary mapping each token which the classifier has seen to its weight.
+    """
+    weights = {}
+    for token, spam, ham in SpamToken.objects.filter(token__in=tokens).values_list('token', 'spam', 'ham'):
+        # Laplace smoothing keeps tokens which have only been seen with one label from having an infinite weight.
+        weight = math.log((spam + 1) / (spam_forms + 2)) - math.log((ham + 1) / (ham_forms + 2))
+        weights[token] = max(-MAX_TOKEN_WEIGHT, min(MAX_TOKEN_WEIGHT, weight))
+
+    return weights
+
+
+def score_batch(forms, spam_forms, ham_forms):
+    """Scores a batch of contact forms with a single query for the classifier's token counts.
+
+    Args:
+        forms: A list of contact forms of any type.
+        spam_forms: The number of contact forms which were trained as spam, which must be positive.
+        ham_forms: The number of contact forms which were trained as not spam, which must be positive.
+
+    Returns:
+        A list containing the score of each form, which is the probability between 0 and 1 that it is spam.
+    """
+    tokens = [tokenize(form) for form in forms]
+    weights = token_weights(set().union(*tokens), spam_forms, ham_forms)
+    prior = math.log(spam_forms / ham_forms)
+
+    scores = []
+    for form_tokens in tokens:
+        log_odds = prior + sum(weights.get(token, 0.0) for token in form_tokens)
+        # The logistic function is computed in a way which cannot overflow for large negative log odds.
+        if log_odds >= 0:
+            scores.append(1 / (1 + math.exp(-log_odds)))
+        else:
+            scores.append(math.exp(log_odds) / (1 + math.exp(log_odds)))
+
+    return scores
+
+
+def trained_counts():
+    """Returns a tuple containing the number of contact forms which were trained as spam and as not spam.
+    """
+    counts = dict(
+        ContactFormBase.objects.non_polymorphic().order_by().filter(spam_label__isnull=False).values(
+            'spam_label'
+        ).annotate(count=Count('pk')).values_list('spam_label', 'count')
+    )
+    return counts.get(True, 0), counts.get(False, 0)
+
+
+def score_forms(queryset, batch_size=None):
+    """Scores every contact form in a queryset, in batches, and stores the scores in their ``spam_score`` fields.
+
+    Each batch is retrieved with keyset pagination and its scores are stored with a single UPDATE statement.
+
+    Args:
+        queryset: A queryset of ContactFormBase objects.
+        batch_size: The number of forms scored at a time. Defaults to the ``CONTACT_SPAM_BATCH_SIZE`` setting.
+
+    Returns:
+        The number of contact forms which were scored. No forms are scored until the classifier has been trained with
+        both spam and non-spam forms.
+    """
+    spam_forms, ham_forms = trained_counts()
+    if not (spam_forms and ham_forms):
+        return 0
+
+    batch_size = batch_size or settings.CONTACT_SPAM_BATCH_SIZE
+    scored, last = 0, 0
+    while True:
+        forms = list(queryset.filter(pk__gt=last).order_by('pk')[:batch_size])
+        if not forms:
+            break
+
+        for form, score in zip(forms, score_batch(forms, spam_forms, ham_forms)):
+            form.spam_score = score
+        ContactFormBase.objects.non_polymorphic().bulk_update(forms, ['spam_score'])
+
+        scored += len(forms)
+        last = forms[-1].pk
+
+    return scored
+
+
+def train(batch_size=None):
+    """Incrementally trains the classifier with every contact form whose label has changed since it was last trained.
+
+    The token counts of a form which was previously trained with a different label are moved to its new label, and
+    the token counts of a form which is no longer labeled (e.g., because it was marked as not reviewed) are removed.
+
+    Args:
+        batch_size: The number of forms trained at a time. Defaults to the ``CONTACT_SPAM_BATCH_SIZE`` setting.
+
+    Returns:
+        The number of contact forms which were trained.
+    """
+    batch_size = batch_size or settings.CONTACT_SPAM_BATCH_SIZE
+    changed = ContactFormBase.objects.filter(
+        Q(ignored=True) & ~Q(spam_label=True)
+        | Q(ignored=False, reviewed=True) & ~Q(spam_label=False)
+        | Q(ignored=False, reviewed=False, spam_label__isnull=False)
+    ).order_by('pk')
+
+    trained = 0
+    while True:
+        with transaction.atomic():
+            forms = list(changed[:batch_size])
+            if not forms:
+                break
+
+            # The change in the number of spam and non-spam forms containing each token.
+            deltas = defaultdict(lambda: [0, 0])
+            labels = defaultdict(list)
+            for form in forms:
+                new_label = label(form)
+                for token in tokenize(form):
+                    if form.spam_label is not None:
+                        deltas[token][0 if form.spam_label else 1] -= 1
+                    if new_label is not None:
+                        deltas[token][0 if new_label else 1] += 1
+                labels[new_label].append(form.pk)
+
+            update_token_counts(deltas)
+            for new_label, pks in labels.items():
+                ContactFormBase.objects.non_polymorphic().filter(pk__in=pks).update(spam_label=new_label)
+
+        trained += len(forms)
+
+    return trained
+
+
+def update_token_counts(deltas):
+    """Applies changes to the classifier's token counts, creating the tokens which it has not yet seen and deleting
+    those which are no longer contained in any trained form.
+
+    Args:
+        deltas: A dictionary mapping tokens to lists containing the change in their spam and non-spam counts.
+    """
+    tokens = {token.token: token for token in SpamToken.objects.select_for_update().filter(token__in=deltas)}
+
+    created, unused = [], []
+    for token, (spam, ham) in deltas.items():
+        if token in tokens:
+            tokens[token].spam = max(tokens[token].spam + spam, 0)
+            tokens[token].ham = max(tokens[token].ham + ham, 0)
+            if not (tokens[token].spam or tokens[token].ham):
+                unused.append(tokens.pop(token).pk)
+        elif spam > 0 or ham > 0:
+            created.append(SpamToken(token=token, spam=max(spam, 0), ham=max(ham, 0)))
+
+    SpamToken.objects.bulk_update(tokens.values(), ['spam', 'ham'], batch_size=settings.CONTACT_SPAM_BATCH_SIZE)
+    SpamToken.objects.bulk_create(created, batch_size=settings.CONTACT_SPAM_BATCH_SIZE)
+    SpamToken.objects.filter(pk__in=unused).delete()
@@ -0,0 +1,240 @@
+"""This module contains the storage modes of contact forms.
+
+By default (the ``multi-table`` storage mode), each contact form is stored in two tables: the fields which are common to
+all contact forms are stored in the ContactFormBase table, and the fields which are specific to the type of form are
+stored in the table of the concrete model (e.g., MentorContactForm). Listing contact forms therefore takes one query for
+the ContactFormBase table plus one query per type of form, and submitting a contact form inserts two rows.
+
+In the ``single-table`` storage mode, newly submitted contact forms are only stored in the ContactFormBase table. The
+fields which are specific to the type of form are stored in its ``details`` JSONB column, and the type of form is
+stored in its ``form_type`` column. Since the polymorphic content type of these rows is ContactFormBase itself, listing
+them takes a single query. The `ContactFormBase.typed` method converts a row into an instance of its concrete model,
+whose fields have their usual Python types and which is validated in the usual way.
+
+Generic relations (i.e., contact information and administrator comments) always refer to the content type of the
+concrete model, so they do not need to be changed when contact forms are converted between the storage modes with the
+`convert_contact_forms` management command.
+"""
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+
+# The names of the storage modes.
+MULTI_TABLE = 'multi-table'
+SINGLE_TABLE = 'single-table'
+STORAGE_MODES = (MULTI_TABLE, SINGLE_TABLE)
+
+
+def single_table_enabled():
+    """Returns True if newly submitted contact forms are stored in the single-table storage mode.
+    """
+    return settings.CONTACT_FORM_STORAGE == SINGLE_TABLE
+
+
+def base_model():
+    """Returns the ContactFormBase model. It is retrieved from the app registry since the models module imports this
+    module.
+    """
+    return apps.get_model('contact', 'ContactFormBase')
+
+
+def form_models():
+    """Returns a list of the concrete contact form models (i.e., the subclasses of the ContactFormBase model).
+    """
+    base = base_model()
+    return [
+        model for model in apps.get_app_config('contact').get_models() if issubclass(model, base) and model is not base
+    ]
+
+
+def is_single_table(row):
+    """Returns True if a ContactFormBase object (which was retrieved without upcasting it) is stored in the
+    single-table storage mode.
+    """
+    return bool(row.form_type) and row.polymorphic_ctype_id == ContentType.objects.get_for_model(base_model()).id
+
+
+def detail_fields(model):
+    """Returns a list of the concrete fields of a contact form model which are not fields of the ContactFormBase model,
+    excluding its link to its ContactFormBase row.
+    """
+    return [field for field in model._meta.local_concrete_fields if not field.primary_key]
+
+
+def base_fields():
+    """Returns a list of the concrete fields of the ContactFormBase model which are stored with every contact form.
+    """
+    return [field for field in base_model()._meta.concrete_fields if not field.primary_key]
+
+
+def to_details(form):
+    """Converts the fields of a contact form which are specific to its type into a dictionary to store in its
+    ``details`` field. Dates, times, and other values which are not JSON types are serialized by the field's encoder.
+    """
+    return {field.name: field.value_from_object(form) for field in detail_fields(type(form))}
+
+
+def materialize(row):
+    """Converts a contact form stored in the single-table storage mode into an instance of its concrete model.
+
+    The values in the row's ``details`` field are converted to their usual Python types by the concrete model's fields,
+    and fields which are missing from ``details`` (e.g., because they were added after the form was submitted) have
+    their default values. No queries are made.
+
+    Args:
+        row: A ContactFormBase object whose ``form_type`` is the name of a concrete contact form model.
+
+    Returns:
+        An instance of the concrete model, which is saved back to the single-table storage mode when it is saved.
+    """
+    model = apps.get_model('contact', row.form_type)
+    values = {field.attname: getattr(row, field.attname) for field in row._meta.concrete_fields}
+    values[model._meta.pk.attname] = row.pk
+    for field in detail_fields(model):
+        if field.name in row.details:
+            values[field.attname] = field.to_python(row.details[field.name])
+        else:
+            values[field.attname] = field.get_default()
+
+    form = model(**values)
+    form._state.adding = False
+    form._state.db = row._state.db
+    form._single_table = True
+    return form
+
+
+def typed_forms(rows):
+    """Converts a chunk of contact forms into instances of their concrete models, with one query per concrete model
+    for the contact forms which are stored in the multi-table storage mode.
+
+    Args:
+        rows: A list of ContactFormBase objects which were retrieved without upcasting them.
+
+    Returns:
+        A dictionary mapping the primary key of each contact form to an instance of its concrete model.
+    """
+    models = {model._meta.model_name: model for model in form_models()}
+    forms, multi_table = {}, defaultdict(list)
+    for row in rows:
+        if is_single_table(row):
+            forms[row.pk] = materialize(row)
+        elif row.form_type in models:
+            multi_table[models[row.form_type]].append(row.pk)
+
+    for model, pks in multi_table.items():
+        forms.update((form.pk, form) for form in model.objects.non_polymorphic().filter(pk__in=pks))
+
+    return forms
+
+
+def save_single_table(form, force_insert=False, force_update=False, using=None, update_fields=None):
+    """Saves a contact form in the single-table storage mode, i.e., only in the ContactFormBase table.
+
+    Args:
+        form: An instance of a concrete contact form model.
+        force_insert: See `Model.save`.
+        force_update: See `Model.save`.
+        using: See `Model.save`.
+        update_fields: See `Model.save`. The names of fields which are specific to the type of form are replaced with
+        ``details``.
+    """
+    model = type(form)
+    if update_fields is not None:
+        detail_names = {field.name for field in detail_fields(model)}
+        update_fields = {'details' if name in detail_names else name for name in update_fields}
+
+    # The row's polymorphic content type is set to that of ContactFormBase when it is saved.
+    row = base_model()(
+        pk=form.pk,
+        details=to_details(form),
+        **{
+            field.attname: getattr(form, field.attname) for field in base_fields()
+            if field.name not in ('polymorphic_ctype', 'details')
+        }
+    )
+    row._state.adding = form._state.adding
+    row.save(force_insert=force_insert, force_update=force_update, using=using, update_fields=update_fields)
+
+    form.pk = row.pk
+    form.polymorphic_ctype_id = row.polymorphic_ctype_id
+    form.submitted = row.submitted
+    form._state.adding = False
+    form._state.db = row._state.db
+    form._single_table = True
+
+
+def convert_to_single_table(model, batch_size):
+    """Converts every contact form of a concrete model which is stored in the multi-table storage mode into the
+    single-table storage mode.
+
+    Args:
+        model: A concrete contact form model.
+        batch_size: The number of contact forms converted in each transaction.
+
+    Returns:
+        The number of contact forms which were converted.
+    """
+    base = base_model()
+    base_content_type = ContentType.objects.get_for_model(base)
+    table = connection.ops.quote_name(model._meta.db_table)
+    column = connection.ops.quote_name(model._meta.pk.column)
+
+    converted = 0
+    while True:
+        with transaction.atomic():
+            forms = list(model.objects.order_by('pk')[:batch_size])
+            if not forms:
+                break
+
+            rows = [
+                base(pk=form.pk, polymorphic_ctype=base_content_type, form_type=model._meta.model_name,
+                     details=to_details(form))
+                for form in forms
+            ]
+            base.objects.non_polymorphic().bulk_update(rows, ['polymorphic_ctype', 'form_type', 'details'])
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {table} WHERE {column} = ANY(%s)', [[form.pk for form in forms]])
+
+        converted += len(forms)
+
+    return converted
+
+
+def convert_to_multi_table(model, batch_size):
+    """Converts every contact form of a concrete model which is stored in the single-table storage mode into the
+    multi-table storage mode.
+
+    Args:
+        model: A concrete contact form model.
+        batch_size: The number of contact forms converted in each transaction.
+
+    Returns:
+        The number of contact forms which were converted.
+    """
+    base = base_model()
+    content_type = ContentType.objects.get_for_model(model)
+    rows = base.objects.non_polymorphic().filter(
+        polymorphic_ctype=ContentType.objects.get_for_model(base), form_type=model._meta.model_name
+    ).order_by('pk')
+
+    converted = 0
+    while True:
+        with transaction.atomic():
+            forms = [materialize(row) for row in rows[:batch_size]]
+            if not forms:
+                break
+
+            for form in forms:
+                # A raw save only inserts the row into the concrete model's table, since the ContactFormBase row
+                # already exists.
+                form.save_base(raw=True, force_insert=True)
+            base.objects.non_polymorphic().filter(pk__in=[form.pk for form in forms]).update(
+                polymorphic_ctype=content_type, details={}
+            )
+
+        converted += len(forms)
+
+    return converted
@@ -0,0 +1,74 @@
+"""This module contains asynchronous Celery tasks for the contact application."""
+from celery import shared_task
+
+
+@shared_task
+def detect_duplicate_submitters():
+    """Groups the submitted contact forms which are likely to be from the same person, so that they can be reviewed
+    together in the Django admin site.
+
+    Returns:
+        The number of contact forms whose group of possible duplicates changed.
+    """
+    from apps.contact.dedupe import detect_duplicates
+    return detect_duplicates()
+
+
+@shared_task
+def score_contact_forms():
+    """Scores how likely each contact form which has not yet been scored is to be spam.
+
+    This task is run every minute by Celery beat, so that a wave of spam submissions is scored in large batches rather
+    than one submission at a time.
+
+    Returns:
+        The number of contact forms which were scored.
+    """
+    from apps.contact.models import ContactFormBase
+    from apps.contact.spam import score_forms
+    return score_forms(ContactFormBase.objects.filter(spam_score__isnull=True))
+
+
+@shared_task
+def train_spam_classifier():
+    """Incrementally trains the spam classifier with the contact forms which administrators have reviewed or ignored
+    since it was last trained, then rescores the contact forms which have not yet been reviewed.
+
+    Returns:
+        The number of contact forms which were trained.
+    """
+    from apps.contact.models import ContactFormBase
+    from apps.contact.spam import score_forms, train
+
+    trained = train()
+    if trained:
+        score_forms(ContactFormBase.objects.filter(spam_label__isnull=True))
+
+    return trained
+
+
+@shared_task
+def schedule_guest_speakers():
+    """Proposes a conflict-free presentation time for each guest speaker who has not been scheduled, as draft events
+    which administrators can publish.
+
+    Returns:
+        The number of draft events which were created.
+    """
+    from apps.contact.scheduling import schedule_speakers
+    events, _ = schedule_speakers()
+    return len(events)
+
+
+@shared_task
+def send_contact_digest():
+    """Sends the administrators one summary email per type of contact form which was submitted since the last digest.
+
+    This task is run every 15 minutes by Celery beat, so that a wave of submissions results in a single email per type
+    of contact form rather than one email per submission.
+
+    Returns:
+        The number of contact forms which were summarized.
+    """
+    from apps.contact.digest import send_digest
+    return send_digest()
@@ -1,2 +1,3 @@
 from .model import *
 from .api import *
+from .task import *
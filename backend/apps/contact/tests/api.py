@@ -1,11 +1,22 @@
 """This module contains unit tests for the contact application's API serializers and viewsets."""
-from django.test import tag
+import csv
+import io
+import json
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import tag, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 
-from apps.contact.models import GuestSpeakerContactForm, MentorContactForm, EventOrganizerContactForm, \
-    PartnerContactForm
+from apps.contact.models import ContactFormBase, GuestSpeakerContactForm, MentorContactForm, \
+    EventOrganizerContactForm, PartnerContactForm, MentorshipRequest, AdminComment
+from core.models import ContactInfo
 from core.testcases import VerboseAPITestCase, Tags
 
 
@@ -231,3 +242,367 @@ class PartnerContactFormEndpointTest(VerboseAPITestCase):
 
         response = self.client.get(f'{url}/{self.form.pk}/')
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ContactFormIdempotencyTest(VerboseAPITestCase):
+    """A test case class which contains unit tests for idempotent contact form submissions.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing idempotent contact form submissions...'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the test data for the test case once when the test case class is being prepared to run.
+        """
+        cls.url = reverse('partner-contact-form-list')
+        cls.data = {
+            'first_name': 'John',
+            'last_name': 'Smith',
+            'min_org_size': 100,
+            'max_org_size': 1000,
+            'contacts': [{'type': 'EM', 'preferred': True, 'value': 'test@gmail.com'}],
+        }
+
+    def setUp(self):
+        """Clear the stored responses before each test.
+        """
+        cache.clear()
+
+    @tag(Tags.API)
+    def test_idempotency_key(self):
+        """Ensure that a retried submission with the same `Idempotency-Key` header returns the original response
+        without any queries, and that a submission with a different key creates a new contact form.
+        """
+        response = self.client.post(self.url, data=self.data, format='json', HTTP_IDEMPOTENCY_KEY='key-1')
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+        with self.assertNumQueries(0):
+            retry = self.client.post(self.url, data=self.data, format='json', HTTP_IDEMPOTENCY_KEY='key-1')
+        self.assertEqual(status.HTTP_201_CREATED, retry.status_code)
+        self.assertEqual('true', retry['Idempotent-Replayed'])
+        self.assertEqual(response.data, retry.data)
+        self.assertEqual(1, PartnerContactForm.objects.count())
+        self.assertEqual(1, ContactInfo.objects.count())
+
+        response = self.client.post(self.url, data=self.data, format='json', HTTP_IDEMPOTENCY_KEY='key-2')
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertEqual(2, PartnerContactForm.objects.count())
+
+    @tag(Tags.API)
+    def test_content_hash(self):
+        """Ensure that submissions without an `Idempotency-Key` header which only differ in formatting are treated as
+        the same submission.
+        """
+        self.client.post(self.url, data=self.data, format='json')
+        retry = self.client.post(self.url, data={**self.data, 'first_name': ' JOHN '}, format='json')
+        self.assertEqual('true', retry['Idempotent-Replayed'])
+        self.assertEqual(1, PartnerContactForm.objects.count())
+
+        self.client.post(self.url, data={**self.data, 'first_name': 'Jane'}, format='json')
+        self.assertEqual(2, PartnerContactForm.objects.count())
+
+    @tag(Tags.API)
+    def test_replay_from_database(self):
+        """Ensure that a retried submission returns the original response once it has expired from the cache.
+        """
+        response = self.client.post(self.url, data=self.data, format='json', HTTP_IDEMPOTENCY_KEY='key')
+        cache.clear()
+
+        retry = self.client.post(self.url, data=self.data, format='json', HTTP_IDEMPOTENCY_KEY='key')
+        self.assertEqual(status.HTTP_201_CREATED, retry.status_code)
+        self.assertEqual('true', retry['Idempotent-Replayed'])
+        self.assertEqual(response.data, retry.data)
+        self.assertEqual(1, PartnerContactForm.objects.count())
+
+    @tag(Tags.API)
+    def test_idempotency_key_reused(self):
+        """Ensure that a submission which reuses the `Idempotency-Key` header of a different submission is rejected,
+        whether the original response is stored in the cache or rebuilt from the database.
+        """
+        self.client.post(self.url, data=self.data, format='json', HTTP_IDEMPOTENCY_KEY='key')
+        for _ in range(2):
+            response = self.client.post(
+                self.url, data={**self.data, 'first_name': 'Jane'}, format='json', HTTP_IDEMPOTENCY_KEY='key'
+            )
+            self.assertEqual(status.HTTP_422_UNPROCESSABLE_ENTITY, response.status_code)
+            self.assertEqual(1, PartnerContactForm.objects.count())
+            cache.clear()
+
+    @tag(Tags.API)
+    def test_expired_key(self):
+        """Ensure that a submission whose original was made more than ``CONTACT_IDEMPOTENCY_TTL`` seconds ago, and
+        whose response has expired from the cache, creates a new contact form.
+        """
+        self.client.post(self.url, data=self.data, format='json')
+        ContactFormBase.objects.update(submitted=timezone.now() - timedelta(days=2))
+        cache.clear()
+
+        response = self.client.post(self.url, data=self.data, format='json')
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertNotIn('Idempotent-Replayed', response)
+        self.assertEqual(2, PartnerContactForm.objects.count())
+
+    @tag(Tags.API)
+    def test_idempotency_key_too_long(self):
+        """Ensure that a submission with an overly long `Idempotency-Key` header is rejected.
+        """
+        response = self.client.post(self.url, data=self.data, format='json', HTTP_IDEMPOTENCY_KEY='k' * 256)
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertEqual(0, PartnerContactForm.objects.count())
+
+    @tag(Tags.API)
+    @override_settings(CONTACT_FORM_STORAGE='single-table')
+    def test_replay_single_table(self):
+        """Ensure that a retried submission returns the original response when the original contact form is stored in
+        the single-table storage mode.
+        """
+        response = self.client.post(self.url, data=self.data, format='json', HTTP_IDEMPOTENCY_KEY='key')
+        cache.clear()
+
+        retry = self.client.post(self.url, data=self.data, format='json', HTTP_IDEMPOTENCY_KEY='key')
+        self.assertEqual('true', retry['Idempotent-Replayed'])
+        self.assertEqual(response.data, retry.data)
+        self.assertEqual(0, PartnerContactForm.objects.count())
+        self.assertEqual(1, ContactFormBase.objects.count())
+
+
+class ContactFormStorageEndpointTest(VerboseAPITestCase):
+    """A test case class which contains unit tests for the contact form API endpoints' administrator actions in both
+    storage modes.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing contact form API endpoints in both storage modes...'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the test data for the test case once when the test case class is being prepared to run.
+        """
+        cls.user = get_user_model().objects.create_superuser('admin@test.com', 'password')
+        cls.url = reverse('partner-contact-form-list')
+
+        cls.multi_table = PartnerContactForm.objects.create(first_name='John', last_name='Smith', min_org_size=10)
+        with override_settings(CONTACT_FORM_STORAGE='single-table'):
+            cls.single_table = PartnerContactForm.objects.create(first_name='Jane', last_name='Doe', min_org_size=20)
+        EventOrganizerContactForm.objects.create(first_name='Jack', last_name='Jones', event_type='Talk')
+
+    def setUp(self):
+        """Log in as an administrator before each test.
+        """
+        self.client.force_login(self.user)
+
+    @tag(Tags.API)
+    def test_list(self):
+        """Ensure that contact forms of the endpoint's type are listed in both storage modes, with their type-specific
+        fields.
+        """
+        response = self.client.get(f'{self.url}/')
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual({10, 20}, {form['min_org_size'] for form in response.data})
+
+    @tag(Tags.API)
+    def test_retrieve_update_delete(self):
+        """Ensure that a contact form stored in the single-table storage mode can be retrieved, updated, and deleted.
+        """
+        url = f'{self.url}/{self.single_table.pk}/'
+        response = self.client.get(url)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(20, response.data['min_org_size'])
+
+        response = self.client.patch(url, data={'min_org_size': 30}, format='json')
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        form = ContactFormBase.objects.non_polymorphic().get(pk=self.single_table.pk).typed()
+        self.assertEqual(30, form.min_org_size)
+        self.assertEqual(1, PartnerContactForm.objects.count())
+
+        response = self.client.delete(url)
+        self.assertEqual(status.HTTP_204_NO_CONTENT, response.status_code)
+        self.assertFalse(ContactFormBase.objects.filter(pk=self.single_table.pk).exists())
+        self.assertTrue(ContactFormBase.objects.filter(pk=self.multi_table.pk).exists())
+
+
+class ContactFormAdminTest(VerboseAPITestCase):
+    """A test case class which contains unit tests for the list of submitted contact forms in the Django admin site.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing submitted contact form admin list...'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the test data for the test case once when the test case class is being prepared to run.
+        """
+        cls.user = get_user_model().objects.create_superuser('admin@test.com', 'password')
+        cls.url = reverse('admin:contact_contactformbase_changelist')
+
+        cls.partner = PartnerContactForm.objects.create(first_name='John', last_name='Smith')
+        cls.organizer = EventOrganizerContactForm.objects.create(first_name='Jane', last_name='Doe', event_type='Talk')
+        for value in ('test@gmail.com', '9195551234'):
+            ContactInfo(type=ContactInfo.InfoType.EMAIL, value=value, content_object=cls.partner).save()
+        AdminComment(first_name='Admin', last_name='User', comment='Follow up', form=cls.partner).save()
+
+    def setUp(self):
+        """Log in as an administrator before each test.
+        """
+        self.client.force_login(self.user)
+
+    @tag(Tags.API)
+    def test_changelist_annotations(self):
+        """Ensure that the list of contact forms includes the number of related contacts and comments, and that the
+        number of queries does not depend on the number or types of contact forms.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        counts = {form.pk: (form.contact_count, form.comment_count) for form in response.context['cl'].result_list}
+        self.assertEqual({self.partner.pk: (2, 1), self.organizer.pk: (0, 0)}, counts)
+
+        GuestSpeakerContactForm.objects.create(first_name='Ada', last_name='Lovelace', topic='AI/ML')
+        with self.assertNumQueries(len(queries)):
+            self.client.get(self.url)
+
+    @tag(Tags.API)
+    def test_bulk_actions(self):
+        """Ensure that the bulk admin actions mark the selected contact forms as reviewed or ignored with a single
+        UPDATE statement.
+        """
+        data = {'_selected_action': [self.partner.pk, self.organizer.pk]}
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(self.url, data={**data, 'action': 'mark_reviewed'})
+        updates = [query for query in queries.captured_queries if query['sql'].startswith('UPDATE "contact_')]
+        self.assertEqual(1, len(updates))
+        self.assertEqual(2, ContactFormBase.objects.filter(reviewed=True).count())
+
+        self.client.post(self.url, data={**data, 'action': 'mark_ignored'})
+        self.assertEqual(2, ContactFormBase.objects.filter(ignored=True).count())
+
+    @tag(Tags.API)
+    def test_export_csv(self):
+        """Ensure that the CSV export admin action streams every selected contact form with its type-specific fields,
+        contacts, and comments.
+        """
+        response = self.client.post(self.url, data={
+            '_selected_action': [self.partner.pk, self.organizer.pk], 'action': 'export_csv'
+        })
+        self.assertTrue(response.streaming)
+        self.assertEqual('text/csv', response['Content-Type'])
+
+        content = b''.join(response.streaming_content).decode('utf-8')
+        rows = {int(row['id']): row for row in csv.DictReader(io.StringIO(content))}
+        self.assertEqual({self.partner.pk, self.organizer.pk}, set(rows))
+        self.assertEqual('Talk', rows[self.organizer.pk]['event_type'])
+        self.assertEqual('', rows[self.partner.pk]['event_type'])
+        self.assertEqual({'EM: test@gmail.com', 'EM: 9195551234'}, set(rows[self.partner.pk]['contacts'].splitlines()))
+        self.assertIn('Admin User', rows[self.partner.pk]['comments'])
+
+    @tag(Tags.API)
+    def test_export_csv_formulas(self):
+        """Ensure that values which spreadsheet applications would interpret as formulas are exported as text.
+        """
+        form = PartnerContactForm.objects.create(first_name='=HYPERLINK("http://test.com")', last_name='@SUM(A1)')
+        response = self.client.post(self.url, data={'_selected_action': [form.pk], 'action': 'export_csv'})
+
+        row = next(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode('utf-8'))))
+        self.assertEqual('\'=HYPERLINK("http://test.com")', row['first_name'])
+        self.assertEqual("'@SUM(A1)", row['last_name'])
+
+    @tag(Tags.API)
+    def test_export_jsonl_command(self):
+        """Ensure that the `export_contact_forms` management command writes one JSON object per contact form.
+        """
+        output = io.StringIO()
+        call_command('export_contact_forms', format='jsonl', stdout=output)
+
+        records = {record['id']: record for record in map(json.loads, output.getvalue().splitlines())}
+        self.assertEqual({self.partner.pk, self.organizer.pk}, set(records))
+        self.assertEqual('partnercontactform', records[self.partner.pk]['form_type'])
+        self.assertEqual(2, len(records[self.partner.pk]['contacts']))
+        self.assertEqual('Follow up', records[self.partner.pk]['comments'][0]['comment'])
+
+
+class MentorshipRequestAdminTest(VerboseAPITestCase):
+    """A test case class which contains unit tests for proposing and assigning mentors in the Django admin site.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing mentorship request admin matching...'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the test data for the test case once when the test case class is being prepared to run.
+        """
+        cls.user = get_user_model().objects.create_superuser('admin@test.com', 'password')
+        cls.url = reverse('admin:contact_mentorshiprequest_match')
+
+        cls.mentor = MentorContactForm.objects.create(
+            first_name='John',
+            last_name='Smith',
+            students=4,
+            availability_start=date(2022, 12, 20),
+            weekly_minutes=120,
+            meeting_information=[{'weekday': 'Monday', 'time': '18:00:00+00:00'}]
+        )
+        cls.request = MentorshipRequest.objects.create(
+            name='Team Rocket',
+            students=3,
+            start=date(2023, 1, 9),
+            meeting_information=[{'weekday': 'Monday', 'time': '18:00:00+00:00'}]
+        )
+
+    def setUp(self):
+        """Log in as an administrator before each test.
+        """
+        self.client.force_login(self.user)
+
+    @tag(Tags.API)
+    def test_propose(self):
+        """Ensure that the proposed mentor of each request is displayed without being assigned.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertContains(response, 'Team Rocket')
+        self.assertContains(response, 'John Smith')
+        self.assertContains(response, 'Monday 18:00 UTC')
+
+        self.request.refresh_from_db()
+        self.assertIsNone(self.request.mentor_id)
+
+    @tag(Tags.API)
+    def test_assign(self):
+        """Ensure that submitting the proposals assigns exactly the displayed proposals.
+        """
+        response = self.client.get(self.url)
+        keys = [match[4] for match in response.context['matches']]
+
+        response = self.client.post(self.url, data={'match': keys})
+        self.assertRedirects(response, reverse('admin:contact_mentorshiprequest_changelist'))
+
+        self.request.refresh_from_db()
+        self.assertEqual(self.mentor.pk, self.request.mentor_id)
+        self.assertEqual({'weekday': 'Monday', 'time': '18:00:00+00:00'}, self.request.meeting)
+
+    @tag(Tags.API)
+    def test_assign_revalidates(self):
+        """Ensure that submitted proposals which can no longer be assigned, or which were not displayed, are not
+        assigned.
+        """
+        keys = [match[4] for match in self.client.get(self.url).context['matches']]
+        late = MentorshipRequest.objects.create(
+            name='Team Magma',
+            students=1,
+            start=date(2023, 1, 9),
+            meeting_information=[{'weekday': 'Monday', 'time': '18:00:00+00:00'}]
+        )
+        MentorshipRequest.objects.filter(pk=self.request.pk).update(students=5)
+
+        self.client.post(self.url, data={'match': keys + ['invalid']})
+        self.assertFalse(MentorshipRequest.objects.filter(mentor__isnull=False).exists())
+        self.assertIsNone(MentorshipRequest.objects.get(pk=late.pk).mentor_id)
@@ -1,14 +1,19 @@
 """This module contains unit tests for the contact application's Django models."""
-from datetime import timedelta
+from datetime import date, timedelta
 
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
-from django.test import tag
+from django.test import tag, override_settings
 from django.utils import timezone
 
 from apps.contact.models import (
-    GuestSpeakerContactForm, MentorContactForm, EventOrganizerContactForm, PartnerContactForm, AdminComment
+    ContactFormBase, GuestSpeakerContactForm, MentorContactForm, EventOrganizerContactForm, PartnerContactForm,
+    MentorshipRequest, AdminComment
 )
+from apps.contact.matching import Mentor, assign_matches, interval_bitmap, match, propose_matches, week_minute
+from apps.contact.storage import convert_to_multi_table, convert_to_single_table
 from apps.events.models import Event
+from core.models import ContactInfo
 from core.testcases import VerboseTestCase, Tags
 
 
@@ -687,3 +692,249 @@ class TestAdminCommentModel(VerboseTestCase):
             form=event
         )
         self.assertRaises(ValidationError, comment.full_clean)
+
+    @tag(Tags.MODEL, Tags.VALIDATION)
+    def test_clean_does_not_load_relation(self):
+        """Ensure that validating the relation of an AdminComment object does not load the related form once the
+        ContentType cache is warm.
+        """
+        form = PartnerContactForm(
+            first_name=self.first_name,
+            last_name=self.last_name,
+            min_org_size=100,
+            max_org_size=1000
+        )
+        form.save()
+        AdminComment(first_name='John', last_name='Adams', comment='Comment text', form=form).save()
+        AdminComment.objects.get().clean()
+
+        comment = AdminComment.objects.get()
+        with self.assertNumQueries(0):
+            comment.clean()
+
+
+@override_settings(CONTACT_FORM_STORAGE='single-table')
+class TestSingleTableStorage(VerboseTestCase):
+    """A Django test case class which contains unit tests for storing contact forms in the single-table storage mode.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing single-table contact form storage...'
+
+    @staticmethod
+    def mentor_form():
+        """Returns an unsaved, valid MentorContactForm.
+        """
+        return MentorContactForm(
+            first_name='John',
+            last_name='Smith',
+            students=4,
+            field_type='Industry',
+            field_name='AI/ML',
+            availability_start=date(2022, 12, 20),
+            weekly_minutes=90,
+            meeting_information=[{'weekday': 'Monday', 'time': '18:00:00+00:00'}]
+        )
+
+    @tag(Tags.MODEL)
+    def test_save(self):
+        """Ensure that contact forms are only stored in the ContactFormBase table, and that they are converted into
+        instances of their concrete model with typed, valid fields.
+        """
+        form = self.mentor_form()
+        form.save()
+
+        self.assertEqual(0, MentorContactForm.objects.count())
+        row = ContactFormBase.objects.get(pk=form.pk)
+        self.assertIs(ContactFormBase, type(row))
+        self.assertEqual('mentorcontactform', row.form_type)
+
+        typed = row.typed()
+        self.assertIsInstance(typed, MentorContactForm)
+        self.assertEqual(form.pk, typed.pk)
+        self.assertEqual(date(2022, 12, 20), typed.availability_start)
+        self.assertEqual([{'weekday': 'Monday', 'time': '18:00:00+00:00'}], typed.meeting_information)
+        self.assertNotRaises(ValidationError, typed.full_clean)
+
+    @tag(Tags.MODEL)
+    def test_update(self):
+        """Ensure that contact forms which were loaded from the single-table storage mode are saved back to it.
+        """
+        self.mentor_form().save()
+
+        form = ContactFormBase.objects.get().typed()
+        form.field_name = 'Robotics'
+        form.reviewed = True
+        form.save()
+
+        form = ContactFormBase.objects.get().typed()
+        self.assertEqual('Robotics', form.field_name)
+        self.assertTrue(form.reviewed)
+        self.assertEqual(0, MentorContactForm.objects.count())
+
+    @tag(Tags.MODEL)
+    def test_list_single_query(self):
+        """Ensure that contact forms of every type are listed with a single query.
+        """
+        self.mentor_form().save()
+        PartnerContactForm(first_name='Jane', last_name='Doe', min_org_size=10, max_org_size=100).save()
+        ContentType.objects.get_for_model(ContactFormBase)
+
+        with self.assertNumQueries(1):
+            forms = [form.typed() for form in ContactFormBase.objects.all()]
+        self.assertEqual({MentorContactForm, PartnerContactForm}, {type(form) for form in forms})
+
+    @tag(Tags.MODEL)
+    def test_convert(self):
+        """Ensure that contact forms are converted between the storage modes without losing their fields or related
+        contact information.
+        """
+        with self.settings(CONTACT_FORM_STORAGE='multi-table'):
+            self.mentor_form().save()
+        self.mentor_form().save()
+        for form in ContactFormBase.objects.all():
+            ContactInfo(type=ContactInfo.InfoType.EMAIL, value='test@gmail.com', content_object=form.typed()).save()
+
+        self.assertEqual(1, convert_to_single_table(MentorContactForm, batch_size=1))
+        self.assertEqual(0, MentorContactForm.objects.count())
+        self.assertEqual(2, ContactFormBase.objects.count())
+
+        self.assertEqual(2, convert_to_multi_table(MentorContactForm, batch_size=1))
+        for form in MentorContactForm.objects.all():
+            self.assertEqual(date(2022, 12, 20), form.availability_start)
+            self.assertEqual(1, form.contacts.count())
+
+
+class TestMentorMatching(VerboseTestCase):
+    """A Django test case class which contains unit tests for matching mentorship requests with mentors.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing mentor matching...'
+
+    @staticmethod
+    def mentor_form(pk=None, students=4, weekly_minutes=120, meeting_information=None):
+        """Returns a valid MentorContactForm, which is unsaved unless `pk` is None.
+        """
+        form = MentorContactForm(
+            pk=pk,
+            first_name='John',
+            last_name='Smith',
+            students=students,
+            field_type='Industry',
+            field_name='AI/ML',
+            availability_start=date(2022, 12, 20),
+            weekly_minutes=weekly_minutes,
+            meeting_information=meeting_information or [{'weekday': 'Monday', 'time': '18:00:00+00:00'}]
+        )
+        if pk is None:
+            form.save()
+        return form
+
+    @staticmethod
+    def mentorship_request(pk=None, students=2, meeting_information=None):
+        """Returns a valid MentorshipRequest, which is unsaved unless `pk` is None.
+        """
+        request = MentorshipRequest(
+            pk=pk,
+            name='Team',
+            students=students,
+            start=date(2023, 1, 9),
+            meeting_information=meeting_information or [{'weekday': 'Monday', 'time': '18:00:00+00:00'}]
+        )
+        if pk is None:
+            request.save()
+        return request
+
+    @tag(Tags.MODEL)
+    def test_weekly_bitmap(self):
+        """Ensure that weekday/time objects are converted to minutes of the week in UTC, and that intervals which
+        overlap the end of the week wrap around to its start.
+        """
+        self.assertEqual(18 * 60, week_minute('Monday', '18:00:00+00:00'))
+        self.assertEqual(18 * 60, week_minute('Monday', '13:00:00-05:00'))
+        self.assertEqual(30, week_minute('Sunday', '23:30:00-01:00'))
+        self.assertIsNone(week_minute('Someday', '18:00:00+00:00'))
+        self.assertIsNone(week_minute('Monday', 'noon'))
+
+        self.assertEqual(0b1111 << 72, interval_bitmap(18 * 60, 60))
+        self.assertEqual(0b11 | 0b11 << 670, interval_bitmap(7 * 24 * 60 - 30, 60))
+
+    @tag(Tags.MODEL)
+    def test_match_capacity(self):
+        """Ensure that mentors are not assigned more students, weekly minutes, or overlapping meetings than they are
+        available for.
+        """
+        mentors = {1: Mentor(self.mentor_form(pk=1, students=3), 60)}
+        matches, unmatched = match(mentors, [self.mentorship_request(pk=1), self.mentorship_request(pk=2)], 60)
+        self.assertEqual([1], [m.request.pk for m in matches])
+        self.assertEqual([2], [r.pk for r in unmatched])
+
+        # The second request can only meet at the time of the first request's meeting.
+        mentors = {1: Mentor(self.mentor_form(pk=1, students=6), 60)}
+        matches, unmatched = match(mentors, [self.mentorship_request(pk=1), self.mentorship_request(pk=2)], 60)
+        self.assertEqual(1, len(matches))
+
+        mentors = {1: Mentor(self.mentor_form(pk=1, students=6, weekly_minutes=90, meeting_information=[
+            {'weekday': 'Monday', 'time': '18:00:00+00:00'}, {'weekday': 'Tuesday', 'time': '18:00:00+00:00'}
+        ]), 60)}
+        requests = [
+            self.mentorship_request(pk=1),
+            self.mentorship_request(pk=2, meeting_information=[{'weekday': 'Tuesday', 'time': '18:00:00+00:00'}])
+        ]
+        matches, unmatched = match(mentors, requests, 60)
+        self.assertEqual(1, len(matches))
+
+    @tag(Tags.MODEL)
+    def test_match_most_constrained_first(self):
+        """Ensure that requests which fewer mentors could accept are assigned first, so that they are not left without
+        a mentor by requests which could have been assigned to another mentor.
+        """
+        mentors = {
+            1: Mentor(self.mentor_form(pk=1, students=2, meeting_information=[
+                {'weekday': 'Monday', 'time': '18:00:00+00:00'}, {'weekday': 'Friday', 'time': '12:00:00+00:00'}
+            ]), 60),
+            2: Mentor(self.mentor_form(pk=2, students=2, meeting_information=[
+                {'weekday': 'Friday', 'time': '12:00:00+00:00'}
+            ]), 60),
+        }
+        requests = [
+            self.mentorship_request(pk=1, meeting_information=[
+                {'weekday': 'Monday', 'time': '18:00:00+00:00'}, {'weekday': 'Friday', 'time': '12:00:00+00:00'}
+            ]),
+            self.mentorship_request(pk=2),
+        ]
+        matches, unmatched = match(mentors, requests, 60)
+        self.assertEqual({1: 2, 2: 1}, {m.request.pk: m.mentor.pk for m in matches})
+        self.assertEqual([], unmatched)
+
+    @tag(Tags.MODEL)
+    def test_propose_and_assign(self):
+        """Ensure that mentors in both storage modes are proposed and assigned, that ignored mentors and mentors whose
+        availability has ended are not, and that assigned requests reduce the capacity of their mentors.
+        """
+        with self.settings(CONTACT_FORM_STORAGE='single-table'):
+            mentor = self.mentor_form(students=4)
+        ignored = self.mentor_form()
+        ignored.ignored = True
+        ignored.save()
+        ended = self.mentor_form()
+        ended.availability_end = date(2023, 1, 1)
+        ended.save()
+
+        first = self.mentorship_request()
+        matches, unmatched = propose_matches(60)
+        self.assertEqual([(first.pk, mentor.pk)], [(m.request.pk, m.mentor.pk) for m in matches])
+        self.assertEqual(1, assign_matches(matches))
+
+        first.refresh_from_db()
+        self.assertEqual(mentor.pk, first.mentor_id)
+        self.assertEqual({'weekday': 'Monday', 'time': '18:00:00+00:00'}, first.meeting)
+        self.assertEqual([first], list(ContactFormBase.objects.get(pk=mentor.pk).mentorship_requests.all()))
+
+        second = self.mentorship_request(meeting_information=[{'weekday': 'Monday', 'time': '18:30:00+00:00'}])
+        matches, unmatched = propose_matches(60)
+        self.assertEqual([], matches)
+        self.assertEqual([second], unmatched)
@@ -0,0 +1,379 @@
+"""This module contains unit tests for the contact application's Celery tasks."""
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest.mock import patch
+
+from django.test import tag, override_settings
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from apps.contact import digest
+from apps.contact.dedupe import find, soundex
+from apps.contact.models import (
+    ContactFormBase, GuestSpeakerContactForm, PartnerContactForm, MentorContactForm, SpamToken
+)
+from apps.contact.scheduling import IntervalIndex
+from apps.contact.spam import tokenize
+from apps.contact.tasks import (
+    detect_duplicate_submitters, schedule_guest_speakers, score_contact_forms, send_contact_digest,
+    train_spam_classifier
+)
+from apps.events.models import Event
+from core.mail import QUEUE
+from core.models import ContactInfo
+from core.testcases import VerboseTestCase, Tags
+
+
+@override_settings(CONTACT_DEDUPE_THRESHOLD=0.9, CONTACT_DEDUPE_MAX_BLOCK_SIZE=50)
+class TestContactTasks(VerboseTestCase):
+    """A Django test case class which contains unit tests for contact-related Celery tasks.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing contact app tasks...'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the test data for the test case once when the test case class is being prepared to run.
+        """
+        cls.john = PartnerContactForm.objects.create(first_name='John', last_name='Smith', affiliation='NC State')
+        cls.jon = MentorContactForm.objects.create(
+            first_name='Jon', last_name='Smith', affiliation='NC State University', availability_start=timezone.now()
+        )
+        cls.jane = PartnerContactForm.objects.create(first_name='Jane', last_name='Smith', affiliation='NC State')
+        cls.robert = PartnerContactForm.objects.create(first_name='Robert', last_name='Jones', affiliation='Acme')
+
+        ContactInfo(type=ContactInfo.InfoType.EMAIL, value='john@gmail.com', content_object=cls.john).save()
+        ContactInfo(type=ContactInfo.InfoType.EMAIL, value=' John@Gmail.com', content_object=cls.robert).save()
+
+    def clusters(self):
+        """Returns a dictionary mapping the primary key of each contact form to its ``submitter_cluster``.
+        """
+        return dict(ContactFormBase.objects.non_polymorphic().values_list('pk', 'submitter_cluster'))
+
+    @tag(Tags.TASK)
+    def test_soundex(self):
+        """Ensure that names which sound alike have the same Soundex code.
+        """
+        self.assertEqual('R163', soundex('Robert'))
+        self.assertEqual('R163', soundex('Rupert'))
+        self.assertEqual('A261', soundex('Ashcraft'))
+        self.assertEqual('P236', soundex('Pfister'))
+        self.assertEqual('', soundex('123'))
+
+    @tag(Tags.TASK)
+    def test_find_compresses_path(self):
+        """Ensure that finding the root of a submission points every submission on its path directly at the root.
+        """
+        parents = {4: 3, 3: 2, 2: 1}
+        self.assertEqual(1, find(parents, 4))
+        self.assertEqual({4: 1, 3: 1, 2: 1}, parents)
+        self.assertEqual(1, find(parents, 1))
+        self.assertEqual({4: 1, 3: 1, 2: 1}, parents)
+
+    @tag(Tags.TASK)
+    def test_detect_duplicate_submitters(self):
+        """Ensure that the `detect_duplicate_submitters` task groups contact forms with similar names and affiliations
+        or the same contact information, across contact form types, and does not group distinct submitters.
+        """
+        self.assertEqual(3, detect_duplicate_submitters())
+
+        clusters = self.clusters()
+        self.assertEqual(self.john.pk, clusters[self.john.pk])
+        self.assertEqual(self.john.pk, clusters[self.jon.pk])
+        self.assertEqual(self.john.pk, clusters[self.robert.pk])
+        self.assertIsNone(clusters[self.jane.pk])
+
+    @tag(Tags.TASK)
+    def test_detect_duplicate_submitters_incremental(self):
+        """Ensure that the `detect_duplicate_submitters` task only updates contact forms whose group has changed.
+        """
+        detect_duplicate_submitters()
+        self.assertEqual(0, detect_duplicate_submitters())
+
+        ContactInfo.objects.filter(object_id=self.robert.pk).delete()
+        self.assertEqual(1, detect_duplicate_submitters())
+        self.assertIsNone(self.clusters()[self.robert.pk])
+
+    @tag(Tags.TASK)
+    @override_settings(CONTACT_DEDUPE_MAX_BLOCK_SIZE=1)
+    def test_detect_duplicate_submitters_max_block_size(self):
+        """Ensure that contact forms are not compared when their blocking keys are shared by too many contact forms.
+        """
+        self.assertEqual(0, detect_duplicate_submitters())
+        self.assertEqual({None}, set(self.clusters().values()))
+
+
+@override_settings(CONTACT_SPAM_BATCH_SIZE=2)
+class TestSpamTasks(VerboseTestCase):
+    """A Django test case class which contains unit tests for the Celery tasks which train and run the contact form spam
+    classifier.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing contact form spam classifier tasks...'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the test data for the test case once when the test case class is being prepared to run.
+        """
+        spam = 'Cheap SEO backlinks, visit https://spam.example.com now'
+        ham = 'We would love to sponsor your machine learning workshop'
+
+        cls.spam = [
+            PartnerContactForm.objects.create(first_name='A', last_name='B', thoughts=spam, ignored=True),
+            MentorContactForm.objects.create(
+                first_name='C', last_name='D', field_description=spam, availability_start=timezone.now(), ignored=True
+            ),
+        ]
+        cls.ham = [
+            PartnerContactForm.objects.create(first_name='E', last_name='F', thoughts=ham, reviewed=True),
+            PartnerContactForm.objects.create(first_name='G', last_name='H', initiatives=ham, reviewed=True),
+        ]
+        cls.new_spam = PartnerContactForm.objects.create(first_name='I', last_name='J', thoughts=spam)
+        cls.new_ham = PartnerContactForm.objects.create(first_name='K', last_name='L', thoughts=ham)
+
+    @tag(Tags.TASK)
+    def test_tokenize(self):
+        """Ensure that contact forms are tokenized from their free-text fields, with affiliations and URLs
+        distinguished from other words.
+        """
+        form = PartnerContactForm(affiliation='SEO Services', thoughts='Visit www.spam.example.com', industry='IT')
+        self.assertEqual(
+            {'affiliation:seo', 'affiliation:services', 'visit', 'url', 'domain:spam.example.com', 'it'},
+            tokenize(form)
+        )
+
+    @tag(Tags.TASK)
+    def test_score_contact_forms_untrained(self):
+        """Ensure that contact forms are not scored before the classifier has been trained.
+        """
+        self.assertEqual(0, score_contact_forms())
+        self.assertFalse(ContactFormBase.objects.filter(spam_score__isnull=False).exists())
+
+    @tag(Tags.TASK)
+    def test_train_spam_classifier(self):
+        """Ensure that the `train_spam_classifier` task trains the classifier with ignored and reviewed contact forms,
+        in batches, and then scores the contact forms which have not been reviewed.
+        """
+        self.assertEqual(4, train_spam_classifier())
+
+        token = SpamToken.objects.get(token='backlinks')
+        self.assertEqual((2, 0), (token.spam, token.ham))
+        token = SpamToken.objects.get(token='workshop')
+        self.assertEqual((0, 2), (token.spam, token.ham))
+
+        self.new_spam.refresh_from_db()
+        self.new_ham.refresh_from_db()
+        self.assertGreater(self.new_spam.spam_score, 0.9)
+        self.assertLess(self.new_ham.spam_score, 0.1)
+
+        self.assertEqual(0, train_spam_classifier())
+        self.assertEqual(4, score_contact_forms())
+        self.assertEqual(0, score_contact_forms())
+
+    @tag(Tags.TASK)
+    def test_train_spam_classifier_incremental(self):
+        """Ensure that when an administrator changes their decision about a contact form, only that form's token counts
+        are moved to its new label.
+        """
+        train_spam_classifier()
+        ContactFormBase.objects.filter(pk=self.spam[0].pk).update(ignored=False, reviewed=True)
+
+        self.assertEqual(1, train_spam_classifier())
+        token = SpamToken.objects.get(token='backlinks')
+        self.assertEqual((1, 1), (token.spam, token.ham))
+
+        ContactFormBase.objects.filter(pk=self.spam[0].pk).update(reviewed=False)
+        self.assertEqual(1, train_spam_classifier())
+        token = SpamToken.objects.get(token='backlinks')
+        self.assertEqual((1, 0), (token.spam, token.ham))
+
+
+class TestGuestSpeakerScheduling(VerboseTestCase):
+    """A Django test case class which contains unit tests for the Celery task which schedules guest speakers as draft
+    events.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing guest speaker scheduling task...'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the test data for the test case once when the test case class is being prepared to run.
+        """
+        cls.day = (timezone.now() + timedelta(days=30)).date()
+        cls.busy = datetime.combine(cls.day, datetime.min.time(), dt_timezone.utc).replace(hour=18)
+        Event.objects.bulk_create([Event(start=cls.busy, end=cls.busy + timedelta(hours=1))])
+
+    def speaker(self, *hours, length=60):
+        """Creates a guest speaker contact form which is available at each of the specified hours of the test day, in
+        UTC.
+        """
+        return GuestSpeakerContactForm.objects.create(
+            first_name='John',
+            last_name='Smith',
+            topic='AI/ML',
+            length=length,
+            availability=[{'date': self.day.isoformat(), 'time': f'{hour:02}:00:00+00:00'} for hour in hours]
+        )
+
+    @tag(Tags.TASK)
+    def test_interval_index(self):
+        """Ensure that the interval index merges overlapping intervals, and that intervals which only touch the busy
+        time do not overlap it.
+        """
+        index = IntervalIndex([(1, 3), (5, 7)])
+        self.assertFalse(index.overlaps(3, 5))
+        self.assertTrue(index.overlaps(2, 4))
+        self.assertTrue(index.overlaps(0, 10))
+
+        index.add(3, 5)
+        self.assertEqual(([1], [7]), (index.starts, index.ends))
+
+    @tag(Tags.TASK)
+    def test_schedule(self):
+        """Ensure that guest speakers are scheduled as draft events at their first option which does not conflict with
+        an existing event or another proposal, and that speakers with fewer options are scheduled first.
+        """
+        flexible = self.speaker(18, 20, 21)
+        constrained = self.speaker(20)
+        unschedulable = self.speaker(18, length=30)
+        ignored = self.speaker(12)
+        ignored.ignored = True
+        ignored.save()
+
+        self.assertEqual(2, schedule_guest_speakers())
+
+        events = {event.guest_speaker_id: event for event in Event.objects.filter(draft=True)}
+        self.assertEqual({flexible.pk, constrained.pk}, set(events))
+        self.assertEqual(self.busy + timedelta(hours=2), events[constrained.pk].start)
+        self.assertEqual(self.busy + timedelta(hours=3), events[flexible.pk].start)
+        self.assertEqual(self.busy + timedelta(hours=4), events[flexible.pk].end)
+        self.assertEqual(['AI/ML'], events[flexible.pk].topics)
+        self.assertFalse(unschedulable.scheduled_events.exists())
+
+    @tag(Tags.TASK)
+    def test_incremental(self):
+        """Ensure that only guest speakers without a scheduled event are scheduled, so that proposals are not changed
+        by later runs.
+        """
+        first = self.speaker(20)
+        self.assertEqual(1, schedule_guest_speakers())
+        self.assertEqual(0, schedule_guest_speakers())
+
+        second = self.speaker(20, 21)
+        self.assertEqual(1, schedule_guest_speakers())
+        self.assertEqual(self.busy + timedelta(hours=3), Event.objects.get(guest_speaker=second).start)
+
+        Event.objects.filter(guest_speaker=first).delete()
+        self.assertEqual(1, schedule_guest_speakers())
+        self.assertTrue(first.scheduled_events.exists())
+
+
+@override_settings(CONTACT_DIGEST_RECIPIENTS=['admin@test.com'], CONTACT_DIGEST_MAX_ITEMS=2)
+class TestContactDigest(VerboseTestCase):
+    """A Django test case class which contains unit tests for the digests of new contact form submissions which are
+    sent to administrators.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing contact form digests...'
+
+    def setUp(self):
+        """Start each test with an empty stream and mail queue, and record three new partner contact forms and a new
+        mentor contact form.
+        """
+        self.redis = get_redis_connection('default')
+        self.redis.delete(digest.STREAM, QUEUE)
+
+        self.partners = [
+            PartnerContactForm.objects.create(first_name=name, last_name='Smith', affiliation='Acme')
+            for name in ('John', 'Jane', 'Robert')
+        ]
+        ContactInfo.objects.create(content_object=self.partners[0], value='john@acme.com', preferred=True)
+        self.mentor = MentorContactForm.objects.create(
+            first_name='Alice', last_name='Jones', affiliation='NC State', availability_start=timezone.now()
+        )
+        for form in self.partners + [self.mentor]:
+            digest.record(form)
+
+    def queued(self):
+        """Returns the queued messages, ordered by subject.
+        """
+        return sorted((json.loads(queued) for queued in self.redis.lrange(QUEUE, 0, -1)), key=lambda m: m['subject'])
+
+    @tag(Tags.TASK)
+    def test_one_message_per_form_type(self):
+        """Ensure that one summary is queued for each type of contact form, which lists a limited number of forms with
+        their contact information and counts the rest.
+        """
+        self.assertEqual(4, send_contact_digest())
+
+        mentor, partner = self.queued()
+        self.assertEqual('1 new Mentor Contact Form', mentor['subject'])
+        self.assertEqual('3 new Partner Contact Forms', partner['subject'])
+        self.assertEqual(['admin@test.com'], partner['recipients'])
+        self.assertIn('John Smith (Acme): john@acme.com', partner['body'])
+        self.assertIn('Jane Smith (Acme)', partner['body'])
+        self.assertNotIn('Robert', partner['body'])
+        self.assertIn('and 1 more', partner['body'])
+        self.assertNotIn('more', mentor['body'])
+
+    @tag(Tags.TASK)
+    def test_not_escaped(self):
+        """Ensure that the plain text summaries do not HTML-escape submitted values.
+        """
+        form = PartnerContactForm.objects.create(first_name='Conor', last_name="O'Brien", affiliation='R&D <Labs>')
+        ContactInfo.objects.create(content_object=form, value='"Conor" <conor@rd.com>', preferred=True)
+        self.redis.delete(digest.STREAM)
+        digest.record(form)
+        send_contact_digest()
+
+        body = self.queued()[0]['body']
+        self.assertIn('Conor O\'Brien (R&D <Labs>): "Conor" <conor@rd.com>', body)
+        self.assertNotIn('&amp;', body)
+
+    @tag(Tags.TASK)
+    def test_entries_acknowledged(self):
+        """Ensure that submissions are only included in a single digest.
+        """
+        send_contact_digest()
+        self.assertEqual(0, self.redis.xlen(digest.STREAM))
+        self.assertEqual(0, send_contact_digest())
+
+        digest.record(self.mentor)
+        self.assertEqual(1, send_contact_digest())
+
+    @tag(Tags.TASK)
+    def test_pending_entries_retried(self):
+        """Ensure that submissions which were read by a digest that failed are included in the next digest.
+        """
+        list(digest.read_entries(self.redis))
+        self.assertEqual(4, send_contact_digest())
+
+    @tag(Tags.TASK)
+    def test_deleted_pending_entries_acknowledged(self):
+        """Ensure that submissions which were deleted from the stream after being read by a digest that failed are
+        acknowledged rather than left pending.
+        """
+        entries = next(digest.read_entries(self.redis))
+        self.redis.xdel(digest.STREAM, entries[0][0])
+
+        self.assertEqual(3, send_contact_digest())
+        self.assertEqual(0, self.redis.xpending(digest.STREAM, digest.GROUP)['pending'])
+
+    @tag(Tags.TASK)
+    def test_paged(self):
+        """Ensure that submissions are counted and acknowledged across pages of the stream.
+        """
+        with patch.object(digest, 'READ_COUNT', 3):
+            self.assertEqual(4, send_contact_digest())
+
+        subjects = [queued['subject'] for queued in self.queued()]
+        self.assertEqual(['1 new Mentor Contact Form', '3 new Partner Contact Forms'], subjects)
+        self.assertEqual(0, self.redis.xlen(digest.STREAM))
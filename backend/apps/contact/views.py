@@ -1,9 +1,18 @@
 """This module contains Django Rest Framework viewsets for contact application models."""
-from rest_framework import viewsets
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import viewsets, status
 from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.response import Response
+
+from apps.contact import idempotency
+from apps.contact.storage import typed_forms
 
 from apps.contact.models import (
-    GuestSpeakerContactForm, MentorContactForm, EventOrganizerContactForm, PartnerContactForm
+    ContactFormBase, GuestSpeakerContactForm, MentorContactForm, EventOrganizerContactForm, PartnerContactForm
 )
 from apps.contact.serializers import (
     GuestSpeakerContactFormSerializer, MentorContactFormSerializer, EventOrganizerContactFormSerializer,
@@ -13,7 +22,14 @@ from apps.contact.serializers import (
 
 class ContactFormViewSetBase(viewsets.ModelViewSet):
     """A base viewset which acts as a create-only API endpoint for ContactForm objects.
+
+    Attributes:  # noqa
+        idempotency_key: The idempotency key of the submission being processed by the `create` action.
+        idempotency_payload: The hash of the submission being processed by the `create` action.
     """
+    idempotency_key = None
+    idempotency_payload = None
+
     def get_permissions(self):
         """Dynamically determines the permission classes for the view set based on the action being performed. Only
         admin users are permitted to carry out any action other than `create`. All `create` requests are permitted.
@@ -25,6 +41,96 @@ class ContactFormViewSetBase(viewsets.ModelViewSet):
 
         return [permission() for permission in permission_classes]
 
+    def get_queryset(self):
+        """Returns the queryset used to populate responses.
+
+        For every action other than `create`, the queryset contains the contact forms of the viewset's type in both
+        storage modes (see the apps.contact.storage module). They are retrieved from the ContactFormBase table without
+        upcasting them, and are converted into instances of their concrete model by the `list` action and `get_object`.
+        """
+        if self.action == 'create':
+            return super().get_queryset()
+
+        return ContactFormBase.objects.non_polymorphic().filter(form_type=self.queryset.model._meta.model_name)
+
+    def get_object(self):
+        """Overrides the default ModelViewSet get_object method to return the contact form as an instance of its
+        concrete model, regardless of its storage mode.
+        """
+        return super().get_object().typed()
+
+    def list(self, request, *args, **kwargs):
+        """Overrides the default ModelViewSet list action to convert the listed contact forms into instances of their
+        concrete model, with a single query for those stored in the multi-table storage mode.
+        """
+        rows = list(self.filter_queryset(self.get_queryset()))
+        forms = typed_forms(rows)
+        serializer = self.get_serializer([forms[row.pk] for row in rows if row.pk in forms], many=True)
+
+        return Response(serializer.data)
+
+    def create(self, request, *args, **kwargs):
+        """Overrides the default ModelViewSet create action to make submissions idempotent.
+
+        If a submission with the same idempotency key (see the apps.contact.idempotency module) has already been made,
+        the response to the original submission is returned instead of creating another contact form. The response is
+        normally retrieved from the cache without querying the database. If it has been evicted from the cache, it is
+        rebuilt from the contact form which was created by the original submission, unless that submission was made
+        more than ``CONTACT_IDEMPOTENCY_TTL`` seconds ago. A submission which reuses the idempotency key of a different
+        submission is rejected.
+        """
+        self.idempotency_payload = payload = idempotency.payload_hash(request)
+        self.idempotency_key = key = idempotency.idempotency_key(request, self.queryset.model._meta.label, payload)
+        if key is None:
+            return Response(
+                {'detail': f'The {idempotency.HEADER} header is too long.'}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        replay = idempotency.get_response(key)
+        if replay is None:
+            # The original contact form is looked up in the ContactFormBase table, since it may have been stored in the
+            # single-table storage mode (see the apps.contact.storage module).
+            original = ContactFormBase.objects.filter(idempotency_key=key).first()
+            expired = timezone.now() - timedelta(seconds=settings.CONTACT_IDEMPOTENCY_TTL)
+            if original is not None and original.submitted < expired:
+                # The original submission's key has expired, so it is released for this submission.
+                ContactFormBase.objects.filter(pk=original.pk, idempotency_key=key).update(idempotency_key=None)
+                original = None
+
+            if original is None:
+                try:
+                    with transaction.atomic():
+                        response = super().create(request, *args, **kwargs)
+                except IntegrityError:
+                    # The same submission was created concurrently by another request, unless the error was caused by
+                    # another constraint.
+                    original = ContactFormBase.objects.filter(idempotency_key=key).first()
+                    if original is None:
+                        raise
+                else:
+                    if status.is_success(response.status_code):
+                        idempotency.store_response(key, response.data, response.status_code, payload)
+                    return response
+
+            replay = (self.get_serializer(original.typed()).data, status.HTTP_201_CREATED, original.idempotency_payload)
+            idempotency.store_response(key, *replay)
+
+        data, status_code, original_payload = replay
+        # Contact forms submitted before payload hashes were stored have none, and are assumed to match.
+        if original_payload is not None and original_payload != payload:
+            return Response(
+                {'detail': f'The {idempotency.HEADER} header was already used for a different submission.'},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY
+            )
+
+        return Response(data, status=status_code, headers={'Idempotent-Replayed': 'true'})
+
+    def perform_create(self, serializer):
+        """Overrides the default ModelViewSet perform_create method to store the submission's idempotency key on the
+        created contact form, along with the hash of the submission.
+        """
+        serializer.save(idempotency_key=self.idempotency_key, idempotency_payload=self.idempotency_payload)
+
 
 class GuestSpeakerContactFormViewSet(ContactFormViewSetBase):
     """A Django Rest Framework viewset which acts as a read-only API endpoint for GuestSpeakerContactForm objects.
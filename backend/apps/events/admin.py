@@ -13,6 +13,7 @@ from apps.events.forms import EventModelAdminForm
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
     """Defines a typical Django model admin page with a single inline Django model admin for related ContactInfo models.
+    Draft events (e.g., those proposed by the guest speaker scheduler) can be published with an admin action.
 
     Attributes:  # noqa
         inlines: A list of inline Django model admin classes to include on the Event admin page.
@@ -23,3 +24,17 @@ class EventAdmin(admin.ModelAdmin):
         ContactInfoTabularInline,
     ]
     form = EventModelAdminForm
+    list_display = ('__str__', 'start', 'end', 'draft')
+    list_filter = ('draft', 'type')
+    raw_id_fields = ('guest_speaker',)
+    actions = ('publish',)
+
+    def publish(self, request, queryset):
+        """Publishes the selected draft events. Each event is saved individually, so that it is announced.
+        """
+        events = list(queryset.filter(draft=True))
+        for event in events:
+            event.draft = False
+            event.save()
+        self.message_user(request, f'{len(events)} event(s) published.')
+    publish.short_description = 'Publish selected draft events'
@@ -0,0 +1,27 @@
+# Generated by Django 3.1.2 on 2026-10-19 14:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0017_auto_20220128_2021'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='recurrence',
+            field=models.CharField(choices=[('NO', 'Does Not Repeat'), ('DA', 'Daily'), ('WE', 'Weekly'), ('BW', 'Every Two Weeks')], default='NO', max_length=2, verbose_name='Repeats'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrence_end',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Repeat Until'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['recurrence', 'start'], name='events_even_recurre_2cd30b_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 3.1.2 on 2026-10-19 15:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0018_event_recurrence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventReminder',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('occurrence_start', models.DateTimeField(editable=False, verbose_name='Occurrence Start Date and Time')),
+                ('window', models.PositiveIntegerField(editable=False, verbose_name='Minutes Before Start')),
+                ('batch', models.UUIDField(db_index=True, editable=False, verbose_name='Reminder Batch')),
+                ('sent', models.DateTimeField(auto_now_add=True, verbose_name='Date/Time Sent')),
+                ('event', models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to='events.event', verbose_name='Event')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='eventreminder',
+            constraint=models.UniqueConstraint(fields=('event', 'occurrence_start', 'window'), name='unique_event_reminder'),
+        ),
+    ]
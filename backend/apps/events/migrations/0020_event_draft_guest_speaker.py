@@ -0,0 +1,29 @@
+# Generated by Django 3.1.2 on 2026-10-19 21:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0016_mentorshiprequest'),
+        ('events', '0019_eventreminder'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='draft',
+            field=models.BooleanField(db_index=True, default=False, verbose_name='Draft?'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='guest_speaker',
+            field=models.ForeignKey(
+                blank=True, default=None, limit_choices_to={'form_type': 'guestspeakercontactform'}, null=True,
+                on_delete=django.db.models.deletion.SET_NULL, related_name='scheduled_events',
+                to='contact.contactformbase', verbose_name='Guest Speaker Contact Form'
+            ),
+        ),
+    ]
@@ -1,4 +1,10 @@
 """This module contains Django models that relate to club events."""
+import heapq
+from datetime import timedelta
+from itertools import islice
+from operator import attrgetter
+
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -7,6 +13,7 @@ from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from apps.events.recurrence import expand
 from apps.events.tasks import event_created, event_rescheduled
 from core.validators import JSONSchemaValidator
 
@@ -121,6 +128,45 @@ class EventQuerySet(models.QuerySet):
         """
         return self.filter(Q(start__gt=timezone.now()))
 
+    def occurrences(self, after=None, before=None, limit=None):
+        """A custom queryset method which merges one-off events with the expanded occurrences of recurring events.
+
+        One-off events are retrieved with a single query, ordered by their start date and time. Recurring events whose
+        series overlaps the requested window are retrieved with a second query, and each series is expanded lazily by
+        the recurrence engine. The resulting streams are already sorted, so they are combined with a k-way merge rather
+        than being materialized and sorted as a whole.
+
+        Args:
+            after: An optional datetime. If specified, only occurrences starting at or after it are included.
+            before: An optional datetime. If specified, only occurrences starting before it are included. Otherwise,
+            one-off events are not bounded, but recurring events are only expanded up to the configured
+            ``EVENT_RECURRENCE_HORIZON_DAYS`` from now.
+            limit: An optional maximum number of occurrences to return.
+
+        Returns:
+            An iterator of Event objects and Occurrence objects, ordered by their start date and time.
+        """
+        one_off = self.filter(recurrence=Event.Recurrence.NONE).order_by('start')
+        series = self.exclude(recurrence=Event.Recurrence.NONE)
+
+        if after is not None:
+            one_off = one_off.filter(start__gte=after)
+            series = series.filter(Q(recurrence_end__isnull=True) | Q(recurrence_end__gte=after))
+        if before is not None:
+            one_off = one_off.filter(start__lt=before)
+        else:
+            before = timezone.now() + timedelta(days=settings.EVENT_RECURRENCE_HORIZON_DAYS)
+        if limit is not None:
+            one_off = one_off[:limit]
+
+        merged = heapq.merge(
+            one_off,
+            *(expand(event, after, before) for event in series.filter(start__lt=before)),
+            key=attrgetter('start')
+        )
+
+        return merged if limit is None else islice(merged, limit)
+
 
 class Event(models.Model):
     """A Django database model which represents a club event.
@@ -140,11 +186,23 @@ class Event(models.Model):
 
         meeting_address: A many-to-one relation to the MeetingAddress model, which relates an Event to its location.
 
+        recurrence: A CharField containing the event's recurrence rule. The available rules are defined in the
+        Recurrence class.
+
+        recurrence_end: An optional DateTimeField containing the date and time after which a recurring event no longer
+        repeats. A recurring event without one repeats indefinitely.
+
+        draft: A BooleanField indicating whether the event is a draft, which is not listed by the API or announced until
+        it is published by an administrator.
+
+        guest_speaker: An optional many-to-one relation to the guest speaker contact form of the event's presenter, if
+        the event was scheduled from one.
+
         contacts: A generic relation to the ContactInfo model in the core directory.
 
         objects: A custom Manager which includes all base Manager functionality with the addition of the `upcoming`
         method which can be used in place of `Event.objects.all()` to retrieve a QuerySet containing only upcoming
-        event objects.
+        event objects, and the `occurrences` method which expands recurring events into their individual occurrences.
     """
 
     class EventType(models.TextChoices):
@@ -179,6 +237,26 @@ class Event(models.Model):
         HACKATHON_MEETING = 'HM', _('Hackathon Meeting')
         OTHER = 'OT', _('Other Event')
 
+    class Recurrence(models.TextChoices):
+        """Defines the supported recurrence rules for the Event model's ``recurrence`` field.
+
+        Attributes:  # noqa
+            NONE: A 2 character identifier and lazily-evaluated label representing the choice of a one-off event.
+
+            DAILY: A 2 character identifier and lazily-evaluated label representing the choice of an event which repeats
+            every day.
+
+            WEEKLY: A 2 character identifier and lazily-evaluated label representing the choice of an event which
+            repeats every week.
+
+            BIWEEKLY: A 2 character identifier and lazily-evaluated label representing the choice of an event which
+            repeats every other week.
+        """
+        NONE = 'NO', _('Does Not Repeat')
+        DAILY = 'DA', _('Daily')
+        WEEKLY = 'WE', _('Weekly')
+        BIWEEKLY = 'BW', _('Every Two Weeks')
+
     type = models.CharField(
         max_length=2,
         choices=EventType.choices,
@@ -236,15 +314,52 @@ class Event(models.Model):
         editable=True,
         verbose_name='Meeting Location',
     )
+    recurrence = models.CharField(
+        max_length=2,
+        choices=Recurrence.choices,
+        default=Recurrence.NONE,
+        null=False,
+        blank=False,
+        editable=True,
+        unique=False,
+        verbose_name='Repeats',
+    )
+    recurrence_end = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=True,
+        unique=False,
+        verbose_name='Repeat Until',
+    )
+    draft = models.BooleanField(
+        default=False,
+        editable=True,
+        db_index=True,
+        verbose_name='Draft?',
+    )
+    guest_speaker = models.ForeignKey(
+        'contact.ContactFormBase',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        default=None,
+        editable=True,
+        limit_choices_to={'form_type': 'guestspeakercontactform'},
+        related_name='scheduled_events',
+        verbose_name='Guest Speaker Contact Form',
+    )
 
     contacts = GenericRelation('core.ContactInfo')
     objects = EventQuerySet.as_manager()
 
     __original_start = None
+    __original_draft = None
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__original_start = self.start
+        # The field is read from the instance's dictionary so that deferring it does not cause a query.
+        self.__original_draft = self.__dict__.get('draft')
 
     def clean(self):
         """Provides additional validation for Event model fields.
@@ -254,11 +369,30 @@ class Event(models.Model):
         if self.start >= self.end:
             raise ValidationError('Event start date and time must fall before its end date and time.')
 
+        if self.recurrence_end is not None:
+            if self.recurrence == self.Recurrence.NONE:
+                raise ValidationError('Only recurring events may have a date and time to repeat until.')
+            if self.recurrence_end < self.start:
+                raise ValidationError('Event must not stop repeating before its start date and time.')
+
+    @property
+    def recurrence_interval(self):
+        """The amount of time between the start of consecutive occurrences of the event.
+
+        Returns:
+            A timedelta object, or None if the event does not repeat.
+        """
+        return RECURRENCE_INTERVALS.get(self.recurrence)
+
     def save(self, *args, **kwargs):
         """Overrides the default model save method to send a Celery task when a new Event object is saved, or an
         existing event is rescheduled.
+
+        Draft events are not announced. A draft event is announced as a new event when it is published.
         """
-        if self.pk and self.__original_start != self.start:
+        if self.draft:
+            super(Event, self).save(*args, **kwargs)
+        elif self.pk and self.__original_start != self.start and not self.__original_draft:
             super(Event, self).save(*args, **kwargs)
             event_rescheduled.delay(Event.EventType(self.type).label, self.start)
         else:
@@ -289,5 +423,96 @@ class Event(models.Model):
             ordering: A list of fields to order Event objects by. As-is, they are ordered by the date/time they start
             and in ascending order (i.e., the Event that is starting the soonest appears first and the one starting
             latest appears last).
+
+            indexes: A list of database indexes for the Event model. The index on ``recurrence`` and ``start`` allows
+            one-off and recurring events to be retrieved separately, in order, without scanning the table.
         """
         ordering = ['start']
+        indexes = [
+            models.Index(fields=['recurrence', 'start']),
+        ]
+
+
+class EventReminder(models.Model):
+    """A Django database model which records that a reminder was sent for an occurrence of an event.
+
+    A reminder is uniquely identified by its event, the start of the occurrence it pertains to, and the reminder window
+    it was sent for, so rerunning the reminder tasks never sends the same reminder twice.
+
+    Attributes:  # noqa
+        event: A many-to-one relation to the Event model, which relates a reminder to the event it was sent for.
+
+        occurrence_start: A DateTimeField containing the start date and time of the occurrence the reminder was sent
+        for. For one-off events, this is the same as the event's start.
+
+        window: A PositiveIntegerField containing the number of minutes before the start of the occurrence for which the
+        reminder was scheduled.
+
+        batch: A UUIDField identifying the batch of reminders that the reminder was sent in.
+
+        sent: A DateTimeField containing the date and time when the reminder was sent.
+    """
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        null=False,
+        blank=False,
+        editable=False,
+        related_name='reminders',
+        verbose_name='Event',
+    )
+    occurrence_start = models.DateTimeField(
+        null=False,
+        blank=False,
+        editable=False,
+        unique=False,
+        verbose_name='Occurrence Start Date and Time',
+    )
+    window = models.PositiveIntegerField(
+        null=False,
+        blank=False,
+        editable=False,
+        unique=False,
+        verbose_name='Minutes Before Start',
+    )
+    batch = models.UUIDField(
+        null=False,
+        blank=False,
+        editable=False,
+        unique=False,
+        db_index=True,
+        verbose_name='Reminder Batch',
+    )
+    sent = models.DateTimeField(
+        auto_now_add=True,
+        null=False,
+        blank=True,
+        editable=False,
+        unique=False,
+        verbose_name='Date/Time Sent',
+    )
+
+    def __str__(self):
+        """Defines the string representation of an EventReminder object to include its window and event.
+        """
+        return f'{self.window} minute reminder for {self.event}'
+
+    class Meta:
+        """This class contains meta-options for the EventReminder model.
+
+        Attributes:  # noqa
+            constraints: A list of database constraints for the EventReminder model. The unique constraint ensures that
+            at most one reminder is recorded per event, occurrence, and window, and its index is used to look up which
+            reminders have already been sent.
+        """
+        constraints = [
+            models.UniqueConstraint(fields=['event', 'occurrence_start', 'window'], name='unique_event_reminder'),
+        ]
+
+
+# A dictionary which maps each of the Event model's recurrence rules to the amount of time between occurrences.
+RECURRENCE_INTERVALS = {
+    Event.Recurrence.DAILY: timedelta(days=1),
+    Event.Recurrence.WEEKLY: timedelta(weeks=1),
+    Event.Recurrence.BIWEEKLY: timedelta(weeks=2),
+}
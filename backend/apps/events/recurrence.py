@@ -0,0 +1,144 @@
+"""This module contains the engine which expands recurring events into their individual occurrences.
+
+Recurring events are stored as a single Event row with a recurrence rule, rather than as one row per occurrence. When
+events are listed, each recurring event is expanded lazily for the requested window. The start dates and times of the
+occurrences in a window are computed arithmetically (rather than by stepping through the series from its first
+occurrence) and kept in a bounded, process-wide cache, so repeated requests for the same window do not repeat the work.
+
+Occurrences are computed on the local wall-clock time of the ``EVENT_TIME_ZONE`` setting's time zone, so a series keeps
+its local time of day (e.g., 18:00) when daylight saving time starts or ends, rather than a fixed time in UTC.
+"""
+from datetime import timedelta
+from functools import lru_cache
+
+import pytz
+from django.conf import settings
+from django.utils import timezone
+
+# The maximum number of expanded windows kept in the expansion cache. Once full, the least recently used window is
+# evicted.
+EXPANSION_CACHE_SIZE = 1024
+
+
+class Occurrence:
+    """A lightweight, unsaved representation of a single occurrence of a recurring Event.
+
+    An Occurrence has its own start and end date and time, and delegates every other attribute (e.g., ``type``,
+    ``topics``, ``contacts``) to the recurring Event it belongs to. This allows occurrences to be serialized by the
+    EventSerializer without copying the Event or querying for its related objects again.
+
+    Attributes:  # noqa
+        event: The recurring Event object that the occurrence belongs to.
+
+        start: A datetime containing the date and time of the start of the occurrence.
+
+        end: A datetime containing the date and time of the end of the occurrence.
+    """
+    __slots__ = ('event', 'start', 'end')
+
+    def __init__(self, event, start):
+        """Initializes an occurrence of the specified event which starts at the specified date and time.
+
+        Args:
+            event: The recurring Event object that the occurrence belongs to.
+            start: The date and time of the start of the occurrence. The occurrence lasts as long as the event does.
+        """
+        self.event = event
+        self.start = start
+        self.end = start + (event.end - event.start)
+
+    def __getattr__(self, name):
+        """Delegates attribute lookups that are not specific to the occurrence to its recurring event.
+        """
+        return getattr(self.event, name)
+
+    def __repr__(self):
+        """Defines the representation of an Occurrence object to include its event's primary key and its start.
+        """
+        return f'<Occurrence of Event {self.event.pk} at {self.start.isoformat()}>'
+
+
+def expand(event, after=None, before=None):
+    """Lazily yields the occurrences of an event that start within the specified window, in chronological order.
+
+    The first occurrence of a recurring event is the Event object itself, while later occurrences are represented by
+    Occurrence objects. An event that does not repeat yields only itself, if it starts within the window.
+
+    Args:
+        event: The Event object to expand.
+        after: An optional datetime. If specified, only occurrences starting at or after it are yielded.
+        before: A datetime before which every yielded occurrence starts.
+
+    Yields:
+        The Event object and Occurrence objects which start within the window.
+    """
+    interval = event.recurrence_interval
+    if after is None:
+        after = event.start
+
+    if interval is None:
+        if after <= event.start < before:
+            yield event
+        return
+
+    if event.recurrence_end is not None and event.recurrence_end < before:
+        before = event.recurrence_end + timedelta(microseconds=1)
+
+    # The window is widened to whole days before looking up its expansion, so that requests made at different times of
+    # the same day (e.g., for upcoming events) share a single cache entry.
+    window = _floor_day(after), _floor_day(before) + timedelta(days=1)
+    for start in _expanded_starts(event.start, interval, *window, settings.EVENT_TIME_ZONE):
+        if start < after:
+            continue
+        if start >= before:
+            return
+        yield event if start == event.start else Occurrence(event, start)
+
+
+@lru_cache(maxsize=EXPANSION_CACHE_SIZE)
+def _expanded_starts(first, interval, after, before, zone_name):
+    """Computes the start dates and times of a series' occurrences within a window.
+
+    The index of the first occurrence in the window is computed directly, so the cost of expanding a window depends
+    only on the number of occurrences within it, not on how long ago the series started. The interval is added to the
+    naive local wall-clock time of the first occurrence, and each occurrence is then made timezone-aware again. Local
+    times which are skipped when daylight saving time starts are moved forward, and local times which are repeated when
+    it ends are resolved to their second instance. Since local times do not map evenly onto UTC, the returned
+    occurrences may start up to a day outside of the window.
+
+    Args:
+        first: The date and time of the start of the first occurrence in the series.
+        interval: The amount of time between the start of consecutive occurrences.
+        after: The date and time at or after which occurrences start.
+        before: The date and time before which occurrences start.
+        zone_name: The name of the time zone in which the series repeats at the same local time.
+
+    Returns:
+        A tuple of datetimes, in chronological order.
+    """
+    zone = pytz.timezone(zone_name)
+    local_first, local_after, local_before = (
+        timezone.localtime(value, zone).replace(tzinfo=None) for value in (first, after, before)
+    )
+
+    # Ceiling division of timedeltas yields the index of the first occurrence starting at or after a given time. The
+    # window is widened by a day, since local times may be an hour apart from the UTC times they are compared against.
+    first_index = max(0, -((local_first - local_after + timedelta(days=1)) // interval))
+    last_index = -((local_first - local_before - timedelta(days=1)) // interval)
+
+    return tuple(
+        first if index == 0 else timezone.make_aware(local_first + index * interval, zone, is_dst=False)
+        for index in range(first_index, last_index)
+    )
+
+
+def _floor_day(value):
+    """Truncates a datetime to midnight of the same day.
+
+    Args:
+        value: The datetime to truncate.
+
+    Returns:
+        A datetime at midnight of the same day, in the same time zone.
+    """
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
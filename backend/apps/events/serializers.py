@@ -1,36 +1,87 @@
 """This module contains Django Rest Framework serializers for events application models."""
+from functools import lru_cache
+
 from rest_framework import serializers
 
 from core.serializers import ContactInfoSerializer
-from apps.events.models import Event
+from apps.events.models import Event, MeetingAddress
+
+# The maximum number of serialized meeting addresses kept in the process-wide address cache. Only a few dozen addresses
+# are shared by all events, so the cache rarely evicts anything.
+ADDRESS_CACHE_SIZE = 256
+
+
+class MeetingAddressSerializer(serializers.ModelSerializer):
+    """A simple Django Rest Framework serializer for the MeetingAddress model.
+
+    The serialized representation of a meeting address includes its street address, city, state, zip code, building
+    name, and room.
+    """
+    class Meta:
+        """A class which defines configuration options for the MeetingAddressSerializer class.
+
+        Attributes:  # noqa
+            model: The model that the MeetingAddressSerializer class serializes.
+
+            fields: A list of the fields to include in the serialized representation of a MeetingAddress model instance.
+        """
+        model = MeetingAddress
+        fields = ['street_address', 'city', 'state', 'zip_code', 'building_name', 'room']
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _serialize_address(*values):
+    """Serializes a meeting address, caching the result for every event that shares the same address.
+
+    The cache is keyed on the address' field values rather than its primary key, so an edited address is never served
+    from a stale cache entry, even by a process other than the one that saved the edit. The cached representation is an
+    immutable tuple of (field, value) pairs, so that a caller which modifies the dictionary it builds from the tuple can
+    not alter the representation served to every other event.
+
+    Args:
+        *values: The values of the MeetingAddress object's fields, in the order of ``MeetingAddressSerializer.Meta``.
+
+    Returns:
+        A tuple of (field, value) pairs containing the serialized representation of the meeting address.
+    """
+    address = MeetingAddress(**dict(zip(MeetingAddressSerializer.Meta.fields, values)))
+    return tuple(MeetingAddressSerializer(address).data.items())
 
 
 # noinspection PyMethodMayBeStatic
 class EventSerializer(serializers.ModelSerializer):
     """A Django Rest Framework serializer for the Event model.
 
-    The serialized representation of an Event model instance includes the label associated with the instance's ``type``
-    field, objects containing formatted representations of the date and time of its ``start`` and ``end`` fields, a
-    nested serializer for associated ContactInfo objects, as well as its ``topics``, ``calendar_link`` and
-    ``meeting_link`` fields.
+    The serialized representation of an Event model instance includes the labels associated with the instance's ``type``
+    and ``recurrence`` fields, objects containing formatted representations of the date and time of its ``start`` and
+    ``end`` fields, a nested serializer for associated ContactInfo objects, its meeting address, as well as its
+    ``topics``, ``calendar_link`` and ``meeting_link`` fields.
 
     Attributes:  # noqa
         type: A serializer method field which retrieves and returns the label associated with the Event object's
         ``type``.
 
+        recurrence: A serializer method field which retrieves and returns the label associated with the Event object's
+        ``recurrence``.
+
         start: A serializer method field which retrieves and returns formatted representations of the date and time when
         the event starts in a dictionary.
 
         end: A serializer method field which retrieves and returns formatted representations of the date and time when
         the event ends in a dictionary.
 
+        meeting_address: A serializer method field which retrieves and returns the serialized representation of the
+        Event object's meeting address, or None if it does not have one.
+
         contact: A nested serializer for the Event object's related ContactInfo objects. When an Event object is
         serialized, related ContactInfo objects are serialized and included in the serialized representation of the
         Event object.
     """
     type = serializers.SerializerMethodField()
+    recurrence = serializers.SerializerMethodField()
     start = serializers.SerializerMethodField()
     end = serializers.SerializerMethodField()
+    meeting_address = serializers.SerializerMethodField()
     contacts = ContactInfoSerializer(many=True, read_only=True)
 
     def get_type(self, obj):
@@ -44,6 +95,17 @@ class EventSerializer(serializers.ModelSerializer):
         """
         return Event.EventType(obj.type).label
 
+    def get_recurrence(self, obj):
+        """A get method for the EventSerializer class' ``recurrence`` attribute.
+
+        Args:
+            obj: The Event object (or occurrence of a recurring Event) that is being serialized.
+
+        Returns:
+            The verbose label associated with the ``recurrence`` of the Event object.
+        """
+        return Event.Recurrence(obj.recurrence).label
+
     def get_start(self, obj):
         """A get method for the EventSerializer class' ``start`` attribute.
 
@@ -74,6 +136,27 @@ class EventSerializer(serializers.ModelSerializer):
             'time': obj.end.strftime('%I:%M %p'),
         }
 
+    def get_meeting_address(self, obj):
+        """A get method for the EventSerializer class' ``meeting_address`` attribute.
+
+        The meeting address should be loaded along with the Event object (i.e., with ``select_related``), so that no
+        additional query is made for each event. The serialized address is cached for all events with the same address,
+        and each event receives its own copy of it.
+
+        Args:
+            obj: The Event object that is being serialized.
+
+        Returns:
+            A dictionary containing the serialized representation of the Event object's meeting address, or None if the
+            Event object does not have one.
+        """
+        address = obj.meeting_address
+        if address is None:
+            return None
+
+        values = (getattr(address, field) for field in MeetingAddressSerializer.Meta.fields)
+        return dict(_serialize_address(*values))
+
     class Meta:
         """A class which defines configuration options for the EventSerializer class.
 
@@ -83,4 +166,5 @@ class EventSerializer(serializers.ModelSerializer):
             fields: A list of the fields to include in the serialized representation of an Event model instance.
         """
         model = Event
-        fields = ['type', 'topics', 'start', 'end', 'calendar_link', 'meeting_link', 'contacts']
+        fields = ['type', 'topics', 'start', 'end', 'recurrence', 'calendar_link', 'meeting_link', 'meeting_address',
+                  'contacts']
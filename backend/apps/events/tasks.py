@@ -1,6 +1,13 @@
 """This module contains asynchronous Celery tasks for the Event application."""
+from datetime import timedelta
+from uuid import uuid4
+
 from celery import shared_task
+from django.conf import settings
+from django.db import transaction
 from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 from apps.announcements.models import Announcement
 
@@ -51,3 +58,91 @@ def event_rescheduled(event_type, start):
         }]
     )
     announcement.save()
+
+
+@shared_task
+def schedule_event_reminders():
+    """Finds the events which are due a reminder and fans the reminders out to `send_event_reminders` tasks in batches.
+
+    This task is run periodically by Celery beat. An occurrence of an event is due a reminder for the smallest window in
+    ``EVENT_REMINDER_WINDOWS`` which its start falls within. Occurrences are retrieved with an indexed query bounded by
+    the largest window, and reminders which have already been sent are excluded with a single, indexed lookup, so the
+    cost of this task depends on the number of events starting soon rather than the number of events in the database.
+
+    Returns:
+        The number of reminders that were scheduled to be sent.
+    """
+    from apps.events.models import Event, EventReminder
+
+    now = timezone.now()
+    windows = sorted(settings.EVENT_REMINDER_WINDOWS)
+
+    due = []
+    events = Event.objects.filter(draft=False).only('type', 'start', 'end', 'recurrence', 'recurrence_end')
+    for occurrence in events.occurrences(after=now, before=now + timedelta(minutes=windows[-1], microseconds=1)):
+        lead = occurrence.start - now
+        window = next(w for w in windows if lead <= timedelta(minutes=w))
+        due.append((occurrence.pk, occurrence.start, window))
+
+    if not due:
+        return 0
+
+    sent = set(
+        EventReminder.objects.filter(event_id__in={pk for pk, _, _ in due}, occurrence_start__gte=now)
+                             .values_list('event_id', 'occurrence_start', 'window')
+    )
+    pending = [(pk, start.isoformat(), window) for pk, start, window in due if (pk, start, window) not in sent]
+
+    batch_size = settings.EVENT_REMINDER_BATCH_SIZE
+    for i in range(0, len(pending), batch_size):
+        send_event_reminders.delay(pending[i:i + batch_size])
+
+    return len(pending)
+
+
+@shared_task
+def send_event_reminders(reminders):
+    """Creates a new Announcement for each of a batch of event reminders which has not already been sent.
+
+    Reminders are claimed by inserting EventReminder objects, which are unique per event, occurrence, and window, with
+    a new batch identifier. Any reminder that was already claimed by an earlier run is skipped by the database, so only
+    the reminders recorded with this run's batch identifier are announced. This makes the task safe to retry or run
+    concurrently with itself.
+
+    Args:
+        reminders: A list of lists containing the primary key of an event, the start date and time of its occurrence
+        in ISO 8601 format, and the reminder window in minutes.
+
+    Returns:
+        The number of reminders that were sent.
+    """
+    from apps.events.models import Event, EventReminder
+
+    batch = uuid4()
+    with transaction.atomic():
+        EventReminder.objects.bulk_create(
+            [
+                EventReminder(event_id=pk, occurrence_start=parse_datetime(start), window=window, batch=batch)
+                for pk, start, window in reminders
+            ],
+            ignore_conflicts=True
+        )
+        claimed = list(EventReminder.objects.filter(batch=batch).select_related('event'))
+
+        for reminder in claimed:
+            announcement = Announcement(
+                title='Event Reminder',
+                body=[{
+                    'element': 'p',
+                    'content': render_to_string(
+                        'event/reminder_body.txt',
+                        context={
+                            'type': Event.EventType(reminder.event.type).label,
+                            'start': reminder.occurrence_start
+                        }
+                    )
+                }]
+            )
+            announcement.save()
+
+    return len(claimed)
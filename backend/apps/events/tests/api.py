@@ -1,14 +1,17 @@
 """This module contains unit tests for the events application's API serializers and viewsets."""
 from datetime import timedelta
 
+from django.db import connection
 from django.urls import reverse
 from django.test import tag
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework import status
+import pytz
 
 from core.testcases import VerboseAPITestCase, Tags
 from core.models import ContactInfo
-from apps.events.models import Event
+from apps.events.models import Event, MeetingAddress
 
 
 class EventEndpointTestCase(VerboseAPITestCase):
@@ -185,3 +188,170 @@ class EventEndpointTestCase(VerboseAPITestCase):
         response = self.client.get(f'{url}/upcoming')
         self.assertEqual(status.HTTP_200_OK, response.status_code)
         self.assertEqual(1, len(response.data))
+
+    @tag(Tags.API)
+    def test_draft_events_excluded(self):
+        """Ensure that draft events are neither listed nor retrievable until they are published.
+        """
+        draft = Event(
+            type=Event.EventType.GUEST_SPEAKER,
+            topics=['Topic'],
+            start=timezone.now() + timedelta(days=2),
+            end=timezone.now() + timedelta(days=2, hours=1),
+            draft=True
+        )
+        draft.save()
+
+        url = reverse('event-list')
+        response = self.client.get(f'{url}/upcoming')
+        self.assertEqual(0, len(response.data))
+        response = self.client.get(f'{url}/{draft.pk}/')
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+        draft.draft = False
+        draft.save()
+        response = self.client.get(f'{url}/upcoming')
+        self.assertEqual(1, len(response.data))
+
+    @tag(Tags.API)
+    def test_upcoming_action_recurring_event(self):
+        """Ensure that the future occurrences of a recurring event which has already started are included in the
+        response when appending `/upcoming` to the URL.
+        """
+        e = Event(
+            type=Event.EventType.PROJECT_MEETING,
+            topics=[],
+            start=timezone.now() - timedelta(days=1),
+            end=timezone.now() - timedelta(days=1) + timedelta(hours=1),
+            recurrence=Event.Recurrence.DAILY,
+            recurrence_end=timezone.now() + timedelta(days=2, hours=12)
+        )
+        e.save()
+
+        url = reverse('event-list')
+        response = self.client.get(f'{url}/upcoming')
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(2, len(response.data))
+
+    @tag(Tags.API)
+    def test_range_action(self):
+        """Ensure that appending `/range` to the URL results in the response only containing events and occurrences of
+        recurring events which start within the specified dates.
+        """
+        e = Event(
+            type=Event.EventType.WORKSHOP,
+            topics=[],
+            start=timezone.datetime(2021, 4, 5, 19, 0, tzinfo=pytz.UTC),
+            end=timezone.datetime(2021, 4, 5, 20, 0, tzinfo=pytz.UTC),
+            recurrence=Event.Recurrence.WEEKLY
+        )
+        e.save()
+
+        url = reverse('event-list')
+        response = self.client.get(f'{url}/range?start=2021-04-01&end=2021-04-30')
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(4, len(response.data))
+        self.assertEqual(Event.Recurrence.WEEKLY.label, response.data[0]['recurrence'])
+        self.assertEqual('04-26-2021', response.data[-1]['start']['date'])
+
+    @tag(Tags.API)
+    def test_range_action_invalid_dates(self):
+        """Ensure that missing, invalid, or out of order dates cause an API response with the 'bad request' status code.
+        """
+        url = reverse('event-list')
+
+        response = self.client.get(f'{url}/range?start=2021-04-01')
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+        response = self.client.get(f'{url}/range?start=2021-04-01&end=April')
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+        response = self.client.get(f'{url}/range?start=2021-04-30&end=2021-04-01')
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    @tag(Tags.API)
+    def test_meeting_address_serialized(self):
+        """Ensure that an event's meeting address is included in an API response.
+        """
+        address = MeetingAddress(
+            street_address='1070 Partners Way',
+            city='Raleigh',
+            state='NC',
+            zip_code=27606,
+            building_name='Hunt Library',
+            room='Duke Energy Hall D'
+        )
+        address.save()
+        self.event.meeting_address = address
+        self.event.save()
+
+        url = reverse('event-list')
+        response = self.client.get(f'{url}/{self.event.pk}/')
+        self.assertEqual('Hunt Library', response.data['meeting_address']['building_name'])
+        self.assertEqual(27606, response.data['meeting_address']['zip_code'])
+
+        address.room = 'Duke Energy Hall A'
+        address.save()
+        response = self.client.get(f'{url}/{self.event.pk}/')
+        self.assertEqual('Duke Energy Hall A', response.data['meeting_address']['room'])
+
+    @tag(Tags.API)
+    def test_meeting_address_not_shared(self):
+        """Ensure that modifying an event's serialized meeting address does not modify the meeting address serialized
+        for other events.
+        """
+        address = MeetingAddress(
+            street_address='1070 Partners Way',
+            city='Raleigh',
+            state='NC',
+            zip_code=27606,
+            building_name='Hunt Library',
+            room='Duke Energy Hall D'
+        )
+        address.save()
+        self.event.meeting_address = address
+        self.event.save()
+
+        url = reverse('event-list')
+        response = self.client.get(f'{url}/{self.event.pk}/')
+        response.data['meeting_address']['room'] = 'Duke Energy Hall A'
+
+        response = self.client.get(f'{url}/{self.event.pk}/')
+        self.assertEqual('Duke Energy Hall D', response.data['meeting_address']['room'])
+
+    @tag(Tags.API)
+    def test_meeting_address_no_query_per_event(self):
+        """Ensure that the number of queries made when listing events does not grow with the number of events that have
+        a meeting address.
+        """
+        address = MeetingAddress(
+            street_address='2610 Cates Ave',
+            city='Raleigh',
+            state='NC',
+            zip_code=27695,
+            building_name='Talley Student Union',
+            room='Room 3285'
+        )
+        address.save()
+
+        def create_event():
+            Event(
+                type=Event.EventType.DISCUSSION,
+                topics=[],
+                start=timezone.now() + timedelta(days=1),
+                end=timezone.now() + timedelta(days=1, hours=1),
+                meeting_address=address
+            ).save()
+
+        url = reverse('event-list')
+        create_event()
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url)
+
+        for _ in range(5):
+            create_event()
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url)
+
+        self.assertEqual(7, len(response.data))
+        self.assertEqual(len(few), len(many))
@@ -1,5 +1,5 @@
 """This module contains unit tests for the events application's Django models."""
-from django.test import tag
+from django.test import tag, override_settings
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from datetime import timedelta
@@ -344,3 +344,149 @@ class TestEventModel(VerboseTestCase):
         event.save()
 
         self.assertEqual(f'{Event.EventType.OTHER.label} from 04-20-2021 to 04-21-2021', str(event))
+
+
+class TestEventRecurrence(VerboseTestCase):
+    """A Django test case class which contains unit tests for the expansion of recurring Event objects.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing Event recurrence...'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Creates and saves a weekly Event object which repeats four times, and a one-off Event object which falls
+        between two of its occurrences.
+        """
+        cls.weekly = Event(
+            type=Event.EventType.PROJECT_MEETING,
+            topics=[],
+            start=timezone.datetime(2021, 4, 5, 19, 0, tzinfo=pytz.UTC),
+            end=timezone.datetime(2021, 4, 5, 20, 0, tzinfo=pytz.UTC),
+            recurrence=Event.Recurrence.WEEKLY,
+            recurrence_end=timezone.datetime(2021, 4, 26, 19, 0, tzinfo=pytz.UTC)
+        )
+        cls.weekly.save()
+
+        cls.one_off = Event(
+            type=Event.EventType.GUEST_SPEAKER,
+            topics=[],
+            start=timezone.datetime(2021, 4, 14, 18, 0, tzinfo=pytz.UTC),
+            end=timezone.datetime(2021, 4, 14, 19, 0, tzinfo=pytz.UTC)
+        )
+        cls.one_off.save()
+
+    @tag(Tags.MODEL)
+    def test_occurrences_expands_recurring_event(self):
+        """Ensure that a recurring event is expanded into one occurrence per interval, up to its `recurrence_end`.
+        """
+        occurrences = [e for e in Event.objects.occurrences() if e.pk == self.weekly.pk]
+
+        self.assertEqual(4, len(occurrences))
+        self.assertEqual(self.weekly.start + timedelta(weeks=3), occurrences[-1].start)
+        self.assertEqual(self.weekly.end + timedelta(weeks=3), occurrences[-1].end)
+
+    @tag(Tags.MODEL)
+    def test_occurrences_merged_in_order(self):
+        """Ensure that one-off events are merged with the occurrences of recurring events in chronological order.
+        """
+        starts = [e.start for e in Event.objects.occurrences()]
+
+        self.assertEqual(5, len(starts))
+        self.assertEqual(sorted(starts), starts)
+        self.assertEqual(self.one_off.start, starts[2])
+
+    @tag(Tags.MODEL)
+    def test_occurrences_window(self):
+        """Ensure that only occurrences starting within the requested window are included.
+        """
+        occurrences = list(Event.objects.occurrences(
+            after=timezone.datetime(2021, 4, 10, tzinfo=pytz.UTC),
+            before=timezone.datetime(2021, 4, 20, tzinfo=pytz.UTC)
+        ))
+
+        self.assertEqual(3, len(occurrences))
+        self.assertEqual(self.weekly.start + timedelta(weeks=1), occurrences[0].start)
+        self.assertEqual(self.one_off.pk, occurrences[1].pk)
+        self.assertEqual(self.weekly.start + timedelta(weeks=2), occurrences[2].start)
+
+    @tag(Tags.MODEL)
+    @override_settings(EVENT_TIME_ZONE='America/New_York')
+    def test_occurrences_keep_local_time_across_dst(self):
+        """Ensure that the occurrences of a recurring event keep their local time of day when daylight saving time
+        starts or ends between them, rather than moving by an hour.
+        """
+        eastern = pytz.timezone('America/New_York')
+        start = eastern.localize(timezone.datetime(2021, 3, 1, 18, 0))
+        event = Event(
+            type=Event.EventType.PROJECT_MEETING,
+            topics=[],
+            start=start,
+            end=start + timedelta(hours=1),
+            recurrence=Event.Recurrence.WEEKLY,
+            recurrence_end=eastern.localize(timezone.datetime(2021, 11, 30, 18, 0))
+        )
+        event.save()
+
+        occurrences = [e for e in Event.objects.occurrences(
+            after=timezone.datetime(2021, 3, 1, tzinfo=pytz.UTC),
+            before=timezone.datetime(2021, 12, 1, tzinfo=pytz.UTC)
+        ) if e.pk == event.pk]
+
+        self.assertEqual(40, len(occurrences))
+        for occurrence in occurrences:
+            local_start = occurrence.start.astimezone(eastern)
+            self.assertEqual((18, 0), (local_start.hour, local_start.minute))
+            self.assertEqual(timedelta(hours=1), occurrence.end - occurrence.start)
+
+        # Daylight saving time started on March 14 and ended on November 7, 2021.
+        self.assertEqual(23, occurrences[1].start.astimezone(pytz.UTC).hour)
+        self.assertEqual(22, occurrences[2].start.astimezone(pytz.UTC).hour)
+        self.assertEqual(23, occurrences[-4].start.astimezone(pytz.UTC).hour)
+
+    @tag(Tags.MODEL)
+    def test_occurrences_limit(self):
+        """Ensure that no more than `limit` occurrences are included.
+        """
+        self.assertEqual(3, len(list(Event.objects.occurrences(limit=3))))
+
+    @tag(Tags.MODEL)
+    def test_occurrence_delegates_to_event(self):
+        """Ensure that an occurrence of a recurring event has the same attributes as the event, other than its start and
+        end date and time.
+        """
+        occurrence = list(Event.objects.occurrences())[-1]
+
+        self.assertEqual(self.weekly.pk, occurrence.pk)
+        self.assertEqual(self.weekly.type, occurrence.type)
+        self.assertEqual(self.weekly.topics, occurrence.topics)
+
+    @tag(Tags.MODEL, Tags.VALIDATION)
+    def test_recurrence_end_without_recurrence(self):
+        """Ensure that a ValidationError is raised for a one-off event with a `recurrence_end`.
+        """
+        event = Event(
+            type=Event.EventType.WORKSHOP,
+            topics=[],
+            start=timezone.now(),
+            end=timezone.now() + timedelta(hours=1),
+            recurrence_end=timezone.now() + timedelta(days=7)
+        )
+
+        self.assertRaises(ValidationError, event.full_clean)
+
+    @tag(Tags.MODEL, Tags.VALIDATION)
+    def test_recurrence_end_before_start(self):
+        """Ensure that a ValidationError is raised for a recurring event whose `recurrence_end` falls before its start.
+        """
+        event = Event(
+            type=Event.EventType.WORKSHOP,
+            topics=[],
+            start=timezone.now(),
+            end=timezone.now() + timedelta(hours=1),
+            recurrence=Event.Recurrence.WEEKLY,
+            recurrence_end=timezone.now() - timedelta(days=7)
+        )
+
+        self.assertRaises(ValidationError, event.full_clean)
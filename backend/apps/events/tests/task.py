@@ -2,11 +2,13 @@
 from datetime import timedelta
 from unittest.mock import patch
 
-from django.test import tag
+from django.test import tag, override_settings
 from django.utils import timezone
 
 from core.testcases import VerboseTestCase, Tags
-from apps.events.models import Event
+from apps.announcements.models import Announcement
+from apps.events.models import Event, EventReminder
+from apps.events.tasks import schedule_event_reminders, send_event_reminders
 
 
 class TestEventsTasks(VerboseTestCase):
@@ -55,3 +57,76 @@ class TestEventsTasks(VerboseTestCase):
         self.assertTrue(event_rescheduled.called)
         self.assertEqual(Event.EventType(event.type).label, event_rescheduled.call_args[0][0])
         self.assertEqual(event.start, event_rescheduled.call_args[0][1])
+
+
+@override_settings(EVENT_REMINDER_WINDOWS=[1440, 60], EVENT_REMINDER_BATCH_SIZE=2)
+class TestEventReminderTasks(VerboseTestCase):
+    """A Django test case class which contains unit tests for the event reminder Celery tasks.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing event reminder tasks...'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Creates and saves events starting within each reminder window, and an event starting outside of them.
+        """
+        cls.soon = Event(
+            type=Event.EventType.WORKSHOP,
+            topics=[],
+            start=timezone.now() + timedelta(minutes=30),
+            end=timezone.now() + timedelta(hours=2)
+        )
+        cls.soon.save()
+
+        cls.tomorrow = Event(
+            type=Event.EventType.GUEST_SPEAKER,
+            topics=[],
+            start=timezone.now() + timedelta(hours=12),
+            end=timezone.now() + timedelta(hours=13)
+        )
+        cls.tomorrow.save()
+
+        cls.later = Event(
+            type=Event.EventType.DISCUSSION,
+            topics=[],
+            start=timezone.now() + timedelta(days=3),
+            end=timezone.now() + timedelta(days=3, hours=1)
+        )
+        cls.later.save()
+
+    @tag(Tags.TASK)
+    @patch('apps.events.tasks.send_event_reminders.delay')
+    def test_schedule_event_reminders(self, send):
+        """Ensure that a reminder is scheduled, for the smallest applicable window, for each event starting within the
+        reminder windows.
+        """
+        self.assertEqual(2, schedule_event_reminders())
+        self.assertEqual(1, send.call_count)
+
+        reminders = {pk: window for pk, _, window in send.call_args[0][0]}
+        self.assertEqual({self.soon.pk: 60, self.tomorrow.pk: 1440}, reminders)
+
+    @tag(Tags.TASK)
+    @patch('apps.events.tasks.send_event_reminders.delay')
+    def test_schedule_event_reminders_skips_sent(self, send):
+        """Ensure that reminders which have already been sent are not scheduled again.
+        """
+        send_event_reminders([[self.soon.pk, self.soon.start.isoformat(), 60]])
+
+        self.assertEqual(1, schedule_event_reminders())
+        self.assertEqual(self.tomorrow.pk, send.call_args[0][0][0][0])
+
+    @tag(Tags.TASK)
+    def test_send_event_reminders_idempotent(self):
+        """Ensure that sending the same reminder more than once only records and announces it once.
+        """
+        reminder = [self.soon.pk, self.soon.start.isoformat(), 60]
+        announcements = Announcement.objects.count()
+
+        self.assertEqual(1, send_event_reminders([reminder]))
+        self.assertEqual(0, send_event_reminders([reminder]))
+
+        self.assertEqual(1, EventReminder.objects.filter(event=self.soon).count())
+        self.assertEqual(announcements + 1, Announcement.objects.count())
@@ -1,4 +1,8 @@
 """This module contains Django Rest Framework viewsets for events application models."""
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -16,21 +20,26 @@ class EventViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = EventSerializer
 
     def get_queryset(self):
-        """Conditionally evaluates the queryset used to populate responses depending on the action of a request.
+        """Returns the queryset used to populate responses, with each Event's meeting address loaded in the same query
+        and its related ContactInfo objects prefetched. Draft events are excluded.
         """
-        if self.action == 'upcoming':
-            return Event.objects.upcoming().prefetch_related('contacts')
-        else:
-            return Event.objects.all().prefetch_related('contacts')
+        return Event.objects.filter(draft=False).select_related('meeting_address').prefetch_related('contacts')
 
-    def list(self, request, *args, **kwargs):
+    def list(self, request, *args, after=None, before=None, **kwargs):
         """Overrides the built-in ModelViewSet `list` action to check for supported query parameters.
 
+        The response contains one-off events merged with the occurrences of recurring events, in chronological order.
         As-is, the only supported query parameter is `count` which may be used to specify the exact number of events to
         include in the response. Note: If the specified number of events to include in the response exceeds the number
         of events in the database, all the events are included in the response rather than raising an error or returning
         an HTTP 400 response.
+
+        Args:
+            request: The request being processed.
+            after: An optional datetime. If specified, only events starting at or after it are included.
+            before: An optional datetime. If specified, only events starting before it are included.
         """
+        count = None
         if 'count' in request.query_params:
             try:
                 count = int(request.query_params['count'])
@@ -39,14 +48,36 @@ class EventViewSet(viewsets.ReadOnlyModelViewSet):
             else:
                 if count < 1:
                     return Response(status=status.HTTP_400_BAD_REQUEST)
-                serializer = self.get_serializer(self.get_queryset()[:count], many=True)
-        else:
-            serializer = self.get_serializer(self.get_queryset(), many=True)
+
+        events = self.get_queryset().occurrences(after=after, before=before, limit=count)
+        serializer = self.get_serializer(list(events), many=True)
 
         return Response(serializer.data)
 
     @action(detail=False)
     def upcoming(self, request, *args, **kwargs):
-        """A custom viewset action which returns a list of upcoming Events.
+        """A custom viewset action which returns a list of upcoming Events and occurrences of recurring Events.
+        """
+        return self.list(request, *args, after=timezone.now(), **kwargs)
+
+    @action(detail=False, url_path='range')
+    def date_range(self, request, *args, **kwargs):
+        """A custom viewset action which returns a list of the Events and occurrences of recurring Events which start
+        within a range of dates.
+
+        The range is specified with the required `start` and `end` query parameters, which are dates in the format
+        YYYY-MM-DD. Both dates are inclusive. An HTTP 400 response is returned if either date is missing or invalid, or
+        if the end date falls before the start date. The `count` query parameter is supported as in the `list` action.
         """
-        return self.list(request, *args, **kwargs)
+        try:
+            start = parse_date(request.query_params['start'])
+            end = parse_date(request.query_params['end'])
+        except (KeyError, ValueError):
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+
+        if start is None or end is None or end < start:
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+
+        after = timezone.make_aware(datetime.combine(start, time.min))
+        before = timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min))
+        return self.list(request, *args, after=after, before=before, **kwargs)
@@ -0,0 +1,35 @@
+"""This module contains the RSS and Atom feeds of group projects."""
+from django.conf import settings
+from django.utils.html import linebreaks
+
+from apps.projects.models import Project
+from core.feeds import CachedFeed
+
+
+class ProjectFeed(CachedFeed):
+    """A cached feed containing the most recently edited group projects.
+    """
+    name = 'projects'
+    title = 'AI at NC State Projects'
+    description = 'Group projects from the AI at NC State club.'
+    path = '/api/projects/feed'
+
+    def items(self):
+        """Returns the most recently edited projects, up to the configured ``FEED_ITEM_COUNT``.
+        """
+        fields = ('id', 'name', 'authors', 'description', 'url', 'modified')
+        return Project.objects.only(*fields).order_by('-modified')[:settings.FEED_ITEM_COUNT]
+
+    def item_kwargs(self, item):
+        """Returns the name, link, description, authors, and modification date of a project. Projects link to their
+        external website if they have one, and to their API endpoint otherwise.
+        """
+        return {
+            'title': item.name,
+            'link': item.url or f'/api/projects/{item.pk}/',
+            'unique_id': f'/api/projects/{item.pk}/',
+            'description': linebreaks(item.description, autoescape=True),
+            'author_name': ', '.join(item.authors),
+            'pubdate': item.modified,
+            'updateddate': item.modified,
+        }
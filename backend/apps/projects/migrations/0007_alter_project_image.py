@@ -0,0 +1,21 @@
+# Generated by Django 3.1.2 on 2026-10-19 22:15
+
+import apps.projects.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_project_image_derivatives'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='project',
+            name='image',
+            field=models.ImageField(
+                blank=True, null=True, upload_to=apps.projects.models.image_path, verbose_name='Project Image'
+            ),
+        ),
+    ]
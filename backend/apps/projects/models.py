@@ -1,10 +1,12 @@
 """This module contains Django models that relate to group projects."""
-from django.db import models
+from django.db import models, transaction
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
+from core import images, media
+from core.tasks import generate_image_derivatives
 from core.validators import JSONSchemaValidator
-from apps.projects.tasks import project_created
+from apps.projects.tasks import project_created, rebuild_project_feed
 
 
 # A JSON schema used in validating the authors field of the Projects model. This field is only valid if it contains a
@@ -63,6 +65,10 @@ class Project(models.Model):
 
         image: An ImageField representing the project's image in the database.
 
+        image_derivatives: A JSONField containing the metadata of the resized WebP and JPEG versions of the project's
+        image, as well as the image's dimensions, dominant color, and blurred placeholder, which are generated
+        asynchronously when a new image is saved (see the core.images module).
+
         url: An optional URLField containing a link to an external website where the project is hosted (e.g., github).
 
         status: A CharField containing the status of the project. The available statuses are defined in the
@@ -122,10 +128,18 @@ class Project(models.Model):
         null=True,
         blank=True,
         editable=True,
-        unique=True,
+        unique=False,
         verbose_name='Project Image',
         upload_to=image_path
     )
+    image_derivatives = models.JSONField(
+        default=dict,
+        null=False,
+        blank=True,
+        editable=False,
+        unique=False,
+        verbose_name='Project Image Derivatives'
+    )
     url = models.URLField(
         null=True,
         blank=True,
@@ -175,8 +189,28 @@ class Project(models.Model):
 # noinspection PyUnusedLocal
 @receiver(models.signals.post_delete, sender=Project)
 def auto_delete_file_on_delete(sender, instance, **kwargs):
-    """Deletes the image file of a Project object when the object is in the process of being deleted.
+    """Deletes the image file of a Project object, and the files of its derivatives, when the object is in the process
+    of being deleted. Files which are shared with another object (i.e., identical uploads) are kept.
 
     Reference: https://stackoverflow.com/a/16041527
     """
-    instance.image.delete(save=False)
+    images.delete(instance.image_derivatives, instance.image.storage)
+    media.delete_unreferenced(instance.image.storage, [instance.image.name])
+
+
+# noinspection PyUnusedLocal
+@receiver(models.signals.post_save, sender=Project)
+def generate_derivatives_on_change(sender, instance, **kwargs):
+    """Generates the derivatives of a Project object's image once the object has been saved with a new image.
+    """
+    if images.outdated(instance.image, instance.image_derivatives):
+        transaction.on_commit(lambda: generate_image_derivatives.delay('projects.Project', instance.pk, 'image'))
+
+
+# noinspection PyUnusedLocal
+@receiver(models.signals.post_save, sender=Project)
+@receiver(models.signals.post_delete, sender=Project)
+def rebuild_feed_on_change(sender, instance, **kwargs):
+    """Rebuilds the cached project feeds once a Project object has been saved or deleted.
+    """
+    transaction.on_commit(rebuild_project_feed.delay)
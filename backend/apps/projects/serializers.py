@@ -2,6 +2,7 @@
 from rest_framework import serializers
 
 from apps.projects.models import Project
+from core.images import preview, srcset
 
 
 # noinspection PyMethodMayBeStatic
@@ -9,19 +10,25 @@ class ProjectSerializer(serializers.ModelSerializer):
     """A simple Django Rest Framework serializer for the Project model.
 
     The serialized representation of a project object includes its name, list of authors, long-form description, the
-    relative URL of its ``image`` field, the URL to an external website where the project is hosted, the label
-    associated with the object's ``status`` field, and an object containing a formatted representation of the date and
-    time of its ``modified``.
+    relative URLs of its ``image`` field and of the resized versions of its image, the image's dimensions and
+    placeholder, the URL to an external website where the project is hosted, the label associated with the object's
+    ``status`` field, and an object containing a formatted representation of the date and time of its ``modified``.
 
     Attributes:  # noqa
         image_url: A serializer method field that is included in the serialized representation of a Project object
         rather than the object's ``image`` field itself.
+        image_srcset: A serializer method field which contains the URLs and widths of the resized versions of the
+        project's image, in a structure which maps onto a ``<picture>`` element.
+        image_preview: A serializer method field which contains the dimensions, dominant color, and blurred placeholder
+        of the project's image, which are shown while the image loads.
         status: A serializer method field which retrieves and returns the label associated with the Project object's
         ``status``.
         modified: A serializer method field which retrieves and returns formatted representations of the date and time
         when the project was last modified in a dictionary.
     """
     image_url = serializers.SerializerMethodField(read_only=True)
+    image_srcset = serializers.SerializerMethodField(read_only=True)
+    image_preview = serializers.SerializerMethodField(read_only=True)
     status = serializers.SerializerMethodField(read_only=True)
     modified = serializers.SerializerMethodField(read_only=True)
 
@@ -40,6 +47,33 @@ class ProjectSerializer(serializers.ModelSerializer):
 
         return ''
 
+    def get_image_srcset(self, obj):
+        """A get method for the ProjectSerializer class' ``image_srcset`` attribute.
+
+        Args:
+            obj: The instance of the Project model class that is being serialized.
+
+        Returns:
+            A dictionary containing the ``src``, ``width``, and ``height`` of the largest JPEG version of the image, and
+            the ``sources`` from which browsers choose the smallest version which fills the project's card, or None if
+            the project does not have an image or its resized versions have not been generated yet (see the
+            core.images module).
+        """
+        return srcset(obj.image_derivatives, obj.image.storage)
+
+    def get_image_preview(self, obj):
+        """A get method for the ProjectSerializer class' ``image_preview`` attribute.
+
+        Args:
+            obj: The instance of the Project model class that is being serialized.
+
+        Returns:
+            A dictionary containing the ``width``, ``height``, dominant ``color``, and ``placeholder`` data URI of the
+            image, which are stored when the image is processed so that the image file is not opened, or None if the
+            project does not have an image or it has not been processed yet (see the core.images module).
+        """
+        return preview(obj.image_derivatives)
+
     def get_status(self, obj):
         """A get method for the ProjectSerializer class' ``status`` attribute.
 
@@ -75,4 +109,6 @@ class ProjectSerializer(serializers.ModelSerializer):
             fields: A list of the fields to include in the serialized representation of a Project model instance.
         """
         model = Project
-        fields = ['name', 'authors', 'description', 'image_url', 'url', 'status', 'modified']
+        fields = [
+            'name', 'authors', 'description', 'image_url', 'image_srcset', 'image_preview', 'url', 'status', 'modified'
+        ]
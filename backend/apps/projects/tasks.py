@@ -40,3 +40,11 @@ def project_created(name, authors, description, url):
         ]
     )
     announcement.save()
+
+
+@shared_task
+def rebuild_project_feed():
+    """Rebuilds the cached RSS and Atom feeds of projects.
+    """
+    from apps.projects.feeds import ProjectFeed
+    ProjectFeed().rebuild()
@@ -1,6 +1,6 @@
 """This module contains unit tests for the projects application's API serializers and viewsets."""
 from django.urls import reverse
-from django.test import tag
+from django.test import tag, override_settings
 from rest_framework import status
 
 from apps.projects.models import Project
@@ -111,3 +111,18 @@ class ProjectEndpointTestCase(VerboseAPITestCase):
 
         self.assertTrue('time' in modified)
         self.assertEqual(self.project.modified.strftime('%I:%M %p'), modified['time'])
+
+    @tag(Tags.API)
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_feed(self):
+        """Ensure that the project feed contains the projects, and that an unchanged feed is not sent again.
+        """
+        url = reverse('project-feed', kwargs={'feed_format': 'atom'})
+
+        response = self.client.get(url)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertIn('<title>Test Project</title>', response.content.decode())
+        self.assertIn('Author 1, Author 2', response.content.decode())
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(status.HTTP_304_NOT_MODIFIED, response.status_code)
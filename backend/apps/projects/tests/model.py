@@ -1,4 +1,6 @@
 """This module contains unit tests for the projects application's Django models."""
+import hashlib
+
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.test import tag
@@ -114,7 +116,8 @@ class TestProjectModel(VerboseTestCase):
 
     @tag(Tags.MODEL)
     def test_logo_path_properly_assigned(self):
-        """Ensure that the URL and name of a project's image are properly assigned when creating a Project object.
+        """Ensure that the URL and name of a project's image are properly assigned when creating a Project object, in
+        the project's directory and named after the digest of the image's contents.
         """
         project = Project(
             name='Test Project',
@@ -126,7 +129,8 @@ class TestProjectModel(VerboseTestCase):
         project.save()
 
         try:
-            self.assertEqual(f'{settings.MEDIA_URL}{BASE_IMAGE_PATH}test_project/main_image.png', project.image.url)
+            digest = hashlib.sha256(b'file_content').hexdigest()[:32]
+            self.assertEqual(f'{settings.MEDIA_URL}{BASE_IMAGE_PATH}test_project/{digest}.png', project.image.url)
         except AssertionError as e:
             project.delete()
             self.fail(e)
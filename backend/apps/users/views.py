@@ -3,13 +3,13 @@ from uuid import uuid4
 
 from django.contrib.auth import authenticate, login
 from django.conf import settings
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
 
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from core.mail import enqueue
 from apps.users.models import User
 from apps.users.serializers import UserSerializer, UserWriteSerializer
 
@@ -82,11 +82,10 @@ class UserViewSet(viewsets.ModelViewSet):
         if User.objects.filter(email=request.data['email']).exists():
             user = User.objects.get(email=request.data['email'])
             params = {'user': user, 'DOMAIN': settings.DOMAIN}
-            send_mail(
+            enqueue(
                 subject='Password reset',
-                message=render_to_string('mail/password_reset.txt', params),
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[request.data['email']],
+                body=render_to_string('mail/password_reset.txt', params),
+                recipients=[request.data['email']],
             )
             return Response(status=status.HTTP_200_OK)
         else:
@@ -1,5 +1,6 @@
 import os
 from celery import Celery
+from celery.signals import worker_process_init
 
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
@@ -7,3 +8,15 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 app = Celery('config')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
+
+
+@worker_process_init.connect
+def warm_template_cache(**kwargs):
+    """Compiles the project's templates when a worker process starts, so that tasks render them from memory when the
+    ``TEMPLATE_CACHE`` setting is enabled (see the core.templating module).
+    """
+    from django.conf import settings
+    from core.templating import warm
+
+    if settings.TEMPLATE_CACHE:
+        warm()
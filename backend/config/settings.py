@@ -96,6 +96,20 @@ DOMAIN = env.str('DOMAIN')
 EMAIL_PORT = env.int('EMAIL_PORT', default='1025')
 EMAIL_HOST = env.str('EMAIL_HOST', default='mailhog')
 
+# The maximum number of queued emails which are sent over a single connection by each Celery task (see core.mail).
+MAIL_BATCH_SIZE = env.int('MAIL_BATCH_SIZE', default=50)
+
+# The maximum number of open connections to the email server kept by each worker process, and the number of seconds
+# for which an open connection is reused.
+MAIL_POOL_SIZE = env.int('MAIL_POOL_SIZE', default=2)
+MAIL_CONNECTION_MAX_AGE = env.int('MAIL_CONNECTION_MAX_AGE', default=60)
+
+# The number of times that an email which could not be sent is retried, the number of seconds before the first retry,
+# and the maximum number of seconds between retries. The time between retries doubles after each retry.
+MAIL_MAX_RETRIES = env.int('MAIL_MAX_RETRIES', default=5)
+MAIL_RETRY_BACKOFF = env.int('MAIL_RETRY_BACKOFF', default=30)
+MAIL_RETRY_BACKOFF_MAX = env.int('MAIL_RETRY_BACKOFF_MAX', default=3600)
+
 # MANAGER CONFIGURATION
 # ------------------------------------------------------------------------------
 # See: https://docs.djangoproject.com/en/dev/ref/settings/#admins
@@ -167,6 +181,107 @@ MEDIA_ROOT = str(ROOT_DIR('media'))
 # See: https://docs.djangoproject.com/en/dev/ref/settings/#media-url
 MEDIA_URL = '/media/'
 
+# Uploaded files are named after a digest of their contents, so that they can be cached as immutable (see the
+# core.storage module).
+# See: https://docs.djangoproject.com/en/dev/ref/settings/#default-file-storage
+DEFAULT_FILE_STORAGE = 'core.storage.ContentHashStorage'
+
+# What is done with uploaded files which are no longer referenced by any object (e.g., replaced images): either
+# `quarantine`, in which case they are moved into MEDIA_ROOT/.quarantine, or `delete` (see the core.media module).
+MEDIA_GC_ACTION = env.str('MEDIA_GC_ACTION', default='quarantine')
+
+# The minimum age in seconds of an unreferenced file which is collected, so that files which are still being uploaded
+# are not collected before the objects which reference them are saved.
+MEDIA_GC_MIN_AGE = env.int('MEDIA_GC_MIN_AGE', default=86400)
+
+# The number of files whose references are checked at a time.
+MEDIA_GC_BATCH_SIZE = env.int('MEDIA_GC_BATCH_SIZE', default=1000)
+
+# The number of days after which quarantined files are deleted.
+MEDIA_GC_QUARANTINE_DAYS = env.int('MEDIA_GC_QUARANTINE_DAYS', default=30)
+
+# The widths in pixels to which uploaded images (e.g., affiliate logos) are resized, in both WebP and JPEG, so that
+# browsers can download the smallest image which fills its card (see the core.images module). Images are never enlarged.
+IMAGE_DERIVATIVE_WIDTHS = env.list('IMAGE_DERIVATIVE_WIDTHS', cast=int, default=[160, 320, 640, 1280])
+
+# The quality, between 1 and 100, with which resized images are encoded.
+IMAGE_DERIVATIVE_QUALITY = env.int('IMAGE_DERIVATIVE_QUALITY', default=80)
+
+# The width in pixels of the blurred placeholders which are shown while uploaded images load.
+IMAGE_PLACEHOLDER_WIDTH = env.int('IMAGE_PLACEHOLDER_WIDTH', default=16)
+
+# EVENTS CONFIGURATION
+# ------------------------------------------------------------------------------
+# The number of days from now up to which recurring events without an explicit end are expanded into occurrences.
+EVENT_RECURRENCE_HORIZON_DAYS = env.int('EVENT_RECURRENCE_HORIZON_DAYS', default=180)
+
+# The time zone in which events are held. Recurring events repeat at the same local time of day in this time zone, even
+# when daylight saving time starts or ends between two of their occurrences.
+EVENT_TIME_ZONE = env.str('EVENT_TIME_ZONE', default='America/New_York')
+
+# The number of minutes before the start of an event at which reminders are sent. A reminder is sent for each window.
+EVENT_REMINDER_WINDOWS = env.list('EVENT_REMINDER_WINDOWS', cast=int, default=[1440, 60])
+
+# The maximum number of reminders sent by a single Celery task.
+EVENT_REMINDER_BATCH_SIZE = env.int('EVENT_REMINDER_BATCH_SIZE', default=100)
+
+# ANNOUNCEMENTS CONFIGURATION
+# ------------------------------------------------------------------------------
+# The number of years, including the current year, whose announcements are kept in the announcements table. Older
+# announcements are archived into standalone tables by the `maintain_announcement_partitions` task.
+ANNOUNCEMENT_RETENTION_YEARS = env.int('ANNOUNCEMENT_RETENTION_YEARS', default=3)
+
+# The number of seconds after which a heartbeat is sent on an otherwise idle announcement stream.
+ANNOUNCEMENT_STREAM_HEARTBEAT = env.int('ANNOUNCEMENT_STREAM_HEARTBEAT', default=15)
+
+# The number of seconds that clients wait before reconnecting to a closed announcement stream.
+ANNOUNCEMENT_STREAM_RETRY = env.int('ANNOUNCEMENT_STREAM_RETRY', default=5)
+
+# The maximum number of announcements buffered for a client which is not reading its announcement stream.
+ANNOUNCEMENT_STREAM_QUEUE_SIZE = env.int('ANNOUNCEMENT_STREAM_QUEUE_SIZE', default=32)
+
+# CONTACT CONFIGURATION
+# ------------------------------------------------------------------------------
+# The number of seconds for which the response to a contact form submission is returned for retries of the submission.
+CONTACT_IDEMPOTENCY_TTL = env.int('CONTACT_IDEMPOTENCY_TTL', default=86400)
+
+# How newly submitted contact forms are stored: either `multi-table`, in which the fields specific to each type of form
+# are stored in a separate table, or `single-table`, in which they are stored in a JSONB column of the ContactFormBase
+# table (see the apps.contact.storage module). Existing contact forms are converted with `convert_contact_forms`.
+CONTACT_FORM_STORAGE = env.str('CONTACT_FORM_STORAGE', default='multi-table')
+
+# The minimum score, between 0 and 1, of a pair of contact forms which are considered to be from the same submitter.
+CONTACT_DEDUPE_THRESHOLD = env.float('CONTACT_DEDUPE_THRESHOLD', default=0.9)
+
+# The maximum number of contact forms which may share a blocking key (e.g., a word in their affiliations) for them to be
+# compared while detecting duplicate submitters. Larger blocks are too unspecific to be useful.
+CONTACT_DEDUPE_MAX_BLOCK_SIZE = env.int('CONTACT_DEDUPE_MAX_BLOCK_SIZE', default=50)
+
+# The number of contact forms which are scored or trained at a time by the spam classifier.
+CONTACT_SPAM_BATCH_SIZE = env.int('CONTACT_SPAM_BATCH_SIZE', default=500)
+
+# The minimum spam score, between 0 and 1, of a contact form which is listed as likely spam in the admin site.
+CONTACT_SPAM_THRESHOLD = env.float('CONTACT_SPAM_THRESHOLD', default=0.9)
+
+# The length in minutes of the weekly meetings of mentors and student groups. Each weekday/time in the meeting
+# information of a mentor or mentorship request is the start of a meeting of this length (see apps.contact.matching).
+CONTACT_MENTOR_MEETING_MINUTES = env.int('CONTACT_MENTOR_MEETING_MINUTES', default=60)
+
+# The email addresses which are sent a digest of the newly submitted contact forms every 15 minutes, with one summary
+# email per type of contact form (see the apps.contact.digest module). Defaults to the addresses of the ADMINS.
+CONTACT_DIGEST_RECIPIENTS = env.list('CONTACT_DIGEST_RECIPIENTS', default=[email for _, email in ADMINS])
+
+# The maximum number of contact forms of each type which are listed in a digest. The rest are only counted.
+CONTACT_DIGEST_MAX_ITEMS = env.int('CONTACT_DIGEST_MAX_ITEMS', default=25)
+
+# FEED CONFIGURATION
+# ------------------------------------------------------------------------------
+# The URL of the website, which the links in the RSS and Atom feeds are relative to.
+FEED_SITE_URL = env.str('FEED_SITE_URL', default='http://localhost')
+
+# The maximum number of entries included in each RSS and Atom feed.
+FEED_ITEM_COUNT = env.int('FEED_ITEM_COUNT', default=50)
+
 # URL Configuration
 # ------------------------------------------------------------------------------
 ROOT_URLCONF = 'config.urls'
@@ -176,6 +291,17 @@ WSGI_APPLICATION = 'config.wsgi.application'
 
 # TEMPLATE CONFIGURATION
 # ------------------------------------------------------------------------------
+TEMPLATE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
+# Whether compiled templates are kept in memory rather than being read and parsed from disk whenever they are rendered.
+# Celery workers compile the project's templates when they start (see the core.templating module).
+TEMPLATE_CACHE = env.bool('TEMPLATE_CACHE', default=not DEBUG)
+if TEMPLATE_CACHE:
+    TEMPLATE_LOADERS = [('django.template.loaders.cached.Loader', TEMPLATE_LOADERS)]
+
 # See: https://docs.djangoproject.com/en/dev/ref/settings/#templates
 TEMPLATES = [
     {
@@ -183,10 +309,7 @@ TEMPLATES = [
         'DIRS': STATICFILES_DIRS,
         'OPTIONS': {
             'debug': DEBUG,
-            'loaders': [
-                'django.template.loaders.filesystem.Loader',
-                'django.template.loaders.app_directories.Loader',
-            ],
+            'loaders': TEMPLATE_LOADERS,
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -255,3 +378,55 @@ REST_FRAMEWORK = {
 # Celery/redis config
 CELERY_BROKER_URL = f'redis://{env.str("REDIS_HOST")}:6379'
 CELERY_RESULT_BACKEND = f'redis://{env.str("REDIS_HOST")}:6379'
+
+# Cache configuration
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': f'redis://{env.str("REDIS_HOST")}:6379/1',
+    }
+}
+
+# Celery beat schedule
+CELERY_BEAT_SCHEDULE = {
+    'schedule-event-reminders': {
+        'task': 'apps.events.tasks.schedule_event_reminders',
+        'schedule': crontab(minute='*/5'),
+    },
+    'update-announcement-visibility': {
+        'task': 'apps.announcements.tasks.update_announcement_visibility',
+        'schedule': crontab(),
+    },
+    'maintain-announcement-partitions': {
+        'task': 'apps.announcements.tasks.maintain_announcement_partitions',
+        'schedule': crontab(hour=3, minute=0),
+    },
+    'detect-duplicate-submitters': {
+        'task': 'apps.contact.tasks.detect_duplicate_submitters',
+        'schedule': crontab(minute=30),
+    },
+    'score-contact-forms': {
+        'task': 'apps.contact.tasks.score_contact_forms',
+        'schedule': crontab(),
+    },
+    'train-spam-classifier': {
+        'task': 'apps.contact.tasks.train_spam_classifier',
+        'schedule': crontab(minute='*/15'),
+    },
+    'schedule-guest-speakers': {
+        'task': 'apps.contact.tasks.schedule_guest_speakers',
+        'schedule': crontab(minute=45),
+    },
+    'send-contact-digest': {
+        'task': 'apps.contact.tasks.send_contact_digest',
+        'schedule': crontab(minute='*/15'),
+    },
+    'deliver-queued-mail': {
+        'task': 'core.tasks.deliver_queued_mail',
+        'schedule': crontab(),
+    },
+    'collect-orphaned-media': {
+        'task': 'core.tasks.collect_orphaned_media',
+        'schedule': crontab(hour=4, minute=0),
+    },
+}
@@ -3,6 +3,9 @@ from django.contrib import admin
 from django.contrib.auth import logout
 from django.conf.urls import include
 from config.api import api
+from apps.announcements.feeds import AnnouncementFeed
+from apps.announcements.views import announcement_stream
+from apps.projects.feeds import ProjectFeed
 
 
 def trigger_error(request):
@@ -12,6 +15,9 @@ def trigger_error(request):
 urlpatterns = [
     path('admin/', admin.site.urls, name='admin'),
     path('logout/', logout, {'next_page': '/'}, name='logout'),
+    path('api/announcements/feed.<str:feed_format>', AnnouncementFeed().as_view(), name='announcement-feed'),
+    path('api/announcements/stream', announcement_stream, name='announcement-stream'),
+    path('api/projects/feed.<str:feed_format>', ProjectFeed().as_view(), name='project-feed'),
     path('api/', include(api.urls)),
     path('api-auth/', include('rest_framework.urls', namespace='rest_framework')),
     path('admin-sentry-debug/', trigger_error),
@@ -1,11 +1,32 @@
 """This module contains core Admin site functionality."""
 from django import forms
 from django.contrib.contenttypes.admin import GenericTabularInline
+from django.contrib.contenttypes.forms import BaseGenericInlineFormSet
+from django.contrib.contenttypes.models import ContentType
 from django_admin_json_editor import JSONEditorWidget
 
 from core.models import ContactInfo
 
 
+class GenericRelationInlineFormSet(BaseGenericInlineFormSet):
+    """A formset for generic inlines which sets the content type of each inline object's generic relation before it is
+    validated.
+
+    By default, the content type of a new inline object's generic relation is only set once the object is saved, so
+    model validation which checks the content type would otherwise reject every new inline object.
+    """
+    def _construct_form(self, i, **kwargs):
+        """Overrides the default form construction method to set the content type of the form's object to that of the
+        object being edited on the admin page.
+        """
+        form = super()._construct_form(i, **kwargs)
+        if self.instance is not None and getattr(form.instance, self.ct_field.get_attname()) is None:
+            content_type = ContentType.objects.get_for_model(self.instance, for_concrete_model=self.for_concrete_model)
+            setattr(form.instance, self.ct_field.get_attname(), content_type.pk)
+
+        return form
+
+
 class ContactInfoTabularInline(GenericTabularInline):
     """Defines an inline Django admin element to add/edit contact information on the event admin page.
 
@@ -17,6 +38,8 @@ class ContactInfoTabularInline(GenericTabularInline):
     Attributes:  # noqa
         model: The model class that this inline model admin allows the creation/editing of (ContactInfo).
 
+        formset: The formset class used to validate the inline ContactInfo objects.
+
         extra: The number of "new" ContactInfo's are displayed on the admin page by default.
 
         verbose_name: A long-form, singular name for the inline to be displayed on the admin site.
@@ -24,6 +47,7 @@ class ContactInfoTabularInline(GenericTabularInline):
         verbose_name_plural: A long-form, plural name for the inline to be displayed on the admin site.
     """
     model = ContactInfo
+    formset = GenericRelationInlineFormSet
     extra = 1
     verbose_name = 'Point of Contact'
     verbose_name_plural = 'Points of Contact'
@@ -0,0 +1,54 @@
+"""This module contains helpers for validating generic relations without loading the related objects.
+
+Models with a GenericForeignKey only allow it to relate to a few model types. Rather than loading the related object to
+check its class, the ``content_type_id`` stored on the model is compared with the ids of the allowed ContentTypes. These
+ids are looked up in Django's process-wide ContentType cache, which is warmed with a single query the first time they
+are needed, so validating a relation does not query the database.
+"""
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+
+
+def content_type_ids(labels):
+    """Returns the ids of the ContentTypes of the specified models.
+
+    Every ContentType which is not already in the ContentType cache is retrieved with a single query and added to it.
+    Since the ids are read from the ContentType cache on every call, they are updated whenever Django clears the cache
+    (e.g., after migrating or flushing the database).
+
+    Args:
+        labels: An iterable of model labels in the form `app_label.ModelName` (e.g., `events.Event`).
+
+    Returns:
+        A frozenset containing the ContentType ids.
+    """
+    models = [apps.get_model(label) for label in labels]
+    return frozenset(content_type.id for content_type in ContentType.objects.get_for_models(*models).values())
+
+
+def validate_content_type(content_type_id, labels):
+    """Checks whether a generic relation's content type id belongs to one of the specified models.
+
+    Args:
+        content_type_id: The id of the ContentType of the related object.
+        labels: An iterable of model labels in the form `app_label.ModelName` (e.g., `events.Event`).
+
+    Returns:
+        True if the relation is to one of the specified models, or False otherwise.
+    """
+    return content_type_id is not None and content_type_id in content_type_ids(labels)
+
+
+def content_type_name(content_type_id):
+    """Returns the name of the model that a ContentType id belongs to, for use in error messages.
+
+    Args:
+        content_type_id: The id of a ContentType, which may be None.
+    """
+    if content_type_id is None:
+        return 'None'
+
+    try:
+        return ContentType.objects.get_for_id(content_type_id).model_class().__name__
+    except (ContentType.DoesNotExist, AttributeError):
+        return str(content_type_id)
@@ -0,0 +1,165 @@
+"""This module contains the base class for RSS and Atom feeds which are pre-rendered and served from the cache."""
+import hashlib
+import time
+from collections import namedtuple
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.feedgenerator import Atom1Feed, Rss201rev2Feed
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+
+# The feed formats which are supported, mapped to the Django feed generator class used to render each of them.
+FEED_FORMATS = {
+    'rss': Rss201rev2Feed,
+    'atom': Atom1Feed,
+}
+
+# A rendered feed, as it is stored in the cache. `content` contains the encoded feed document, `etag` contains a quoted
+# entity tag derived from the content, and `modified` contains the time (as a UNIX timestamp) when the content last
+# changed.
+FeedArtifact = namedtuple('FeedArtifact', ['content', 'content_type', 'etag', 'modified'])
+
+
+class CachedFeed:
+    """A base class for syndication feeds which are rendered ahead of time and served without querying the database.
+
+    Each format of a feed is rendered into a FeedArtifact which is stored in the cache indefinitely. The artifacts are
+    rebuilt when the objects in the feed change (see the ``rebuild`` method), so requests for a feed only read the cache.
+    Responses include ETag and Last-Modified headers, and conditional requests for an unchanged feed receive an HTTP 304
+    response.
+
+    Subclasses must set the ``name``, ``title``, ``description``, and ``path`` attributes and implement the ``items``
+    and ``item_kwargs`` methods.
+
+    Attributes:  # noqa
+        name: A string which uniquely identifies the feed in the cache.
+
+        title: A string containing the title of the feed.
+
+        description: A string containing a short description of the feed.
+
+        path: A string containing the absolute path of the feed, without the format extension.
+    """
+    name = ''
+    title = ''
+    description = ''
+    path = ''
+
+    def items(self):
+        """Returns an iterable of the objects to include in the feed, from newest to oldest.
+        """
+        raise NotImplementedError('Subclasses of CachedFeed must implement the `items` method.')
+
+    def item_kwargs(self, item):
+        """Returns a dictionary of keyword arguments to pass to the feed generator's ``add_item`` method for an item.
+
+        The ``link`` and ``unique_id`` arguments may be paths, in which case they are made absolute using the
+        ``FEED_SITE_URL`` setting.
+
+        Args:
+            item: One of the objects returned by the ``items`` method.
+        """
+        raise NotImplementedError('Subclasses of CachedFeed must implement the `item_kwargs` method.')
+
+    def cache_key(self, feed_format):
+        """Returns the cache key under which the artifact for the specified format of the feed is stored.
+        """
+        return f'feeds:{self.name}:{feed_format}'
+
+    def build(self, feed_format):
+        """Renders the specified format of the feed.
+
+        Args:
+            feed_format: One of the keys of the FEED_FORMATS dictionary.
+
+        Returns:
+            A FeedArtifact containing the rendered feed. Its modification time is the time at which it was built.
+        """
+        site = settings.FEED_SITE_URL.rstrip('/') + '/'
+        generator = FEED_FORMATS[feed_format](
+            title=self.title,
+            link=site,
+            description=self.description,
+            feed_url=urljoin(site, f'{self.path}.{feed_format}'),
+            language=settings.LANGUAGE_CODE,
+        )
+
+        for item in self.items():
+            kwargs = self.item_kwargs(item)
+            kwargs['link'] = urljoin(site, kwargs['link'])
+            if 'unique_id' in kwargs:
+                kwargs['unique_id'] = urljoin(site, kwargs['unique_id'])
+            generator.add_item(**kwargs)
+
+        content = generator.writeString('utf-8').encode('utf-8')
+        return FeedArtifact(
+            content=content,
+            content_type=f'{generator.content_type}',
+            etag=f'"{hashlib.sha256(content).hexdigest()[:32]}"',
+            modified=int(time.time()),
+        )
+
+    def get(self, feed_format):
+        """Retrieves the artifact for the specified format of the feed from the cache, building it if it is missing.
+
+        Args:
+            feed_format: One of the keys of the FEED_FORMATS dictionary.
+
+        Returns:
+            A FeedArtifact containing the rendered feed.
+        """
+        artifact = cache.get(self.cache_key(feed_format))
+        if artifact is None:
+            artifact = self.build(feed_format)
+            cache.set(self.cache_key(feed_format), artifact, None)
+
+        return artifact
+
+    def rebuild(self):
+        """Rebuilds every format of the feed and replaces the artifacts in the cache.
+
+        An artifact whose content has not changed keeps its original ETag and modification time, so clients which have
+        already retrieved it continue to receive HTTP 304 responses.
+        """
+        for feed_format in FEED_FORMATS:
+            artifact = self.build(feed_format)
+            if artifact.etag != getattr(cache.get(self.cache_key(feed_format)), 'etag', None):
+                cache.set(self.cache_key(feed_format), artifact, None)
+
+    def serve(self, request, feed_format):
+        """Responds to a request for the specified format of the feed.
+
+        Args:
+            request: The HttpRequest being processed.
+            feed_format: The format of the feed which was requested.
+
+        Returns:
+            An HttpResponse containing the rendered feed, or an HTTP 304 response if the request's If-None-Match or
+            If-Modified-Since headers show that the client already has the current feed.
+
+        Raises:
+            Http404: If the requested format is not one of the keys of the FEED_FORMATS dictionary.
+        """
+        if feed_format not in FEED_FORMATS:
+            raise Http404(f'Unsupported feed format: {feed_format}')
+
+        artifact = self.get(feed_format)
+        response = HttpResponse(artifact.content, content_type=artifact.content_type)
+        response['ETag'] = artifact.etag
+        response['Last-Modified'] = http_date(artifact.modified)
+        response['Cache-Control'] = 'no-cache'
+
+        return get_conditional_response(request, etag=artifact.etag, last_modified=artifact.modified, response=response)
+
+    def as_view(self):
+        """Returns a Django view function which serves the feed. The view accepts a `feed_format` keyword argument.
+        """
+        @require_safe
+        def view(request, feed_format):
+            return self.serve(request, feed_format)
+
+        return view
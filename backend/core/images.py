@@ -0,0 +1,279 @@
+"""This module contains the pipeline which generates resized derivatives of uploaded images.
+
+Uploaded images (e.g., affiliate logos and project images) are often multi-megabyte PNGs, while they are displayed as
+small cards. When a model with an image is saved with a new image, the `generate_image_derivatives` Celery task
+resizes it to each of the ``IMAGE_DERIVATIVE_WIDTHS`` which are not wider than the original, and saves each size as both
+WebP and JPEG next to the original (e.g., ``affiliates/logos/derivatives/acme-320w.webp``).
+
+The metadata of the derivatives is stored in a JSON field of the model named after the image field (e.g.,
+``logo_derivatives``), which contains the name of the source image and a list of the derivatives. Serializers expose it
+with `srcset`, in a structure which maps directly onto a ``<picture>`` element, so that browsers download the smallest
+derivative which fills the card. Since the name of the source image is stored, saving a model whose image has not
+changed does not regenerate its derivatives.
+
+The same field also stores the dimensions of the source image, its dominant color, and a tiny blurred placeholder (i.e.,
+a low-quality image placeholder, or LQIP) encoded as a data URI. Serializers expose them with `preview`, so that the
+frontend can reserve space for an image and show its placeholder while it loads, and nothing which needs an image's
+dimensions has to open the image file.
+"""
+import base64
+import logging
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageFilter, ImageOps
+
+from core import media
+
+logger = logging.getLogger(__name__)
+
+# The formats in which derivatives are generated, mapped to their Pillow format names and MIME types. The last format is
+# used as the fallback for browsers which do not support the others, so it must be supported everywhere.
+FORMATS = {
+    'webp': ('WEBP', 'image/webp'),
+    'jpeg': ('JPEG', 'image/jpeg'),
+}
+
+# The name of the directory, next to each source image, in which its derivatives are saved.
+DERIVATIVES_DIRECTORY = 'derivatives'
+
+
+def derivative_name(name, width, extension):
+    """Returns the storage name of a derivative of an image.
+
+    Args:
+        name: The storage name of the source image.
+        width: The width of the derivative in pixels.
+        extension: The file extension of the derivative's format.
+    """
+    directory, filename = os.path.split(name)
+    stem = os.path.splitext(filename)[0]
+    return os.path.join(directory, DERIVATIVES_DIRECTORY, f'{stem}-{width}w.{extension}').replace(os.sep, '/')
+
+
+def outdated(field_file, derivatives):
+    """Returns whether the derivatives of an image field were not generated from its current image.
+
+    Args:
+        field_file: The ImageFieldFile of a model's image field.
+        derivatives: The value of the model's derivatives field.
+    """
+    return (field_file.name or '') != (derivatives or {}).get('source', '')
+
+
+def open_image(field_file):
+    """Opens and decodes an image field's image, rotating it according to its EXIF orientation and converting it to
+    RGB, or to RGBA if it has transparency.
+    """
+    field_file.open('rb')
+    try:
+        image = Image.open(field_file)
+        image.load()
+    finally:
+        field_file.close()
+
+    image = ImageOps.exif_transpose(image)
+    transparent = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    return image.convert('RGBA' if transparent else 'RGB')
+
+
+def flatten(image):
+    """Flattens a transparent image onto a white background, since not every format (e.g., JPEG) supports transparency.
+    """
+    if image.mode != 'RGBA':
+        return image
+
+    background = Image.new('RGB', image.size, (255, 255, 255))
+    background.paste(image, mask=image.getchannel('A'))
+    return background
+
+
+def dominant_color(image):
+    """Returns the most common color of an image, after reducing it to a small palette, as a hexadecimal CSS color.
+    """
+    sample = flatten(image).copy()
+    sample.thumbnail((64, 64))
+    palette = sample.quantize(colors=8)
+    _, index = max(palette.getcolors())
+    red, green, blue = palette.getpalette()[index * 3:index * 3 + 3]
+    return f'#{red:02x}{green:02x}{blue:02x}'
+
+
+def placeholder(image):
+    """Returns a tiny, blurred version of an image, ``IMAGE_PLACEHOLDER_WIDTH`` pixels wide, as a JPEG data URI.
+    """
+    width = min(settings.IMAGE_PLACEHOLDER_WIDTH, image.width)
+    height = max(1, round(image.height * width / image.width))
+    tiny = flatten(image).resize((width, height), Image.BILINEAR).filter(ImageFilter.GaussianBlur(1))
+
+    buffer = BytesIO()
+    tiny.save(buffer, format='JPEG', quality=60)
+    return f'data:image/jpeg;base64,{base64.b64encode(buffer.getvalue()).decode()}'
+
+
+def encode(image, extension):
+    """Encodes an image in one of the derivative formats.
+
+    Returns:
+        The bytes of the encoded image.
+    """
+    pil_format = FORMATS[extension][0]
+    options = {'quality': settings.IMAGE_DERIVATIVE_QUALITY}
+    if pil_format == 'JPEG':
+        image = flatten(image)
+        options.update(optimize=True, progressive=True)
+    else:
+        options.update(method=6)
+
+    buffer = BytesIO()
+    image.save(buffer, format=pil_format, **options)
+    return buffer.getvalue()
+
+
+def generate(field_file):
+    """Generates and saves the derivatives of an image field's image. Images which cannot be decoded are logged, and
+    have no derivatives.
+
+    Args:
+        field_file: The ImageFieldFile of a model's image field, which is not empty.
+
+    Returns:
+        A dictionary containing the storage name of the source image as ``source``, and a list of the derivatives'
+        metadata dictionaries (i.e., their storage ``name``, ``format``, ``width``, ``height``, and ``size`` in bytes)
+        ordered by width as ``images``. If the image could be decoded, the dictionary also contains its ``width``,
+        ``height``, dominant ``color``, and ``placeholder`` data URI.
+    """
+    derivatives = {'source': field_file.name, 'images': []}
+    try:
+        image = open_image(field_file)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        logger.exception('Unable to decode the %s image, so no derivatives were generated.', field_file.name)
+        return derivatives
+
+    derivatives.update(
+        width=image.width, height=image.height, color=dominant_color(image), placeholder=placeholder(image)
+    )
+
+    storage = field_file.storage
+    for width in sorted({min(width, image.width) for width in settings.IMAGE_DERIVATIVE_WIDTHS}):
+        height = max(1, round(image.height * width / image.width))
+        resized = image.resize((width, height), Image.LANCZOS) if width != image.width else image
+        for extension in FORMATS:
+            content = encode(resized, extension)
+            name = derivative_name(field_file.name, width, extension)
+            if storage.exists(name):
+                storage.delete(name)
+            derivatives['images'].append({
+                'name': storage.save(name, ContentFile(content)),
+                'format': extension,
+                'width': width,
+                'height': height,
+                'size': len(content),
+            })
+
+    return derivatives
+
+
+def delete(derivatives, storage):
+    """Deletes the files of an image field's derivatives which are not referenced by any object. Identical images have
+    identical derivatives, which are stored once and shared (see the core.storage module).
+
+    Args:
+        derivatives: The value of a model's derivatives field.
+        storage: The storage of the model's image field.
+    """
+    media.delete_unreferenced(storage, [derivative['name'] for derivative in (derivatives or {}).get('images', [])])
+
+
+def update_derivatives(model, pk, field, force=False):
+    """Generates the derivatives of a model object's image if they are outdated, stores their metadata, and deletes the
+    derivatives of its previous image.
+
+    The metadata is only stored if the object's image was not changed while the derivatives were being generated;
+    otherwise, the task which was triggered by the change stores its own derivatives.
+
+    Args:
+        model: The model class of the object.
+        pk: The primary key of the object.
+        field: The name of the object's image field. Its derivatives are stored in the ``<field>_derivatives`` field.
+        force: Whether to generate the derivatives even if they are up to date (e.g., to store metadata which was added
+            after they were generated).
+
+    Returns:
+        The number of derivatives which were stored.
+    """
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None:
+        return 0
+
+    field_file = getattr(instance, field)
+    previous = getattr(instance, f'{field}_derivatives')
+    if not force and not outdated(field_file, previous):
+        return 0
+
+    queryset = model.objects.filter(pk=pk)
+    if field_file:
+        derivatives = generate(field_file)
+        queryset = queryset.filter(**{field: field_file.name})
+    else:
+        derivatives = {}
+
+    if queryset.update(**{f'{field}_derivatives': derivatives}):
+        delete(previous, field_file.storage)
+        return len(derivatives.get('images', []))
+
+    delete(derivatives, field_file.storage)
+    return 0
+
+
+def srcset(derivatives, storage):
+    """Converts the metadata of an image field's derivatives into a structure which maps onto a ``<picture>`` element.
+
+    Args:
+        derivatives: The value of a model's derivatives field.
+        storage: The storage of the model's image field.
+
+    Returns:
+        A dictionary containing the URL of the widest derivative in the fallback format as ``src``, its ``width`` and
+        ``height``, and a list of ``sources`` containing the MIME ``type`` and ``srcset`` attribute of each format, or
+        None if the image has no derivatives.
+    """
+    images = sorted((derivatives or {}).get('images', []), key=lambda derivative: derivative['width'])
+    if not images:
+        return None
+
+    sources = []
+    for extension, (_, mime_type) in FORMATS.items():
+        candidates = [
+            f'{storage.url(derivative["name"])} {derivative["width"]}w'
+            for derivative in images if derivative['format'] == extension
+        ]
+        if candidates:
+            sources.append({'type': mime_type, 'srcset': ', '.join(candidates)})
+
+    fallback = [derivative for derivative in images if derivative['format'] == list(FORMATS)[-1]][-1]
+    return {
+        'src': storage.url(fallback['name']),
+        'width': fallback['width'],
+        'height': fallback['height'],
+        'sources': sources,
+    }
+
+
+def preview(derivatives):
+    """Returns the stored metadata of an image which is needed to display it before it has loaded.
+
+    Args:
+        derivatives: The value of a model's derivatives field.
+
+    Returns:
+        A dictionary containing the ``width`` and ``height`` of the image, its dominant ``color``, and its
+        ``placeholder`` data URI, or None if the image has not been processed yet or could not be decoded.
+    """
+    derivatives = derivatives or {}
+    if 'placeholder' not in derivatives:
+        return None
+
+    return {key: derivatives[key] for key in ('width', 'height', 'color', 'placeholder')}
@@ -0,0 +1,219 @@
+"""This module contains the outbound email subsystem, which sends email asynchronously in batches.
+
+Messages are not sent while a request is being processed. Instead, `enqueue` appends them to a Redis list and
+triggers the `deliver_queued_mail` Celery task, which removes up to ``MAIL_BATCH_SIZE`` messages from the list at a
+time and sends each batch over a single SMTP connection. Connections are kept in a per-process pool of up to
+``MAIL_POOL_SIZE`` open connections, which are reused by later batches until they are ``MAIL_CONNECTION_MAX_AGE``
+seconds old, so a burst of email does not open one connection per message.
+
+Messages which could not be sent are retried by the `send_mail_batch` Celery task with exponential backoff, starting
+after ``MAIL_RETRY_BACKOFF`` seconds and doubling up to ``MAIL_RETRY_BACKOFF_MAX`` seconds, at most ``MAIL_MAX_RETRIES``
+times. Messages are sent with the ``EMAIL_BACKEND`` setting's backend, so they can be delivered to a local SMTP sink
+(e.g., MailHog) in development.
+"""
+import json
+import logging
+import queue
+import socket
+import time
+from contextlib import contextmanager
+from smtplib import SMTPException, SMTPRecipientsRefused, SMTPResponseException, SMTPServerDisconnected
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# The Redis list which queued messages are appended to.
+QUEUE = 'mail:queue'
+
+
+class ConnectionPool:
+    """A pool of open connections to the email backend, which are reused until they expire.
+
+    Attributes:  # noqa
+        idle: A LIFO queue of (connection, time opened) tuples containing the open connections which are not in use.
+    """
+
+    def __init__(self):
+        """Initializes an empty pool. Its size is read from the ``MAIL_POOL_SIZE`` setting when it is first used.
+        """
+        self.idle = None
+
+    @contextmanager
+    def connection(self):
+        """Acquires an open connection from the pool, opening a new one if no unexpired connection is idle.
+
+        The connection is returned to the pool when the context exits, unless an exception was raised, in which case it
+        is closed since it may be broken.
+
+        Yields:
+            An email backend instance whose connection is open.
+        """
+        if self.idle is None:
+            self.idle = queue.LifoQueue(maxsize=settings.MAIL_POOL_SIZE)
+
+        connection, opened = None, 0.0
+        while connection is None:
+            try:
+                connection, opened = self.idle.get_nowait()
+            except queue.Empty:
+                connection, opened = get_connection(fail_silently=False), time.monotonic()
+                connection.open()
+            else:
+                if time.monotonic() - opened > settings.MAIL_CONNECTION_MAX_AGE:
+                    close(connection)
+                    connection = None
+
+        try:
+            yield connection
+        except Exception:
+            close(connection)
+            raise
+
+        try:
+            self.idle.put_nowait((connection, opened))
+        except queue.Full:
+            close(connection)
+
+
+def close(connection):
+    """Closes a connection to the email backend, ignoring any errors since the connection may already be broken.
+    """
+    try:
+        connection.close()
+    except (SMTPException, OSError):
+        pass
+
+
+# The connection pool of the current process.
+pool = ConnectionPool()
+
+
+def message(subject, body, recipients, from_email=None, html_body=None):
+    """Converts the parts of an email into a dictionary which can be queued and passed to Celery tasks.
+
+    Args:
+        subject: The subject of the email.
+        body: The plain text body of the email.
+        recipients: A list of the email addresses of the recipients.
+        from_email: The email address of the sender. Defaults to the ``DEFAULT_FROM_EMAIL`` setting.
+        html_body: An optional HTML body, which is sent as an alternative to the plain text body.
+
+    Returns:
+        A dictionary.
+    """
+    return {
+        'subject': subject,
+        'body': body,
+        'recipients': list(recipients),
+        'from_email': from_email or settings.DEFAULT_FROM_EMAIL,
+        'html_body': html_body,
+    }
+
+
+def enqueue(subject, body, recipients, from_email=None, html_body=None):
+    """Queues an email to be sent asynchronously. See `message` for a description of the arguments.
+
+    If Redis is unavailable, the email is passed directly to a `send_mail_batch` task instead.
+    """
+    from core.tasks import deliver_queued_mail, send_mail_batch
+
+    queued = message(subject, body, recipients, from_email, html_body)
+    try:
+        get_redis_connection('default').rpush(QUEUE, json.dumps(queued))
+    except RedisError:
+        logger.exception('Unable to queue email to %s, sending it in its own batch.', queued['recipients'])
+        send_mail_batch.delay([queued])
+    else:
+        deliver_queued_mail.delay()
+
+
+def dequeue(count):
+    """Atomically removes up to `count` messages from the start of the queue.
+
+    Returns:
+        A list of message dictionaries.
+    """
+    pipeline = get_redis_connection('default').pipeline(transaction=True)
+    pipeline.lrange(QUEUE, 0, count - 1)
+    pipeline.ltrim(QUEUE, count, -1)
+    messages, _ = pipeline.execute()
+    return [json.loads(queued) for queued in messages]
+
+
+def to_email(queued, connection):
+    """Converts a message dictionary into an EmailMultiAlternatives object which is sent over a connection.
+    """
+    email = EmailMultiAlternatives(
+        subject=queued['subject'],
+        body=queued['body'],
+        from_email=queued['from_email'],
+        to=queued['recipients'],
+        connection=connection,
+    )
+    if queued.get('html_body'):
+        email.attach_alternative(queued['html_body'], 'text/html')
+    return email
+
+
+def send_batch(messages):
+    """Sends a batch of messages over a single pooled connection.
+
+    A message which is rejected by the server (e.g., because a recipient was refused) does not prevent the rest of the
+    batch from being sent. If the connection is lost, or the server fails in any other way, the remaining messages are
+    not sent.
+
+    Args:
+        messages: A list of message dictionaries.
+
+    Returns:
+        A list of the message dictionaries which could not be sent.
+    """
+    failed, attempted = [], 0
+    try:
+        with pool.connection() as connection:
+            for queued in messages:
+                try:
+                    connection.send_messages([to_email(queued, connection)])
+                except (SMTPServerDisconnected, ConnectionError, socket.timeout):
+                    raise
+                except (SMTPResponseException, SMTPRecipientsRefused):
+                    logger.exception('Unable to send email to %s.', queued['recipients'])
+                    failed.append(queued)
+                attempted += 1
+    except (SMTPException, OSError):
+        logger.exception('Lost the connection to the email server.')
+        # The messages which had not been sent when the connection was lost (or could not be opened) are retried.
+        failed += messages[attempted:]
+
+    return failed
+
+
+def backoff(retries):
+    """Returns the number of seconds to wait before retrying messages which have already been retried `retries` times.
+    """
+    return min(settings.MAIL_RETRY_BACKOFF * 2 ** retries, settings.MAIL_RETRY_BACKOFF_MAX)
+
+
+def deliver_queued():
+    """Sends every queued message in batches of ``MAIL_BATCH_SIZE``. Messages which could not be sent are passed to a
+    `send_mail_batch` task which retries them with backoff.
+
+    Returns:
+        The number of messages which were sent.
+    """
+    from core.tasks import send_mail_batch
+
+    sent = 0
+    while True:
+        messages = dequeue(settings.MAIL_BATCH_SIZE)
+        if not messages:
+            return sent
+
+        failed = send_batch(messages)
+        if failed:
+            send_mail_batch.apply_async((failed,), countdown=backoff(0))
+        sent += len(messages) - len(failed)
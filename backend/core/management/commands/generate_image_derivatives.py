@@ -0,0 +1,42 @@
+"""This module contains a management command which queues the processing of existing uploaded images."""
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from core.media import file_fields
+from core.tasks import generate_image_derivatives
+
+
+class Command(BaseCommand):
+    """A management command which queues a `generate_image_derivatives` task for every image whose derivatives,
+    dimensions, dominant color, and placeholder have not been generated (see the core.images module).
+
+    Images are processed when they are saved, so this command is only needed for images which were uploaded before an
+    image field had a derivatives field, or, with ``--force``, to process every image again (e.g., after the
+    ``IMAGE_DERIVATIVE_WIDTHS`` setting is changed).
+    """
+    help = 'Queues the generation of derivatives and metadata for existing uploaded images.'
+
+    def add_arguments(self, parser):
+        """Adds the command's arguments to its argument parser.
+        """
+        parser.add_argument('--force', action='store_true', help='Process images which are already up to date.')
+
+    def handle(self, *args, **options):
+        """Queues a task for each image which should be processed, and reports the number of queued tasks.
+        """
+        queued = 0
+        for model, fields, derivatives in file_fields():
+            for field in fields:
+                if f'{field}_derivatives' not in derivatives:
+                    continue
+
+                objects = model._base_manager.exclude(Q(**{field: ''}) | Q(**{f'{field}__isnull': True}))
+                for pk, name, metadata in objects.values_list('pk', field, f'{field}_derivatives').iterator():
+                    metadata = metadata or {}
+                    # Images which could not be decoded have no derivatives and no metadata, and are not retried.
+                    stale = metadata.get('source') != name or (metadata.get('images') and 'placeholder' not in metadata)
+                    if options['force'] or stale:
+                        generate_image_derivatives.delay(model._meta.label, pk, field, force=True)
+                        queued += 1
+
+        self.stdout.write(f'Queued {queued} images to be processed.')
@@ -0,0 +1,201 @@
+"""This module contains the garbage collector which removes uploaded media that is no longer referenced.
+
+Files are only deleted along with the last object which references them, so replacing an image (e.g., an affiliate's
+logo) leaves the previous file in ``MEDIA_ROOT``. The `collect_orphaned_media` Celery task walks ``MEDIA_ROOT`` one
+directory entry at a time, and checks the files it finds against the database in batches of ``MEDIA_GC_BATCH_SIZE``,
+with one query per model which has file fields (plus one per image derivatives field, see the core.images module) that
+looks up the whole batch at once. Only one batch of names is held in memory, so the cost of a run grows with the number
+of files but its memory does not.
+
+Files which are not referenced by any object are orphans. Depending on the ``MEDIA_GC_ACTION`` setting, they are either
+deleted or moved into a dated directory under ``MEDIA_ROOT/.quarantine``, from which they can be restored until they are
+purged after ``MEDIA_GC_QUARANTINE_DAYS`` days. Files which were modified in the last ``MEDIA_GC_MIN_AGE`` seconds are
+never collected, since an upload is written to disk before the object which references it is committed.
+"""
+import logging
+import os
+import shutil
+import time
+from datetime import date, timedelta
+from itertools import islice
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.db.models import FileField, JSONField, Q
+
+logger = logging.getLogger(__name__)
+
+# The actions which may be taken with orphaned files.
+DELETE = 'delete'
+QUARANTINE = 'quarantine'
+ACTIONS = (DELETE, QUARANTINE)
+
+# The name of the directory, in MEDIA_ROOT, to which quarantined files are moved.
+QUARANTINE_DIRECTORY = '.quarantine'
+
+
+def media_files(root, min_age):
+    """Yields the names, relative to the media root, of the files which are not quarantined and which were last
+    modified more than `min_age` seconds ago. Directories are read lazily, one entry at a time.
+    """
+    cutoff = time.time() - min_age
+    directories = [root]
+    while directories:
+        directory = directories.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if directory != root or entry.name != QUARANTINE_DIRECTORY:
+                        directories.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    yield os.path.relpath(entry.path, root).replace(os.sep, '/')
+
+
+def batches(iterable, size):
+    """Yields lists of up to `size` items from an iterable.
+    """
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def file_fields():
+    """Returns the models which reference stored files.
+
+    Returns:
+        A list of (model, file field names, derivatives field names) tuples, for every model with file fields.
+    """
+    models = []
+    for model in apps.get_models():
+        if model._meta.proxy:
+            continue
+
+        # Fields inherited from a concrete parent model are checked with the parent model.
+        fields = [field.name for field in model._meta.local_concrete_fields if isinstance(field, FileField)]
+        derivatives = [
+            field.name for field in model._meta.local_concrete_fields
+            if isinstance(field, JSONField) and field.name in {f'{name}_derivatives' for name in fields}
+        ]
+        if fields:
+            models.append((model, fields, derivatives))
+
+    return models
+
+
+def referenced_derivatives(model, field, names):
+    """Returns the names of a batch of files which are derivatives listed in a model's derivatives field, with a single
+    query.
+    """
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    # The JSON column is qualified with its table, and the elements of its array are given an alias which is not the
+    # name of any column, since a model may also have a column named after the alias (e.g., a project's `image`).
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT derivative->>'name' FROM {table}, "
+            f"jsonb_array_elements({table}.{quote(model._meta.get_field(field).column)}->'images') AS derivative "
+            f"WHERE derivative->>'name' = ANY(%s)",
+            [names]
+        )
+        return {name for name, in cursor.fetchall()}
+
+
+def referenced(names):
+    """Returns the names of a batch of files which are referenced by any object.
+
+    Args:
+        names: A list of the names of files relative to the media root.
+    """
+    found = set()
+    for model, fields, derivatives in file_fields():
+        query = Q()
+        for field in fields:
+            query |= Q(**{f'{field}__in': names})
+        for row in model._base_manager.filter(query).values_list(*fields):
+            found.update(row)
+        for field in derivatives:
+            found |= referenced_derivatives(model, field, names)
+
+    return found & set(names)
+
+
+def delete_unreferenced(storage, names):
+    """Deletes the stored files which are not referenced by any object. Since identical uploads are stored once (see the
+    core.storage module), a file may be shared by several objects, so it is only deleted along with the last of them.
+
+    Args:
+        storage: The storage of the files.
+        names: A list of the names of files relative to the media root. Empty names are ignored.
+    """
+    names = [name for name in names if name]
+    for name in sorted(set(names) - referenced(names)):
+        storage.delete(name)
+
+
+def quarantine(root, name, today):
+    """Moves a file into the directory of files quarantined on the specified date, keeping its relative path.
+    """
+    destination = os.path.join(root, QUARANTINE_DIRECTORY, today.isoformat(), name)
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    os.replace(os.path.join(root, name), destination)
+
+
+def purge_quarantine(root, days):
+    """Deletes the files which were quarantined more than the specified number of days ago.
+
+    Returns:
+        The number of days whose quarantined files were deleted.
+    """
+    directory = os.path.join(root, QUARANTINE_DIRECTORY)
+    if not os.path.isdir(directory):
+        return 0
+
+    cutoff = (date.today() - timedelta(days=days)).isoformat()
+    purged = 0
+    for entry in os.scandir(directory):
+        # Quarantine directories are named after ISO dates, so they are ordered by date.
+        if entry.is_dir(follow_symlinks=False) and entry.name < cutoff:
+            shutil.rmtree(entry.path)
+            purged += 1
+
+    return purged
+
+
+def collect_orphans(action=None):
+    """Deletes or quarantines every file in the media root which is not referenced by any object, and purges expired
+    quarantined files.
+
+    Args:
+        action: Either `delete` or `quarantine`. Defaults to the ``MEDIA_GC_ACTION`` setting.
+
+    Returns:
+        The number of orphaned files which were deleted or quarantined.
+    """
+    action = action or settings.MEDIA_GC_ACTION
+    if action not in ACTIONS:
+        raise ValueError(f'The media garbage collection action must be one of {", ".join(ACTIONS)}, not {action}.')
+
+    root = str(settings.MEDIA_ROOT)
+    if not os.path.isdir(root):
+        return 0
+
+    today = date.today()
+    collected = 0
+    for names in batches(media_files(root, settings.MEDIA_GC_MIN_AGE), settings.MEDIA_GC_BATCH_SIZE):
+        for name in sorted(set(names) - referenced(names)):
+            try:
+                if action == DELETE:
+                    os.remove(os.path.join(root, name))
+                else:
+                    quarantine(root, name, today)
+            except FileNotFoundError:
+                continue
+            collected += 1
+
+    purge_quarantine(root, settings.MEDIA_GC_QUARANTINE_DAYS)
+    logger.info('Collected %s orphaned media files (%s).', collected, action)
+    return collected
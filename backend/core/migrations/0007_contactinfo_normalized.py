@@ -0,0 +1,34 @@
+# Generated by Django 3.1.2 on 2026-10-19 18:05
+
+from django.db import migrations, models
+
+from core.normalization import bulk_normalize
+
+
+def normalize_existing_contacts(apps, schema_editor):
+    """Computes the normalized value of every existing ContactInfo object with a single UPDATE statement.
+    """
+    ContactInfo = apps.get_model('core', 'ContactInfo')
+    bulk_normalize(ContactInfo.objects.all())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_auto_20210524_0024'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contactinfo',
+            name='normalized',
+            field=models.CharField(
+                blank=True, default='', editable=False, max_length=50, verbose_name='Normalized Contact Value'
+            ),
+        ),
+        migrations.RunPython(normalize_existing_contacts, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='contactinfo',
+            index=models.Index(fields=['normalized'], name='core_contac_normali_a13da8_idx'),
+        ),
+    ]
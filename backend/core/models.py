@@ -6,9 +6,29 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import validate_email
 
+from core.contenttypes import content_type_name, validate_content_type
+from core.normalization import normalize_contact, normalize_email, normalize_phone
 from core.validators import validate_phone
 
 
+class ContactInfoQuerySet(models.QuerySet):
+    """A custom QuerySet for the ContactInfo model which provides additional methods for retrieving ContactInfo objects.
+    """
+
+    def matching(self, value):
+        """A custom queryset method which returns a queryset containing the contact information which is the same as
+        the specified value, regardless of formatting (e.g., ``(919) 555-1234`` matches ``+1 919.555.1234``).
+
+        Args:
+            value: A phone number, email address, or other contact information.
+        """
+        normalized = normalize_phone(value)
+        if normalized is None:
+            normalized = normalize_email(value)
+
+        return self.filter(normalized=normalized)
+
+
 class ContactInfo(models.Model):
     """A Django database model which represents a point of contact for a club event.
 
@@ -24,6 +44,10 @@ class ContactInfo(models.Model):
         value: A CharField containing the actual value of the method of contact, whether that is a phone number, email
         address, or otherwise.
 
+        normalized: A CharField containing the ``value`` in canonical form (see the core.normalization module), which
+        is computed when the object is saved. It is indexed, so that all contact information submitted by the same
+        person can be found with a single index lookup.
+
         content_type: Defines a many-to-one relationship from ContactInfo objects to the ContentType of the related
         ``content_object``.
 
@@ -31,6 +55,9 @@ class ContactInfo(models.Model):
 
         content_object: A generic many-to-one relationship which relates a ContactInfo object to an object whose type is
         is found with the ``content_type`` foreign key and whose own foreign key is stored in ``object_id``.
+
+        objects: A custom Manager which includes all base Manager functionality with the addition of the `matching`
+        method, which retrieves the contact information that is the same as a given value.
     """
 
     class InfoType(models.TextChoices):
@@ -49,7 +76,8 @@ class ContactInfo(models.Model):
         OTHER = 'OT', _('Other Form of Contact')
 
     _SUPPORTED_RELATION_TYPES = (
-        'Event', 'GuestSpeakerContactForm', 'MentorContactForm', 'EventOrganizerContactForm', 'PartnerContactForm',
+        'events.Event', 'contact.GuestSpeakerContactForm', 'contact.MentorContactForm',
+        'contact.EventOrganizerContactForm', 'contact.PartnerContactForm',
     )
 
     type = models.CharField(
@@ -79,6 +107,15 @@ class ContactInfo(models.Model):
         unique=False,
         verbose_name='Contact Value',
     )
+    normalized = models.CharField(
+        max_length=50,
+        null=False,
+        blank=True,
+        default='',
+        editable=False,
+        unique=False,
+        verbose_name='Normalized Contact Value',
+    )
 
     content_type = models.ForeignKey(
         ContentType,
@@ -92,29 +129,41 @@ class ContactInfo(models.Model):
     object_id = models.PositiveIntegerField()
     content_object = GenericForeignKey('content_type', 'object_id')
 
+    objects = ContactInfoQuerySet.as_manager()
+
     def clean(self):
         """This method defines custom ContactInfo model validation logic.
 
-        First, the type of the related ``content_object``
+        First, the type of the related ``content_object`` is checked against the supported relation types, using only
+        its ``content_type_id`` so that the related object is not loaded from the database.
         Then, it validates a model instance's ``value`` field based upon its ``type`` (e.g., ``value`` is validated as
         a phone number if the instance's ``type`` is ``InfoType.PHONE``). Finally, it attempts to coerce the value in a
         model instance's ``type`` field to the appropriate type based on its ``value`` field. That is, if a model
         instance's ``type`` field contains ``InfoType.OTHER``, but its ``value`` field contains a valid email address,
         the method will automatically set the instance's ``type`` field to ``InfoType.EMAIL``.
         """
-        if not any(self.content_object.__class__.__name__ == t for t in self._SUPPORTED_RELATION_TYPES):
+        if not validate_content_type(self.content_type_id, self._SUPPORTED_RELATION_TYPES):
             raise ValidationError(
-                f'Unsupported ContentType "{type(self.content_object.__class__.__name__)}" supplied for '
+                f'Unsupported ContentType "{content_type_name(self.content_type_id)}" supplied for '
                 + 'GenericForeignKey relation.'
             )
 
         if self.type == self.InfoType.EMAIL:
             validate_email(self.value)
-            return
         elif self.type == self.InfoType.PHONE:
             validate_phone(self.value)
-            return
+        else:
+            self._coerce_type()
+
+        self.normalized = normalize_contact(self.type, self.value)
+
+    def _coerce_type(self):
+        """Sets the ``type`` of contact information whose type is `OTHER` to `EMAIL` or `PHONE` if its value is a valid
+        email address or phone number, respectively.
 
+        Raises:
+            ValidationError: The value only contains whitespace.
+        """
         # Attempt to coerce the type to `EMAIL` if it is currently `OTHER` but its value is a valid email.
         try:
             validate_email(self.value)
@@ -123,17 +172,23 @@ class ContactInfo(models.Model):
         except ValidationError:
             pass
 
-        # Attempt to coerce the type to `EMAIL` if it is currently `OTHER` but its value is a valid email.
-        try:
-            validate_phone(self.value)
+        # Attempt to coerce the type to `PHONE` if it is currently `OTHER` but its value is a valid phone number.
+        if normalize_phone(self.value) is not None:
             self.type = self.InfoType.PHONE
             return
-        except ValidationError:
-            pass
 
         if len(self.value.strip()) == 0:
             raise ValidationError('Contact value must not only contain whitespace')
 
+    def save(self, *args, **kwargs):
+        """Overrides the default model save method to compute the normalized value of the contact information.
+        """
+        self.normalized = normalize_contact(self.type, self.value)
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = set(kwargs['update_fields']) | {'normalized'}
+
+        super(ContactInfo, self).save(*args, **kwargs)
+
     def __str__(self):
         """Defines the string representation of a ContactInfo object to be an empty string.
         """
@@ -145,5 +200,11 @@ class ContactInfo(models.Model):
         Attributes:  # noqa
             ordering: Specifies that ContactInfo objects should be in descending order by whether they are preferred or
             not (i.e., preferred ContactInfo objects first, and non-preferred ContactInfo objects last).
+
+            indexes: A list of database indexes for the ContactInfo model. The index on ``normalized`` allows all of
+            the contact information submitted by the same person to be found without scanning the table.
         """
         ordering = ['-preferred']
+        indexes = [
+            models.Index(fields=['normalized']),
+        ]
@@ -0,0 +1,111 @@
+"""This module contains functions which reduce contact information to a canonical form, so that it can be compared.
+
+A ContactInfo object's ``normalized`` field contains its value in canonical form: phone numbers are stored in E.164
+format (e.g., ``+19195551234``), and email addresses and other values are stripped of surrounding whitespace and stored
+in lowercase. Contact information which was submitted by the same person therefore has the same normalized value,
+regardless of how it was formatted.
+"""
+import re
+
+from django.db.models.expressions import RawSQL
+
+# The whitespace characters which are stripped from the start and end of a value.
+WHITESPACE = ' \t\n\r\f\v'
+
+# The U.S. country code, which is the only country code supported by phone number validation.
+COUNTRY_CODE = '+1'
+
+# Matches every character which is not a digit.
+NON_DIGITS = re.compile(r'\D')
+
+# Computes the normalized value of each row of the ContactInfo table in the database, mirroring `normalize_contact`.
+# The `%s` parameters are the whitespace characters which are stripped from values.
+NORMALIZED_VALUE_SQL = f"""
+CASE
+    WHEN "type" = 'PH' AND LENGTH(REGEXP_REPLACE(REGEXP_REPLACE("value", '^.*?\\+1', ''), '\\D', '', 'g')) = 10
+        THEN '{COUNTRY_CODE}' || REGEXP_REPLACE(REGEXP_REPLACE("value", '^.*?\\+1', ''), '\\D', '', 'g')
+    ELSE LOWER(BTRIM("value", %s))
+END
+"""
+
+
+def normalize_phone(value):
+    """Converts a phone number into E.164 format.
+
+    A phone number is valid if it contains exactly ten digits, not counting a '+1' country code. The digits are found
+    with a single regular expression substitution rather than by checking each character in Python.
+
+    Args:
+        value: The phone number to convert.
+
+    Returns:
+        A string containing the phone number in E.164 format, or None if the phone number is invalid.
+    """
+    country_code = value.find(COUNTRY_CODE)
+    if country_code != -1:
+        value = value[country_code + len(COUNTRY_CODE):]
+
+    digits = NON_DIGITS.sub('', value)
+    return f'{COUNTRY_CODE}{digits}' if len(digits) == 10 else None
+
+
+def normalize_email(value):
+    """Converts an email address (or any other value) into canonical form, without surrounding whitespace and in
+    lowercase.
+
+    Args:
+        value: The email address to convert.
+
+    Returns:
+        A string containing the converted email address.
+    """
+    return value.strip(WHITESPACE).lower()
+
+
+def normalize_contact(info_type, value):
+    """Computes the normalized value of contact information.
+
+    Args:
+        info_type: The type of the contact information, which is one of the values of ContactInfo.InfoType.
+        value: The value of the contact information.
+
+    Returns:
+        A string containing the normalized value. Phone numbers which are invalid are normalized in the same way as
+        email addresses and other values.
+    """
+    if info_type == 'PH':
+        phone = normalize_phone(value)
+        if phone is not None:
+            return phone
+
+    return normalize_email(value)
+
+
+def normalize_contacts(contacts):
+    """Computes the normalized value of each of a sequence of unsaved ContactInfo objects, e.g., before they are created
+    with `bulk_create`.
+
+    Args:
+        contacts: An iterable of ContactInfo objects.
+
+    Returns:
+        A list of the ContactInfo objects.
+    """
+    contacts = list(contacts)
+    for contact in contacts:
+        contact.normalized = normalize_contact(contact.type, contact.value)
+
+    return contacts
+
+
+def bulk_normalize(queryset):
+    """Computes the normalized value of every ContactInfo object in a queryset with a single UPDATE statement, which is
+    executed entirely within the database.
+
+    Args:
+        queryset: A queryset of ContactInfo objects. Historical models (e.g., in migrations) are supported.
+
+    Returns:
+        The number of ContactInfo objects which were updated.
+    """
+    return queryset.update(normalized=RawSQL(NORMALIZED_VALUE_SQL, [WHITESPACE]))
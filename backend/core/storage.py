@@ -0,0 +1,84 @@
+"""This module contains the content-addressed storage backend used for uploaded media.
+
+Uploaded files are named after a digest of their contents rather than after the object they belong to (e.g.,
+``affiliates/logos/3f7a...c2.png`` rather than ``affiliates/logos/acme.png``), in the directory chosen by the file
+field's ``upload_to``. Since a file's name changes whenever its contents change, replacing an image also changes its
+URL, so browsers and nginx can cache media as immutable (see nginx/prod.conf) without ever serving a stale image.
+Uploading a file which is identical to one which is already stored in the same directory reuses the stored file rather
+than writing a copy of it, so a stored file may be shared by several objects, and is only deleted once none of them
+references it (see `core.media.delete_unreferenced`).
+"""
+import hashlib
+import posixpath
+import re
+
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+# The number of hexadecimal characters of a file's SHA-256 digest which are used in its name.
+DIGEST_LENGTH = 32
+
+# Matches the name of a file which is named after the digest of its contents.
+HASHED_NAME = re.compile(rf'(^|/)[0-9a-f]{{{DIGEST_LENGTH}}}(\.[a-z0-9]+)?$')
+
+
+def is_hashed(name):
+    """Returns whether a stored file is named after the digest of its contents.
+    """
+    return bool(HASHED_NAME.search(name))
+
+
+class ContentHashStorage(FileSystemStorage):
+    """A file system storage backend which names files after the SHA-256 digest of their contents, and which stores
+    identical files in the same directory only once.
+    """
+
+    @staticmethod
+    def digest(content):
+        """Returns the truncated SHA-256 digest of a file's contents as a hexadecimal string.
+        """
+        sha256 = hashlib.sha256()
+        for chunk in content.chunks():
+            sha256.update(chunk)
+        content.seek(0)
+        return sha256.hexdigest()[:DIGEST_LENGTH]
+
+    def hashed_name(self, name, content, max_length=None):
+        """Returns the content-addressed name of a file which would otherwise be saved as `name`.
+
+        The file keeps the directory and lowercased extension of `name`. If the resulting name is longer than
+        `max_length`, the file is stored in the closest parent directory in which its name fits instead.
+
+        Raises:
+            SuspiciousFileOperation: If the file's name does not fit even at the root of the storage.
+        """
+        directory, filename = posixpath.split(name.replace('\\', '/'))
+        extension = posixpath.splitext(filename)[1].lower()
+        filename = f'{self.digest(content)}{extension}'
+
+        hashed = posixpath.join(directory, filename)
+        while max_length and len(hashed) > max_length and directory:
+            directory = posixpath.dirname(directory)
+            hashed = posixpath.join(directory, filename)
+
+        if max_length and len(hashed) > max_length:
+            raise SuspiciousFileOperation(f'Storage can not find an available filename for "{name}".')
+        return hashed
+
+    def save(self, name, content, max_length=None):
+        """Saves a file under its content-addressed name, unless an identical file is already stored under that name.
+
+        Returns:
+            The name under which the file is stored.
+        """
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+
+        name = self.hashed_name(name, content, max_length=max_length)
+        if self.exists(name):
+            return name
+
+        return super().save(name, content, max_length=max_length)
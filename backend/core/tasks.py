@@ -4,3 +4,73 @@ from celery import shared_task
 @shared_task
 def sample_task():
     print('The sample task just ran.')
+
+
+@shared_task
+def deliver_queued_mail():
+    """Sends the queued outbound email in batches over pooled connections (see the core.mail module).
+
+    This task is triggered whenever an email is queued, and is also run every minute by Celery beat so that no queued
+    email is left unsent if a trigger is lost.
+
+    Returns:
+        The number of emails which were sent.
+    """
+    from core.mail import deliver_queued
+    return deliver_queued()
+
+
+@shared_task(bind=True)
+def send_mail_batch(self, messages):
+    """Sends a batch of emails over a pooled connection, and retries the emails which could not be sent with exponential
+    backoff.
+
+    Args:
+        messages: A list of message dictionaries (see `core.mail.message`).
+
+    Returns:
+        The number of emails which were sent.
+    """
+    from django.conf import settings
+    from core.mail import backoff, send_batch
+
+    failed = send_batch(messages)
+    if failed:
+        raise self.retry(
+            args=(failed,), countdown=backoff(self.request.retries + 1), max_retries=settings.MAIL_MAX_RETRIES
+        )
+
+    return len(messages)
+
+
+@shared_task
+def generate_image_derivatives(model, pk, field, force=False):
+    """Generates resized WebP and JPEG derivatives of a model object's image, and stores its dimensions, dominant color,
+    and placeholder (see the core.images module).
+
+    Args:
+        model: The label of the object's model (e.g., ``affiliations.Affiliate``).
+        pk: The primary key of the object.
+        field: The name of the object's image field.
+        force: Whether to generate the derivatives even if they are up to date.
+
+    Returns:
+        The number of derivatives which were generated.
+    """
+    from django.apps import apps
+    from core.images import update_derivatives
+    return update_derivatives(apps.get_model(model), pk, field, force=force)
+
+
+@shared_task
+def collect_orphaned_media():
+    """Deletes or quarantines the uploaded files which are no longer referenced by any object (see the core.media
+    module).
+
+    This task is run daily by Celery beat.
+
+    Returns:
+        The number of orphaned files which were deleted or quarantined.
+    """
+    from core.media import collect_orphans
+    return collect_orphans()
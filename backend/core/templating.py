@@ -0,0 +1,56 @@
+"""This module contains helpers for compiling the project's templates ahead of time.
+
+When the ``TEMPLATE_CACHE`` setting is enabled (as it is by default when ``DEBUG`` is disabled), the template loaders
+are wrapped in Django's cached loader, which keeps each compiled template in memory after it is first loaded rather than
+reading and parsing it from disk every time it is rendered. Celery worker processes call `warm` when they start, so
+that the templates which tasks render (e.g., announcement bodies and email) are already compiled when the first task
+runs. Only the templates of the project's own applications are compiled, since the templates of third-party
+applications (e.g., the Django admin site) are never rendered by tasks.
+"""
+import logging
+import os
+
+from django.conf import settings
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.template.utils import get_app_template_dirs
+
+logger = logging.getLogger(__name__)
+
+
+def template_names():
+    """Yields the name of every template in the template directories of the project's own applications.
+    """
+    root = str(settings.ROOT_DIR)
+    for directory in get_app_template_dirs('templates'):
+        directory = str(directory)
+        if not directory.startswith(root) or 'site-packages' in directory:
+            continue
+
+        for path, _, files in os.walk(directory):
+            for file in files:
+                yield os.path.relpath(os.path.join(path, file), directory).replace(os.sep, '/')
+
+
+def warm(engine=None):
+    """Compiles the templates of the project's own applications, so that the cached template loader keeps them in
+    memory. Templates which cannot be compiled are logged rather than raised, so that a broken template does not prevent
+    a worker from starting.
+
+    Args:
+        engine: The django.template.Engine to compile the templates with. Defaults to the project's Django template
+            engine.
+
+    Returns:
+        The number of templates which were compiled.
+    """
+    engine = engine or engines['django'].engine
+    compiled = 0
+    for name in template_names():
+        try:
+            engine.get_template(name)
+        except (TemplateDoesNotExist, TemplateSyntaxError, UnicodeDecodeError):
+            logger.exception('Unable to compile the %s template.', name)
+        else:
+            compiled += 1
+
+    return compiled
@@ -1,6 +1,8 @@
 """This module contains core functionality pertaining to test cases and unit testing in general."""
 from enum import Enum
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
 from typing import Type
+from django.core.mail.backends import locmem
 from django.test import TestCase
 from rest_framework.test import APITestCase
 
@@ -113,3 +115,38 @@ class VerboseTestCase(VerboseTestCaseBase, TestCase):
 class VerboseAPITestCase(VerboseTestCaseBase, APITestCase):
     """A class which mixes verbose test case functionality with the built-in Django Rest Framework APITestCase class.
     """
+
+
+class SimulatedEmailBackend(locmem.EmailBackend):
+    """An email backend which stores messages in ``django.core.mail.outbox`` like the locmem backend, and which
+    simulates the failures of an SMTP server. Messages to recipients at `refused.test` are refused, and the connection
+    is lost when a message is sent to a recipient at `disconnect.test`.
+
+    Attributes:  # noqa
+        connections: The number of connections which have been opened by instances of the backend.
+
+        available: Whether connections can be opened, i.e., whether the simulated server is running.
+    """
+    connections = 0
+    available = True
+
+    def open(self):
+        """Simulates opening a connection to the server.
+        """
+        if not SimulatedEmailBackend.available:
+            raise ConnectionRefusedError('The email server is unavailable.')
+        SimulatedEmailBackend.connections += 1
+        return True
+
+    def send_messages(self, messages):
+        """Stores the messages in the outbox, unless one of their recipients is refused or causes a disconnection.
+        """
+        for message in messages:
+            recipients = message.recipients()
+            if any(recipient.endswith('@disconnect.test') for recipient in recipients):
+                raise SMTPServerDisconnected('Connection unexpectedly closed')
+            refused = [recipient for recipient in recipients if recipient.endswith('@refused.test')]
+            if refused:
+                raise SMTPRecipientsRefused({recipient: (550, b'Recipient refused') for recipient in refused})
+
+        return super().send_messages(messages)
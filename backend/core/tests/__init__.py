@@ -1,2 +1,4 @@
 from .validator import *
 from .model import *
+from .storage import *
+from .task import *
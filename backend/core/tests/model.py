@@ -5,6 +5,7 @@ from django.utils import timezone
 from datetime import timedelta
 
 from core.models import ContactInfo
+from core.normalization import bulk_normalize
 from core.testcases import VerboseTestCase, Tags
 from apps.events.models import Event
 
@@ -235,6 +236,24 @@ class TestContactInfoModel(VerboseTestCase):
 
         self.assertRaises(ValidationError, test.full_clean)
 
+    @tag(Tags.MODEL, Tags.VALIDATION)
+    def test_clean_does_not_load_relation(self):
+        """Ensure that validating the relation of a ContactInfo object does not load the related object once the
+        ContentType cache is warm.
+        """
+        ContactInfo(
+            type=ContactInfo.InfoType.EMAIL,
+            preferred=False,
+            value='valid@email.com',
+            content_object=self.event
+        ).save()
+        contact = ContactInfo.objects.get()
+        contact.clean()
+
+        contact = ContactInfo.objects.get()
+        with self.assertNumQueries(0):
+            contact.clean()
+
     @tag(Tags.MODEL)
     def test_str(self):
         """Ensure that a ContactInfo object's string representation is an empty string.
@@ -247,3 +266,58 @@ class TestContactInfoModel(VerboseTestCase):
         )
 
         self.assertEqual('', str(contact))
+
+
+class TestContactInfoNormalization(VerboseTestCase):
+    """A Django test case class which contains unit tests for the normalized values of ContactInfo objects.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing ContactInfo normalization...'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Creates and saves a valid Event object, and contact information for it in various formats.
+        """
+        cls.event = Event(
+            type=Event.EventType.OTHER,
+            topics=['Topic 1'],
+            start=timezone.now(),
+            end=timezone.now() + timedelta(days=2)
+        )
+        cls.event.save()
+
+        for info_type, value in ((ContactInfo.InfoType.PHONE, '(919) 555-1234'),
+                                 (ContactInfo.InfoType.PHONE, '+1 919.555.1234'),
+                                 (ContactInfo.InfoType.EMAIL, 'Name@Email.com'),
+                                 (ContactInfo.InfoType.OTHER, ' name@email.com')):
+            ContactInfo(type=info_type, value=value, content_object=cls.event).save()
+
+    @tag(Tags.MODEL)
+    def test_normalized_on_save(self):
+        """Ensure that a ContactInfo object's normalized value is computed when it is saved.
+        """
+        self.assertEqual(
+            ['+19195551234', '+19195551234', 'name@email.com', 'name@email.com'],
+            list(ContactInfo.objects.order_by('pk').values_list('normalized', flat=True))
+        )
+
+    @tag(Tags.MODEL)
+    def test_matching(self):
+        """Ensure that the `matching` method finds contact information regardless of its formatting.
+        """
+        self.assertEqual(2, ContactInfo.objects.matching('919-555-1234').count())
+        self.assertEqual(2, ContactInfo.objects.matching('NAME@email.com').count())
+        self.assertEqual(0, ContactInfo.objects.matching('other@email.com').count())
+
+    @tag(Tags.MODEL)
+    def test_bulk_normalize(self):
+        """Ensure that normalizing contact information within the database gives the same result as normalizing it when
+        it is saved.
+        """
+        expected = list(ContactInfo.objects.order_by('pk').values_list('normalized', flat=True))
+        ContactInfo.objects.update(normalized='')
+
+        self.assertEqual(4, bulk_normalize(ContactInfo.objects.all()))
+        self.assertEqual(expected, list(ContactInfo.objects.order_by('pk').values_list('normalized', flat=True)))
@@ -0,0 +1,60 @@
+"""This module contains unit tests for the content-addressed media storage backend."""
+import hashlib
+import shutil
+import tempfile
+
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.base import ContentFile
+from django.test import tag
+
+from core.storage import ContentHashStorage, is_hashed
+from core.testcases import VerboseTestCase, Tags
+
+
+class TestContentHashStorage(VerboseTestCase):
+    """A Django test case class which contains unit tests for storing files under names derived from their contents.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing content-addressed storage...'
+
+    def setUp(self):
+        """Create a storage backend in a temporary directory.
+        """
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        self.storage = ContentHashStorage(location=location, base_url='/media/')
+        self.digest = hashlib.sha256(b'logo').hexdigest()[:32]
+
+    @tag(Tags.MODEL)
+    def test_hashed_name(self):
+        """Ensure that a file is stored in its directory under the digest of its contents, keeping its extension.
+        """
+        name = self.storage.save('affiliates/logos/acme.PNG', ContentFile(b'logo'))
+        self.assertEqual(f'affiliates/logos/{self.digest}.png', name)
+        self.assertEqual(f'/media/affiliates/logos/{self.digest}.png', self.storage.url(name))
+        self.assertTrue(is_hashed(name))
+        self.assertFalse(is_hashed('affiliates/logos/acme.png'))
+
+    @tag(Tags.MODEL)
+    def test_deduplication(self):
+        """Ensure that identical files are stored once, and that changing a file's contents changes its name.
+        """
+        first = self.storage.save('affiliates/logos/acme.png', ContentFile(b'logo'))
+        second = self.storage.save('affiliates/logos/other.png', ContentFile(b'logo'))
+        changed = self.storage.save('affiliates/logos/acme.png', ContentFile(b'new logo'))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, changed)
+        self.assertEqual(2, len(self.storage.listdir('affiliates/logos')[1]))
+
+    @tag(Tags.MODEL)
+    def test_max_length(self):
+        """Ensure that a file whose name would be too long is stored in the closest parent directory in which it fits.
+        """
+        name = self.storage.save('projects/images/a_long_project_name/main_image.png', ContentFile(b'logo'), 60)
+        self.assertEqual(f'projects/images/{self.digest}.png', name)
+
+        with self.assertRaises(SuspiciousFileOperation):
+            self.storage.save('projects/images/main_image.png', ContentFile(b'logo'), 20)
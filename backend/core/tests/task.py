@@ -0,0 +1,328 @@
+"""This module contains unit tests for the core Celery tasks, and the email, template, and image helpers they use."""
+import base64
+import os
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.core import mail
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.template import Engine
+from django.test import tag, override_settings
+from django_redis import get_redis_connection
+from PIL import Image
+
+from apps.affiliations.models import Affiliate
+from apps.projects.models import Project
+from core.images import preview
+from core.mail import QUEUE, enqueue, pool, send_batch
+from core.media import QUARANTINE_DIRECTORY
+from core.tasks import collect_orphaned_media, deliver_queued_mail, generate_image_derivatives
+from core.templating import template_names, warm
+from core.testcases import SimulatedEmailBackend, VerboseTestCase, Tags
+
+
+@override_settings(
+    EMAIL_BACKEND='core.testcases.SimulatedEmailBackend',
+    MAIL_BATCH_SIZE=2,
+    MAIL_POOL_SIZE=1,
+    MAIL_CONNECTION_MAX_AGE=60,
+)
+class TestMailTasks(VerboseTestCase):
+    """A Django test case class which contains unit tests for sending queued email in batches over pooled
+    connections, against a simulated email server.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing outbound email tasks...'
+
+    def setUp(self):
+        """Send email to a running simulated server with an empty connection pool and queue.
+        """
+        SimulatedEmailBackend.connections = 0
+        SimulatedEmailBackend.available = True
+        pool.idle = None
+        get_redis_connection('default').delete(QUEUE)
+
+    def tearDown(self):
+        """Discard the pooled connections.
+        """
+        pool.idle = None
+
+    @staticmethod
+    def queued(recipient):
+        """Returns a message dictionary to the specified recipient.
+        """
+        return {
+            'subject': 'Subject', 'body': 'Body', 'recipients': [recipient], 'from_email': 'club@test.com',
+            'html_body': None
+        }
+
+    @tag(Tags.TASK)
+    def test_batches_reuse_connection(self):
+        """Ensure that queued email is sent in batches which reuse a single pooled connection.
+        """
+        for i in range(5):
+            enqueue('Subject', 'Body', [f'user{i}@test.com'])
+
+        self.assertEqual(5, deliver_queued_mail())
+        self.assertEqual(5, len(mail.outbox))
+        self.assertEqual(1, SimulatedEmailBackend.connections)
+        self.assertEqual(0, get_redis_connection('default').llen(QUEUE))
+
+    @tag(Tags.TASK)
+    def test_refused_recipient(self):
+        """Ensure that a message which is refused by the server does not prevent the rest of its batch from being sent,
+        and that it is returned to be retried.
+        """
+        failed = send_batch([self.queued('user@refused.test'), self.queued('user@test.com')])
+        self.assertEqual([self.queued('user@refused.test')], failed)
+        self.assertEqual([['user@test.com']], [email.to for email in mail.outbox])
+
+    @tag(Tags.TASK)
+    def test_disconnected(self):
+        """Ensure that the message which was being sent when the connection was lost, and every message after it, are
+        returned to be retried.
+        """
+        messages = [self.queued('user@test.com'), self.queued('user@disconnect.test'), self.queued('other@test.com')]
+        self.assertEqual(messages[1:], send_batch(messages))
+        self.assertEqual([['user@test.com']], [email.to for email in mail.outbox])
+        self.assertTrue(pool.idle.empty())
+
+    @tag(Tags.TASK)
+    def test_server_unavailable(self):
+        """Ensure that every message in a batch is returned to be retried if the server is unavailable.
+        """
+        SimulatedEmailBackend.available = False
+        messages = [self.queued('user@test.com'), self.queued('other@test.com')]
+        self.assertEqual(messages, send_batch(messages))
+
+    @tag(Tags.TASK)
+    def test_expired_connection(self):
+        """Ensure that pooled connections are replaced once they are older than the maximum age.
+        """
+        with override_settings(MAIL_CONNECTION_MAX_AGE=-1):
+            send_batch([self.queued('user@test.com')])
+            send_batch([self.queued('user@test.com')])
+        self.assertEqual(2, SimulatedEmailBackend.connections)
+
+
+class TestTemplateWarming(VerboseTestCase):
+    """A Django test case class which contains unit tests for compiling the project's templates when a Celery worker
+    process starts.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing template warming...'
+
+    @tag(Tags.TASK)
+    def test_warm(self):
+        """Ensure that every template of the project's applications compiles and is kept by the cached loader.
+        """
+        engine = Engine(loaders=[(
+            'django.template.loaders.cached.Loader', ['django.template.loaders.app_directories.Loader']
+        )])
+        names = list(template_names())
+        self.assertIn('event/created_body.txt', names)
+        self.assertIn('mail/password_reset.txt', names)
+
+        self.assertEqual(len(names), warm(engine))
+        self.assertTrue(set(names) <= set(engine.template_loaders[0].get_template_cache))
+
+
+@override_settings(IMAGE_DERIVATIVE_WIDTHS=[160, 320, 1280], IMAGE_DERIVATIVE_QUALITY=80, IMAGE_PLACEHOLDER_WIDTH=16)
+class TestImageDerivatives(VerboseTestCase):
+    """A Django test case class which contains unit tests for generating resized derivatives of uploaded images.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing image derivatives...'
+
+    def setUp(self):
+        """Store media in a temporary directory, and create an affiliate with an 800x400 transparent PNG logo.
+        """
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        settings = override_settings(MEDIA_ROOT=self.root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        buffer = BytesIO()
+        Image.new('RGBA', (800, 400), (255, 0, 0, 128)).save(buffer, format='PNG')
+        self.affiliate = Affiliate.objects.create(
+            name='Acme', logo=SimpleUploadedFile('logo.png', buffer.getvalue()), website='https://acme.test/'
+        )
+
+    def generate(self):
+        """Generates the derivatives of the affiliate's logo, and reloads the affiliate.
+        """
+        generated = generate_image_derivatives('affiliations.Affiliate', self.affiliate.pk, 'logo')
+        self.affiliate.refresh_from_db()
+        return generated
+
+    @tag(Tags.TASK)
+    def test_generate(self):
+        """Ensure that a derivative is generated in each format at each width, without enlarging the image.
+        """
+        self.assertEqual(6, self.generate())
+
+        derivatives = self.affiliate.logo_derivatives
+        self.assertEqual(self.affiliate.logo.name, derivatives['source'])
+        self.assertEqual(
+            [(160, 80), (160, 80), (320, 160), (320, 160), (800, 400), (800, 400)],
+            [(image['width'], image['height']) for image in derivatives['images']]
+        )
+        for image in derivatives['images']:
+            with self.affiliate.logo.storage.open(image['name']) as file:
+                self.assertEqual(image['format'].upper(), Image.open(file).format)
+
+    @tag(Tags.TASK)
+    def test_preview_metadata(self):
+        """Ensure that the dimensions, dominant color, and blurred placeholder of an image are stored with its
+        derivatives.
+        """
+        self.generate()
+
+        derivatives = self.affiliate.logo_derivatives
+        self.assertEqual((800, 400), (derivatives['width'], derivatives['height']))
+        self.assertRegex(derivatives['color'], r'^#[0-9a-f]{6}$')
+
+        prefix = 'data:image/jpeg;base64,'
+        self.assertTrue(derivatives['placeholder'].startswith(prefix))
+        placeholder = Image.open(BytesIO(base64.b64decode(derivatives['placeholder'][len(prefix):])))
+        self.assertEqual((16, 8), placeholder.size)
+
+    @tag(Tags.TASK)
+    def test_unchanged_image(self):
+        """Ensure that derivatives are only generated again once the image is replaced, and that the derivatives of the
+        previous image are deleted.
+        """
+        self.generate()
+        self.affiliate.save()
+        self.assertEqual(0, self.generate())
+
+        previous = [image['name'] for image in self.affiliate.logo_derivatives['images']]
+        buffer = BytesIO()
+        Image.new('RGB', (800, 400), (0, 0, 255)).save(buffer, format='PNG')
+        self.affiliate.logo = SimpleUploadedFile('logo.png', buffer.getvalue())
+        self.affiliate.save()
+        self.assertEqual(6, self.generate())
+        self.assertFalse(any(self.affiliate.logo.storage.exists(name) for name in previous))
+
+    @tag(Tags.TASK)
+    def test_invalid_image(self):
+        """Ensure that an image which cannot be decoded has no derivatives, and is not decoded again.
+        """
+        self.affiliate.logo = SimpleUploadedFile('logo.png', b'file_content')
+        self.affiliate.save()
+        self.assertEqual(0, self.generate())
+        self.assertEqual({'source': self.affiliate.logo.name, 'images': []}, self.affiliate.logo_derivatives)
+        self.assertIsNone(preview(self.affiliate.logo_derivatives))
+
+    @tag(Tags.TASK)
+    def test_deleted_with_object(self):
+        """Ensure that the derivatives of an image are deleted along with their object.
+        """
+        self.generate()
+        names = [image['name'] for image in self.affiliate.logo_derivatives['images']]
+        self.affiliate.delete()
+        self.assertFalse(any(self.affiliate.logo.storage.exists(name) for name in names))
+
+
+class TestOrphanedMedia(VerboseTestCase):
+    """A Django test case class which contains unit tests for collecting uploaded files which are no longer referenced.
+
+    Attributes:  # noqa
+        message: A string to print to the console before running the individual tests.
+    """
+    message = 'Testing orphaned media collection...'
+
+    def setUp(self):
+        """Store media in a temporary directory, in which an affiliate's logo and one of its derivatives are referenced,
+        and a replaced logo and derivative are not.
+        """
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        settings = override_settings(
+            MEDIA_ROOT=self.root, MEDIA_GC_ACTION='quarantine', MEDIA_GC_MIN_AGE=0, MEDIA_GC_BATCH_SIZE=2,
+            MEDIA_GC_QUARANTINE_DAYS=30,
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.affiliate = Affiliate.objects.create(
+            name='Acme', logo=SimpleUploadedFile('logo.png', b'logo'), website='https://acme.test/'
+        )
+        self.referenced = [self.affiliate.logo.name, 'affiliates/logos/derivatives/new-160w.webp']
+        self.orphans = ['affiliates/logos/old.png', 'affiliates/logos/derivatives/old-160w.webp']
+        for name in self.referenced[1:] + self.orphans:
+            os.makedirs(os.path.dirname(os.path.join(self.root, name)), exist_ok=True)
+            with open(os.path.join(self.root, name), 'wb') as file:
+                file.write(b'image')
+
+        Affiliate.objects.filter(pk=self.affiliate.pk).update(logo_derivatives={
+            'source': self.affiliate.logo.name,
+            'images': [{'name': self.referenced[1], 'format': 'webp', 'width': 160, 'height': 80, 'size': 5}],
+        })
+
+    def exists(self, name):
+        """Returns whether a file exists in the temporary media directory.
+        """
+        return os.path.isfile(os.path.join(self.root, name))
+
+    @tag(Tags.TASK)
+    def test_quarantine(self):
+        """Ensure that unreferenced files are moved into the quarantine directory, and that referenced files are kept.
+        """
+        self.assertEqual(2, collect_orphaned_media())
+        self.assertTrue(all(self.exists(name) for name in self.referenced))
+        self.assertFalse(any(self.exists(name) for name in self.orphans))
+
+        quarantined = [
+            os.path.relpath(os.path.join(path, file), self.root)
+            for path, _, files in os.walk(os.path.join(self.root, QUARANTINE_DIRECTORY)) for file in files
+        ]
+        self.assertEqual(2, len(quarantined))
+        self.assertEqual(0, collect_orphaned_media())
+
+    @tag(Tags.TASK)
+    def test_delete(self):
+        """Ensure that unreferenced files are deleted when the collection action is `delete`.
+        """
+        with override_settings(MEDIA_GC_ACTION='delete'):
+            self.assertEqual(2, collect_orphaned_media())
+        self.assertFalse(os.path.isdir(os.path.join(self.root, QUARANTINE_DIRECTORY)))
+        self.assertFalse(any(self.exists(name) for name in self.orphans))
+
+    @tag(Tags.TASK)
+    def test_project_references(self):
+        """Ensure that the image and derivatives of a project are kept, since the derivatives of a model with a column
+        which has the same name as the alias of its derivatives in the query (i.e., `image`) must still be found.
+        """
+        project = Project.objects.create(
+            name='Project', authors=['Author'], description='Description.', status=Project.ProjectStatus.PLANNED,
+            image=SimpleUploadedFile('image.png', b'image')
+        )
+        derivative = 'projects/derivatives/new-160w.webp'
+        os.makedirs(os.path.dirname(os.path.join(self.root, derivative)), exist_ok=True)
+        with open(os.path.join(self.root, derivative), 'wb') as file:
+            file.write(b'image')
+        Project.objects.filter(pk=project.pk).update(image_derivatives={
+            'source': project.image.name,
+            'images': [{'name': derivative, 'format': 'webp', 'width': 160, 'height': 80, 'size': 5}],
+        })
+
+        self.assertEqual(2, collect_orphaned_media())
+        self.assertTrue(self.exists(project.image.name))
+        self.assertTrue(self.exists(derivative))
+
+    @tag(Tags.TASK)
+    def test_min_age(self):
+        """Ensure that recently modified files are not collected, since they may still be being uploaded.
+        """
+        with override_settings(MEDIA_GC_MIN_AGE=3600):
+            self.assertEqual(0, collect_orphaned_media())
+        self.assertTrue(all(self.exists(name) for name in self.orphans))
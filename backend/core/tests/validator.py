@@ -4,6 +4,7 @@ from django.test import tag
 from jsonschema.exceptions import SchemaError
 
 from core.testcases import VerboseTestCase, Tags
+from core.normalization import normalize_contact, normalize_phone
 from core.validators import JSONSchemaValidator, validate_phone
 
 
@@ -84,3 +85,28 @@ class TestPhoneValidator(VerboseTestCase):
         """Ensure that a ValidationError is raised when validating an invalid phone number with too few digits.
         """
         self.assertRaises(ValidationError, validate_phone, '(123)-456-789')
+
+
+class TestNormalization(VerboseTestCase):
+    """A test case class which contains unit tests for the normalization of contact information.
+    """
+    message = 'Testing contact information normalization...'
+
+    @tag(Tags.VALIDATION)
+    def test_normalize_phone(self):
+        """Ensure that valid phone numbers are converted into E.164 format, and that invalid phone numbers are not.
+        """
+        self.assertEqual('+11234567890', normalize_phone('123-456-7890'))
+        self.assertEqual('+11234567890', normalize_phone('+1 (123)-456-7890'))
+        self.assertIsNone(normalize_phone('1 (123)-456-7890'))
+        self.assertIsNone(normalize_phone('(123)-456-789'))
+
+    @tag(Tags.VALIDATION)
+    def test_normalize_contact(self):
+        """Ensure that email addresses and other values are stripped and lowercased, and that invalid phone numbers are
+        normalized in the same way.
+        """
+        self.assertEqual('name@email.com', normalize_contact('EM', '  Name@Email.COM\n'))
+        self.assertEqual('discord#1234', normalize_contact('OT', 'Discord#1234 '))
+        self.assertEqual('+11234567890', normalize_contact('PH', '(123) 456 7890'))
+        self.assertEqual('123-456', normalize_contact('PH', ' 123-456'))
@@ -6,6 +6,8 @@ from django.utils.translation import gettext_lazy as _
 from jsonschema import validate, draft7_format_checker
 from jsonschema.exceptions import ValidationError as JSONSchemaValidationError
 
+from core.normalization import normalize_phone
+
 
 class JSONSchemaValidator(BaseValidator):
     """A generic validator for JSONFields which are required to follow a pre-defined JSON schema.
@@ -55,16 +57,6 @@ def validate_phone(value):
     Args:
         value: The value to check for being a valid phone number.
     """
-    v = value
-
-    # Skip the U.S. country code when counting the number of digits in the value.
-    country_code = v.find('+1')
-    if country_code != -1:
-        v = v[country_code + 2:]
-
-    # Create a string with only the digits in the value (excluding the U.S. country code).
-    v = ''.join([c for c in v if c.isdigit()])
-
-    # If there are not exactly ten digits, then the phone number is invalid
-    if len(v) != 10:
-        raise DjangoValidationError(_('%(value)s is not a valid phone number'), params={'value': v})
+    # If there are not exactly ten digits (excluding the U.S. country code), then the phone number is invalid.
+    if normalize_phone(value) is None:
+        raise DjangoValidationError(_('%(value)s is not a valid phone number'), params={'value': value})
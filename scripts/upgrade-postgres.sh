@@ -0,0 +1,77 @@
+#!/usr/bin/env bash
+#
+# Upgrades the database volume of a Docker Compose deployment from PostgreSQL 10 to the version in its Compose file.
+#
+# PostgreSQL will not start on a data directory which was created by an older major version, so the data is dumped by a
+# temporary PostgreSQL 10 container, the old volume is copied to a backup volume and emptied, and the dump is restored
+# into the new server. The dump is also kept on the host. Finally, the announcements table, which cannot be partitioned
+# on PostgreSQL 10, is partitioned.
+#
+# Usage: scripts/upgrade-postgres.sh [compose file, relative to the repository root (defaults to docker-compose.yml)]
+
+set -o errexit
+set -o pipefail
+set -o nounset
+
+cd "$(dirname "$0")/.."
+COMPOSE_FILE="${1:-docker-compose.yml}"
+OLD_IMAGE='postgres:10-alpine'
+DATA_DIR='/var/lib/postgresql/data'
+TEMP_CONTAINER='postgres-upgrade'
+
+compose() {
+  docker compose -f "$COMPOSE_FILE" "$@"
+}
+
+wait_for() {
+  # The new server's first start initializes the database with a server which only listens on a Unix socket, so it is
+  # only ready once it accepts TCP connections.
+  until "$@" pg_isready --quiet --host=localhost; do
+    >&2 echo "Postgres is unavailable - sleeping"
+    sleep 1
+  done
+}
+
+container="$(compose ps --all --quiet postgres)"
+if [ -z "$container" ]; then
+  >&2 echo "There is no postgres container for $COMPOSE_FILE, so there is no data to upgrade."
+  exit 1
+fi
+
+mounts="{{range .Mounts}}{{if eq .Destination \"$DATA_DIR\"}}{{.Name}}{{end}}{{end}}"
+volume="$(docker inspect --format "$mounts" "$container")"
+old_version="$(docker run --rm -v "$volume:/data:ro" alpine cat /data/PG_VERSION)"
+if [ "$old_version" != '10' ]; then
+  >&2 echo "The $volume volume contains PostgreSQL $old_version data, not PostgreSQL 10 data, so it was not upgraded."
+  exit 1
+fi
+
+backup="postgres-10-$(date +%Y%m%d%H%M%S).sql"
+echo -e "\e[95mStopping the containers...\e[39m"
+compose stop
+
+echo -e "\e[95mDumping the PostgreSQL 10 data to $backup...\e[39m"
+docker run --detach --name "$TEMP_CONTAINER" --env-file .env -v "$volume:$DATA_DIR" "$OLD_IMAGE" >/dev/null
+trap 'docker rm --force "$TEMP_CONTAINER" >/dev/null 2>&1 || true' EXIT
+wait_for docker exec "$TEMP_CONTAINER"
+docker exec "$TEMP_CONTAINER" sh -c 'pg_dumpall --clean --if-exists -U "$POSTGRES_USER"' > "$backup"
+docker rm --force "$TEMP_CONTAINER" >/dev/null
+
+echo -e "\e[95mCopying the $volume volume to ${volume}_pg10 and emptying it...\e[39m"
+docker volume create "${volume}_pg10" >/dev/null
+docker run --rm -v "$volume:/from" -v "${volume}_pg10:/to" alpine \
+  sh -c 'cp -a /from/. /to/ && find /from -mindepth 1 -delete'
+
+echo -e "\e[95mRestoring $backup into the new PostgreSQL server...\e[39m"
+compose up --detach postgres
+wait_for compose exec -T postgres
+compose exec -T postgres sh -c 'psql --quiet -U "$POSTGRES_USER" -d postgres' < "$backup"
+
+# PostgreSQL 10 does not support partitioning the announcements table, so its migration left the table unpartitioned.
+echo -e "\e[95mPartitioning the announcements table...\e[39m"
+compose run --rm backend python manage.py migrate
+compose run --rm backend python manage.py partition_announcements
+
+echo -e "\e[95mStarting the containers...\e[39m"
+compose up --detach
+echo -e "\e[95mDone. Once the site has been checked, ${volume}_pg10 and $backup can be deleted.\e[39m"